@@ -1,7 +1,7 @@
-from .processor import bleach_wysiwyg_content, post_process_html
+from .processor import bleach_wysiwyg_content, post_process_html, uses_nonce
 
 __version__ = "0.1.0"
 
-__all__ = ["bleach_wysiwyg_content", "post_process_html"]
+__all__ = ["bleach_wysiwyg_content", "post_process_html", "uses_nonce"]
 
 default_app_config = "csp_post_processor.apps.CSPPostProcessConfig"
@@ -1,7 +1,11 @@
 import hashlib
 import logging
+import uuid
+from functools import lru_cache
+from typing import NamedTuple
 
 from django.http import HttpRequest
+from django.utils.html import escape
 from django.utils.safestring import SafeString, mark_safe
 
 import bleach
@@ -109,6 +113,25 @@ def get_html_id(node):
     return str(id(node))  # CPython: memory address, so should be unique enough
 
 
+# Placeholders for the nonce in the cached, sanitized markup. They are random so that
+# they can't be (accidentally) part of the content itself.
+_NONCE_PLACEHOLDER = f"nonce{uuid.uuid4().hex}"
+_HASHED_NONCE_PLACEHOLDER = f"hashednonce{uuid.uuid4().hex}"
+
+SANITIZE_CACHE_SIZE = 256
+
+
+class SanitizedHTML(NamedTuple):
+    content: str
+    """
+    The sanitized content, with placeholders for the nonce.
+    """
+    is_markup: bool
+    """
+    Whether the content contains elements, or is just text.
+    """
+
+
 def post_process_html(
     html: str | SafeStringWrapper, request: HttpRequest | Request
 ) -> str:
@@ -123,6 +146,9 @@ def post_process_html(
 
     If an HTML id is generated, we prefix it with the nonce value to prevent collisions
     with possible other IDs.
+
+    Only the nonce differs between requests, so the (expensive) parsing and sanitizing
+    is cached per content, after which the nonce is filled in.
     """
     if getattr(html, "_csp_post_processed", False):
         return html
@@ -131,6 +157,45 @@ def post_process_html(
         logger.info("No nonce available on the request, returning html unmodified.")
         return html
 
+    sanitized = sanitize_html(str(html))
+    if not sanitized.is_markup:
+        return sanitized.content
+
+    # csp_nonce is b64 encoded and can contain chars that are not allowed for
+    # HTML IDs -> md5 hash it
+    hashed_nonce = hashlib.md5(csp_nonce.encode("ascii")).hexdigest()
+    # the nonce comes from a request header and ends up in an attribute value
+    modified_html = sanitized.content.replace(
+        _HASHED_NONCE_PLACEHOLDER, hashed_nonce
+    ).replace(_NONCE_PLACEHOLDER, escape(csp_nonce))
+
+    result = SafeStringWrapper(mark_safe(modified_html))
+
+    # mark result as processed to avoid multiple calls
+    result._csp_post_processed = True  # type: ignore
+
+    return result
+
+
+def uses_nonce(html: str) -> bool:
+    """
+    Indicate if :func:`post_process_html` inserts the CSP nonce into the content.
+
+    This is only the case for markup with inline styles - for other content, the
+    post-processed result is the same for every nonce.
+    """
+    sanitized = sanitize_html(str(html))
+    return sanitized.is_markup and (
+        _NONCE_PLACEHOLDER in sanitized.content
+        or _HASHED_NONCE_PLACEHOLDER in sanitized.content
+    )
+
+
+@lru_cache(maxsize=SANITIZE_CACHE_SIZE)
+def sanitize_html(html: str) -> SanitizedHTML:
+    """
+    Extract the inline styles and sanitize the HTML, independent of the nonce.
+    """
     lxml_etree_document = html5lib.parse(
         html,
         treebuilder="lxml",
@@ -160,10 +225,7 @@ def post_process_html(
         # generate an ID if we don't have one
         if not (html_id := node.attrib.get("id")):
             html_id = get_html_id(node)
-            # csp_nonce is b64 encoded and can contain chars that are not allowed for
-            # HTML IDs -> md5 hash it
-            hashed_nonce = hashlib.md5(csp_nonce.encode("ascii")).hexdigest()
-            html_id = f"nonce-{hashed_nonce}-{html_id}"
+            html_id = f"nonce-{_HASHED_NONCE_PLACEHOLDER}-{html_id}"
             # set the generated ID which is referenced in the inline styles
             node.attrib["id"] = html_id
 
@@ -173,7 +235,7 @@ def post_process_html(
     # did we extract style we want to keep?
     if inline_styles:
         style_element = etree.Element("style")
-        style_element.attrib["nonce"] = csp_nonce
+        style_element.attrib["nonce"] = _NONCE_PLACEHOLDER
 
         # build the CSS from the inline styles
         all_styles = ""
@@ -195,7 +257,7 @@ def post_process_html(
     body = root.find("body")  # parsers wrap snippet in <html><body>...</body></html>
     parts = body.getchildren()
     if not parts:  # no nested HTML/elements
-        return body.text or ""
+        return SanitizedHTML(content=body.text or "", is_markup=False)
 
     modified_html = "".join(
         [
@@ -206,12 +268,7 @@ def post_process_html(
     # run bleach on non-style part
     modified_html = bleach_wysiwyg_content(modified_html)
 
-    result = SafeStringWrapper(mark_safe(f"{style_markup}{modified_html}"))
-
-    # mark result as processed to avoid multiple calls
-    result._csp_post_processed = True  # type: ignore
-
-    return result
+    return SanitizedHTML(content=f"{style_markup}{modified_html}", is_markup=True)
 
 
 def bleach_wysiwyg_content(html):
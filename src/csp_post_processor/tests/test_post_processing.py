@@ -3,7 +3,8 @@ from unittest.mock import patch
 
 from django.test import RequestFactory, SimpleTestCase
 
-from csp_post_processor import post_process_html
+from csp_post_processor import bleach_wysiwyg_content, post_process_html, uses_nonce
+from csp_post_processor.processor import sanitize_html
 
 
 def get_counter_side_effect(start=1):
@@ -19,6 +20,10 @@ class PostProcessingTests(SimpleTestCase):
         self.factory = factory
         self.request = factory.get("/irrelevant", HTTP_X_CSP_NONCE="dGVzdA==")
 
+        # the sanitized markup contains the (mocked) generated IDs
+        sanitize_html.cache_clear()
+        self.addCleanup(sanitize_html.cache_clear)
+
     @patch("csp_post_processor.processor.get_html_id", return_value="1234")
     def test_move_inline_styles_to_nonced_style_tag(self, mock_get_html_id):
         html = """
@@ -217,3 +222,66 @@ class PostProcessingTests(SimpleTestCase):
 
             converted = post_process_html(html, self.request)
             self.assertHTMLEqual(converted, expected)
+
+    @patch("csp_post_processor.processor.get_html_id", return_value="1234")
+    def test_sanitized_markup_is_reused_for_other_nonces(self, mock_get_html_id):
+        html = '<p>Some <span style="color: red;">styled</span> content.</p>'
+        other_request = self.factory.get("/irrelevant", HTTP_X_CSP_NONCE="b3RoZXI=")
+
+        with patch(
+            "csp_post_processor.processor.bleach_wysiwyg_content",
+            wraps=bleach_wysiwyg_content,
+        ) as mock_bleach:
+            converted = post_process_html(html, self.request)
+            other_converted = post_process_html(html, other_request)
+
+        mock_bleach.assert_called_once()
+        self.assertHTMLEqual(
+            converted,
+            """
+            <style nonce="dGVzdA==">
+                #nonce-5fa62ae6176f3746142503a6ebe96cb3-1234 {
+                    color: red;
+                }
+            </style>
+            <p>Some <span id="nonce-5fa62ae6176f3746142503a6ebe96cb3-1234">styled</span> content.</p>
+            """,
+        )
+        self.assertHTMLEqual(
+            other_converted,
+            """
+            <style nonce="b3RoZXI=">
+                #nonce-e395cb5baaaed62792afc82194e01637-1234 {
+                    color: red;
+                }
+            </style>
+            <p>Some <span id="nonce-e395cb5baaaed62792afc82194e01637-1234">styled</span> content.</p>
+            """,
+        )
+
+    def test_nonce_is_escaped(self):
+        html = '<p>Some <span style="color: red;">styled</span> content.</p>'
+        request = self.factory.get(
+            "/irrelevant",
+            HTTP_X_CSP_NONCE='abc"></style><img src=x onerror=alert(1)>',
+        )
+
+        converted = post_process_html(html, request)
+
+        self.assertNotIn("<img", converted)
+        self.assertIn(
+            'nonce="abc&quot;&gt;&lt;/style&gt;&lt;img src=x onerror=alert(1)&gt;"',
+            converted,
+        )
+
+    def test_uses_nonce(self):
+        with self.subTest("inline styles"):
+            self.assertTrue(
+                uses_nonce('<p>Some <span style="color: red;">styled</span> text.</p>')
+            )
+
+        with self.subTest("markup without styles"):
+            self.assertFalse(uses_nonce("<p>Some <b>bold</b> text.</p>"))
+
+        with self.subTest("plain text"):
+            self.assertFalse(uses_nonce("Some text."))
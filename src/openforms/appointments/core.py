@@ -11,6 +11,7 @@ from django.utils.translation import gettext_lazy as _
 
 import elasticapm
 
+from openforms.instrumentation import span
 from openforms.logging import logevent
 from openforms.submissions.models import Submission
 
@@ -52,13 +53,14 @@ def book(appointment: Appointment, remarks: str = "") -> str:
     customer = CustomerDetails(details=normalized_data)
 
     logevent.appointment_register_start(appointment.submission, plugin)
-    appointment_id = plugin.create_appointment(
-        products,
-        location,
-        appointment.datetime,
-        customer,
-        remarks=remarks,
-    )
+    with span("appointment.create_appointment", plugin=plugin.identifier):
+        appointment_id = plugin.create_appointment(
+            products,
+            location,
+            appointment.datetime,
+            customer,
+            remarks=remarks,
+        )
     appointment_info = AppointmentInfo.objects.create(
         status=AppointmentDetailsStatus.success,
         appointment_id=appointment_id,
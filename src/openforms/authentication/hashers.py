@@ -0,0 +1,35 @@
+"""
+Hashing of identifying attributes.
+
+Identifying attributes (like a BSN) are hashed with the hashers from
+:mod:`django.contrib.auth.hashers`, so that values can still be compared with
+:func:`django.contrib.auth.hashers.check_password` while they are not available in
+plain text. Unlike passwords, these values are not chosen by the user. The hasher and
+its work factor can be configured separately through the
+``IDENTIFYING_ATTRIBUTES_HASHER`` and ``IDENTIFYING_ATTRIBUTES_HASH_ITERATIONS``
+settings.
+"""
+
+from copy import copy
+
+from django.conf import settings
+from django.contrib.auth.hashers import BasePasswordHasher, get_hasher
+
+__all__ = ["get_salted_hash"]
+
+
+def get_identifying_attributes_hasher() -> BasePasswordHasher:
+    hasher = get_hasher(settings.IDENTIFYING_ATTRIBUTES_HASHER)
+    if (iterations := settings.IDENTIFYING_ATTRIBUTES_HASH_ITERATIONS) and hasattr(
+        hasher, "iterations"
+    ):
+        # the number of iterations is part of the encoded hash, so the hashes can be
+        # verified by the regular hasher
+        hasher = copy(hasher)
+        hasher.iterations = iterations
+    return hasher
+
+
+def get_salted_hash(value: str) -> str:
+    hasher = get_identifying_attributes_hasher()
+    return hasher.encode(value, hasher.salt())
@@ -1,7 +1,6 @@
 import logging
 from collections.abc import Collection
 
-from django.contrib.auth.hashers import make_password as get_salted_hash
 from django.db import models
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
@@ -14,6 +13,7 @@ from .constants import (
     AuthAttribute,
     LegalSubjectIdentifierType,
 )
+from .hashers import get_salted_hash
 from .tasks import hash_identifying_attributes as hash_identifying_attributes_task
 from .types import (
     DigiDContext,
@@ -71,12 +71,19 @@ class BaseAuthInfo(models.Model):
         to leak.
 
         We use :mod:`django.contrib.auth.hashers` for the actual salting and hashing,
-        relying on the global Django ``PASSWORD_HASHERS`` setting.
+        see :mod:`openforms.authentication.hashers`.
         """
         if delay:
             hash_identifying_attributes_task.delay(self.pk)
             return
 
+        self.set_hashed_identifying_attributes()
+        self.save()
+
+    def set_hashed_identifying_attributes(self) -> None:
+        """
+        Replace the identifying attributes with their hashes, without saving.
+        """
         for field_name in self.identifying_attributes:
             field = self._meta.get_field(field_name)
             assert isinstance(field, models.CharField)
@@ -89,7 +96,6 @@ class BaseAuthInfo(models.Model):
             setattr(self, field_name, hashed_value)
 
         self.attribute_hashed = True
-        self.save()
 
     def clean(self):
         if self.attribute == AuthAttribute.bsn and not self.attribute_hashed:
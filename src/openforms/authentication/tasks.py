@@ -1,9 +1,17 @@
+import logging
+import time
 from io import StringIO
 
+from django.conf import settings
 from django.core.management import call_command
+from django.db import transaction
+
+from celery_once import QueueOnce
 
 from openforms.celery import app
 
+logger = logging.getLogger(__name__)
+
 
 @app.task(ignore_result=True)
 def hash_identifying_attributes(auth_info_id: int):
@@ -13,6 +21,69 @@ def hash_identifying_attributes(auth_info_id: int):
     auth_info.hash_identifying_attributes()
 
 
+def _hash_pending(model, batch_size: int) -> int:
+    """
+    Hash the identifying attributes of one batch of completed, registered submissions.
+
+    :returns: the number of hashed records.
+    """
+    from openforms.submissions.constants import RegistrationStatuses
+
+    with transaction.atomic():
+        records = list(
+            # only lock the records themselves - the joined submissions are locked by
+            # other tasks (e.g. the confirmation emails) that must not be blocked
+            model.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(
+                attribute_hashed=False,
+                # the identifying attributes are used in the registration backends, so
+                # they can only be hashed once the registration succeeded (#1395)
+                submission__completed_on__isnull=False,
+                submission__registration_status=RegistrationStatuses.success,
+            )
+            .order_by("pk")[:batch_size]
+        )
+        for record in records:
+            record.set_hashed_identifying_attributes()
+        model.objects.bulk_update(
+            records, fields=[*model.identifying_attributes, "attribute_hashed"]
+        )
+    return len(records)
+
+
+@app.task(base=QueueOnce, ignore_result=True, once={"graceful": True})
+def hash_pending_identifying_attributes() -> None:
+    """
+    Hash the identifying attributes of all submissions that were registered.
+
+    The hashing is deliberately slow, so it is done in batches in a separate task
+    (that can be routed to its own queue) rather than right after each submission.
+    The task stops once its time budget is used up, the next (periodic) run picks up
+    the remaining records.
+    """
+    from .models import AuthInfo, RegistratorInfo
+
+    batch_size = settings.IDENTIFYING_ATTRIBUTES_HASH_BATCH_SIZE
+    deadline = time.monotonic() + settings.IDENTIFYING_ATTRIBUTES_HASH_TIME_BUDGET
+    for model in (AuthInfo, RegistratorInfo):
+        start = time.monotonic()
+        num_hashed = 0
+        while time.monotonic() < deadline and (
+            num_batch := _hash_pending(model, batch_size)
+        ):
+            num_hashed += num_batch
+        if not num_hashed:
+            continue
+        duration = time.monotonic() - start
+        logger.info(
+            "Hashed the identifying attributes of %d %s records in %.2fs (%.1f/s)",
+            num_hashed,
+            model._meta.model_name,
+            duration,
+            num_hashed / duration if duration else num_hashed,
+        )
+
+
 @app.task(ignore_result=True)
 def update_saml_metadata() -> None:
     """
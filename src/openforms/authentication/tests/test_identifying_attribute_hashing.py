@@ -1,10 +1,11 @@
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.contrib.auth.hashers import check_password
+from django.test import TestCase, override_settings
 
 from ..constants import ActingSubjectIdentifierType, LegalSubjectIdentifierType
-from ..tasks import hash_identifying_attributes
-from .factories import AuthInfoFactory
+from ..tasks import hash_identifying_attributes, hash_pending_identifying_attributes
+from .factories import AuthInfoFactory, RegistratorInfoFactory
 
 
 class HashIdentifyingAttributesTaskTests(TestCase):
@@ -74,3 +75,61 @@ class HashIdentifyingAttributesTests(TestCase):
 
         assert auth_info.value
         self.assertNotEqual(auth_info.value, "123456789")
+
+    @override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.PBKDF2PasswordHasher"],
+        IDENTIFYING_ATTRIBUTES_HASH_ITERATIONS=1000,
+    )
+    def test_configured_number_of_iterations(self):
+        auth_info = AuthInfoFactory.create(value="123456789")
+
+        auth_info.hash_identifying_attributes()
+
+        algorithm, iterations, *_ = auth_info.value.split("$")
+        self.assertEqual(algorithm, "pbkdf2_sha256")
+        self.assertEqual(iterations, "1000")
+        # the regular hasher can verify the hash
+        self.assertTrue(check_password("123456789", auth_info.value))
+
+
+@override_settings(IDENTIFYING_ATTRIBUTES_HASH_BATCH_SIZE=2)
+class HashPendingIdentifyingAttributesTaskTests(TestCase):
+    def test_only_registered_submissions_are_hashed(self):
+        registered = AuthInfoFactory.create_batch(
+            3,
+            submission__completed=True,
+            submission__registration_success=True,
+        )
+        failed = AuthInfoFactory.create(
+            submission__completed=True, submission__registration_failed=True
+        )
+        in_progress = AuthInfoFactory.create()
+        registrator = RegistratorInfoFactory.create(
+            submission__completed=True, submission__registration_success=True
+        )
+
+        hash_pending_identifying_attributes()
+
+        for auth_info in registered:
+            auth_info.refresh_from_db()
+            with self.subTest(auth_info=auth_info.pk):
+                self.assertTrue(auth_info.attribute_hashed)
+                self.assertTrue(check_password("123456782", auth_info.value))
+        for auth_info in (failed, in_progress):
+            auth_info.refresh_from_db()
+            with self.subTest(auth_info=auth_info.pk):
+                self.assertFalse(auth_info.attribute_hashed)
+                self.assertEqual(auth_info.value, "123456782")
+        registrator.refresh_from_db()
+        self.assertTrue(registrator.attribute_hashed)
+
+    @override_settings(IDENTIFYING_ATTRIBUTES_HASH_TIME_BUDGET=0)
+    def test_hashing_stops_after_the_time_budget(self):
+        auth_info = AuthInfoFactory.create(
+            submission__completed=True, submission__registration_success=True
+        )
+
+        hash_pending_identifying_attributes()
+
+        auth_info.refresh_from_db()
+        self.assertFalse(auth_info.attribute_hashed)
@@ -13,7 +13,7 @@ from log_outgoing_requests.formatters import HttpFormatter
 
 from csp_post_processor.constants import NONCE_HTTP_HEADER
 
-from .utils import Filesize, config, get_sentry_integrations
+from .utils import Filesize, Mapping, config, get_sentry_integrations
 
 # Build paths inside the project, so further paths can be defined relative to
 # the code root.
@@ -206,6 +206,7 @@ INSTALLED_APPS = [
     "openforms.ui",
     "openforms.submissions",
     "openforms.logging.apps.LoggingAppConfig",
+    "openforms.instrumentation",
     "openforms.contrib.brk",
     "openforms.contrib.digid_eherkenning",
     "openforms.contrib.haal_centraal",
@@ -254,6 +255,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # first, so that the other middleware is measured too
+    "openforms.instrumentation.middleware.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
@@ -493,6 +496,24 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# Hashing of identifying attributes (like BSN) of submissions. The hasher is one of the
+# algorithms from the PASSWORD_HASHERS, "default" uses the first one. The number of
+# iterations of the (PBKDF2) hasher can be lowered from the password default, 0 keeps
+# the default of the hasher.
+IDENTIFYING_ATTRIBUTES_HASHER = config(
+    "IDENTIFYING_ATTRIBUTES_HASHER", default="default"
+)
+IDENTIFYING_ATTRIBUTES_HASH_ITERATIONS = config(
+    "IDENTIFYING_ATTRIBUTES_HASH_ITERATIONS", default=0
+)
+IDENTIFYING_ATTRIBUTES_HASH_BATCH_SIZE = config(
+    "IDENTIFYING_ATTRIBUTES_HASH_BATCH_SIZE", default=100
+)
+# Number of seconds a single run of the periodic hashing task may spend on hashing
+IDENTIFYING_ATTRIBUTES_HASH_TIME_BUDGET = config(
+    "IDENTIFYING_ATTRIBUTES_HASH_TIME_BUDGET", default=4 * 60
+)
+
 # Allow logging in with both username+password and email+password
 AUTHENTICATION_BACKENDS = [
     # Put the fake backend first, as it (on success) only puts information in the session
@@ -595,6 +616,16 @@ SUBMISSION_REPORT_URL_TOKEN_TIMEOUT_DAYS = config(
 TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS = config(
     "TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS", default=2
 )
+# The unclaimed temporary uploads are deleted in chunks of this size. Once a cleanup
+# run exceeds the time budget (in seconds), the remainder is handled by a new task.
+TEMPORARY_UPLOADS_CLEANUP_BATCH_SIZE = config(
+    "TEMPORARY_UPLOADS_CLEANUP_BATCH_SIZE", default=500
+)
+TEMPORARY_UPLOADS_CLEANUP_TIME_BUDGET = config(
+    "TEMPORARY_UPLOADS_CLEANUP_TIME_BUDGET", default=4 * 60
+)
+# Maximum number of orphaned upload files that are deleted from the storage concurrently
+FILE_DELETION_WORKERS = config("FILE_DELETION_WORKERS", default=8)
 
 # Zip files for file exports: after how long should they be deleted
 FORMS_EXPORT_REMOVED_AFTER_DAYS = config("FORMS_EXPORT_REMOVED_AFTER_DAYS", default=7)
@@ -615,6 +646,18 @@ if SUBPATH:
         STATIC_URL = f"{SUBPATH}{STATIC_URL}"
         MEDIA_URL = f"{SUBPATH}{MEDIA_URL}"
 
+#
+# ZGW APIs
+#
+
+# Number of seconds that cached Catalogi API responses are considered fresh. Set to 0
+# to disable the cache.
+ZGW_CATALOGI_CACHE_TIMEOUT = config("ZGW_CATALOGI_CACHE_TIMEOUT", default=5 * 60)
+# Number of seconds that stale Catalogi API responses are kept for ETag revalidation.
+ZGW_CATALOGI_CACHE_STALE_TIMEOUT = config(
+    "ZGW_CATALOGI_CACHE_STALE_TIMEOUT", default=24 * 60 * 60
+)
+
 #
 # Objects API
 #
@@ -625,6 +668,17 @@ MAX_UNTRUSTED_JSON_PARSE_SIZE = config(
 )  # 1mb in bytes
 # Perform HTML escaping on user's data-input
 ESCAPE_REGISTRATION_OUTPUT = config("ESCAPE_REGISTRATION_OUTPUT", default=False)
+# Maximum number of concurrent document uploads to the Documents API for a single
+# registration
+OBJECTS_API_DOCUMENT_UPLOAD_WORKERS = config(
+    "OBJECTS_API_DOCUMENT_UPLOAD_WORKERS", default=4
+)
+# Maximum number of concurrent attachment uploads to OneDrive/SharePoint for a single
+# registration
+MS_GRAPH_UPLOAD_WORKERS = config("MS_GRAPH_UPLOAD_WORKERS", default=4)
+# Number of seconds the resolved Microsoft Graph drive and root folder are reused. Set
+# to 0 to disable the cache.
+MS_GRAPH_DRIVE_CACHE_TIMEOUT = config("MS_GRAPH_DRIVE_CACHE_TIMEOUT", default=5 * 60)
 
 # TODO: convert to feature flags so that newly deployed instances get the new behaviour
 # while staying backwards compatible for existing instances
@@ -763,6 +817,14 @@ CELERY_BEAT_SCHEDULE = {
         "task": "openforms.forms.tasks.deactivate_forms",
         "schedule": crontab(minute="*"),
     },
+    "rollup-form-statistics": {
+        "task": "openforms.forms.tasks.rollup_form_statistics",
+        "schedule": crontab(minute="*"),
+    },
+    "hash-identifying-attributes": {
+        "task": "openforms.authentication.tasks.hash_pending_identifying_attributes",
+        "schedule": crontab(minute="*"),
+    },
     "cleanup-outgoing-request-logs": {
         "task": "log_outgoing_requests.tasks.prune_logs",
         "schedule": crontab(hour=0, minute=0, day_of_week="*"),
@@ -784,6 +846,95 @@ CELERY_BEAT_SCHEDULE = {
 RETRY_SUBMISSIONS_TIME_LIMIT = config(
     "RETRY_SUBMISSIONS_TIME_LIMIT", default=48  # hours
 )
+# When set, submissions to retry are processed in batches of this size, sharing the
+# registration plugin resources (API clients, lookups) within a batch. The default of
+# 0 schedules a separate task chain for every submission.
+RETRY_SUBMISSIONS_BATCH_SIZE = config("RETRY_SUBMISSIONS_BATCH_SIZE", default=0)
+
+# Spread the automatic retries evenly over this period (in seconds) instead of
+# scheduling all of them at once.
+RETRY_SUBMISSIONS_SPREAD_PERIOD = config("RETRY_SUBMISSIONS_SPREAD_PERIOD", default=0)
+
+# The processing status of completed submissions is tracked in the cache (in seconds).
+SUBMISSION_PROCESSING_STATUS_CACHE_TIMEOUT = config(
+    "SUBMISSION_PROCESSING_STATUS_CACHE_TIMEOUT", default=60 * 60 * 24
+)
+# Maximum number of seconds the status endpoint may hold a request until the
+# processing finishes (long polling). The default of 0 disables long polling.
+SUBMISSION_STATUS_LONG_POLL_TIMEOUT = config(
+    "SUBMISSION_STATUS_LONG_POLL_TIMEOUT", default=0
+)
+# The outcome of the form logic evaluation of completed submissions is cached (in
+# seconds) so that the PDF report, emails and registration do not each evaluate it.
+SUBMISSION_RENDER_CACHE_TIMEOUT = config(
+    "SUBMISSION_RENDER_CACHE_TIMEOUT", default=60 * 60
+)
+# The outcome of the logic check of submission steps is cached (in seconds), so that
+# repeated checks with identical input are not evaluated again.
+SUBMISSION_LOGIC_CHECK_CACHE_TIMEOUT = config(
+    "SUBMISSION_LOGIC_CHECK_CACHE_TIMEOUT", default=60
+)
+# The family members retrieved for a submission are cached (encrypted, in seconds), to
+# avoid repeated lookups in the BRP.
+FAMILY_MEMBERS_CACHE_TIMEOUT = config("FAMILY_MEMBERS_CACHE_TIMEOUT", default=60 * 60)
+# The public representation of forms in the API is cached (in seconds) and can be
+# revalidated by clients with conditional requests. Edits invalidate the cache.
+FORM_API_CACHE_TIMEOUT = config("FORM_API_CACHE_TIMEOUT", default=60 * 60)
+
+# Route the CPU-heavy PDF generation and the I/O-bound registration tasks to their own
+# queues, so that they can't starve the other tasks (like sending confirmation emails).
+# By default, everything ends up in the default queue.
+CELERY_TASK_DEFAULT_QUEUE = config("CELERY_TASK_DEFAULT_QUEUE", default="celery")
+CELERY_PDF_QUEUE = config("CELERY_PDF_QUEUE", default=CELERY_TASK_DEFAULT_QUEUE)
+CELERY_REGISTRATION_QUEUE = config(
+    "CELERY_REGISTRATION_QUEUE", default=CELERY_TASK_DEFAULT_QUEUE
+)
+# the (CPU-heavy, but not urgent) hashing of identifying attributes
+CELERY_HASHING_QUEUE = config("CELERY_HASHING_QUEUE", default=CELERY_TASK_DEFAULT_QUEUE)
+CELERY_TASK_ROUTES = {
+    "openforms.submissions.tasks.pdf.generate_submission_report": {
+        "queue": CELERY_PDF_QUEUE
+    },
+    "openforms.appointments.tasks.maybe_register_appointment": {
+        "queue": CELERY_REGISTRATION_QUEUE
+    },
+    "openforms.registrations.tasks.pre_registration": {
+        "queue": CELERY_REGISTRATION_QUEUE
+    },
+    "openforms.registrations.tasks.register_submission": {
+        "queue": CELERY_REGISTRATION_QUEUE
+    },
+    "openforms.submissions.tasks.retry_processing_submissions_batch": {
+        "queue": CELERY_REGISTRATION_QUEUE
+    },
+    "openforms.payments.tasks.update_submission_payment_status": {
+        "queue": CELERY_REGISTRATION_QUEUE
+    },
+    "openforms.authentication.tasks.hash_identifying_attributes": {
+        "queue": CELERY_HASHING_QUEUE
+    },
+    "openforms.authentication.tasks.hash_pending_identifying_attributes": {
+        "queue": CELERY_HASHING_QUEUE
+    },
+    "openforms.submissions.tasks.cleanup.maybe_hash_identifying_attributes": {
+        "queue": CELERY_HASHING_QUEUE
+    },
+}
+
+# Limit the number of concurrent registrations and/or the registration rate per
+# registration backend (plugin identifier), e.g.
+# REGISTRATION_BACKEND_CONCURRENCY=stuf-zds-create-zaak=2 and
+# REGISTRATION_BACKEND_RATE_LIMITS=stuf-zds-create-zaak=30/m
+REGISTRATION_BACKEND_CONCURRENCY = config(
+    "REGISTRATION_BACKEND_CONCURRENCY", default="", cast=Mapping()
+)
+REGISTRATION_BACKEND_RATE_LIMITS = config(
+    "REGISTRATION_BACKEND_RATE_LIMITS", default="", cast=Mapping()
+)
+# Number of seconds to wait before retrying a throttled registration
+REGISTRATION_THROTTLE_RETRY_DELAY = config(
+    "REGISTRATION_THROTTLE_RETRY_DELAY", default=30
+)
 
 # Only ACK when the task has been executed. This prevents tasks from getting lost, with
 # the drawback that tasks should be idempotent (if they execute partially, the mutations
@@ -854,6 +1005,14 @@ if SENTRY_DSN:
 SDK_SENTRY_DSN = config("SDK_SENTRY_DSN", "")
 SDK_SENTRY_ENVIRONMENT = config("SDK_SENTRY_ENVIRONMENT", ENVIRONMENT)
 
+#
+# Instrumentation
+#
+# The spans (duration and number of queries) of requests, form logic rules, plugins
+# and Celery tasks are passed to these exporters: "log" and/or "opentelemetry". Nothing
+# is recorded if no exporters are configured.
+INSTRUMENTATION_EXPORTERS = config("INSTRUMENTATION_EXPORTERS", split=True, default=[])
+
 #
 # Elastic APM
 #
@@ -72,6 +72,28 @@ class Filesize:
         return converter(numbers)
 
 
+class Mapping:
+    """
+    Cast a comma-separated list of ``key=value`` pairs into a dictionary.
+
+    For example: ``stuf-zds-create-zaak=2,objects_api=10``.
+    """
+
+    def __call__(self, value) -> dict[str, str]:
+        if isinstance(value, dict):
+            return value
+
+        result = {}
+        for item in Csv()(value):
+            key, sep, item_value = item.partition("=")
+            if not sep:
+                raise ValueError(
+                    f"Value '{item}' does not match the pattern 'key=value'"
+                )
+            result[key.strip()] = item_value.strip()
+        return result
+
+
 def config(option: str, default: Any = undefined, *args, **kwargs):
     """
     Pull a config parameter from the environment.
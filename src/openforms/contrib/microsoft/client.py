@@ -10,11 +10,18 @@ allow configuring any of those aspects.
 
 import json
 import os
+import threading
+import time
+from collections.abc import Sequence
 from io import BytesIO
 from pathlib import PurePosixPath
 from typing import TypedDict
 
+from django.conf import settings
+from django.db.models.fields.files import FieldFile
+
 from O365 import Account
+from zgw_consumers.concurrent import parallel
 
 from .constants import ConflictHandling
 from .exceptions import MSAuthenticationError
@@ -90,6 +97,29 @@ class MSGraphUploadHelper:
         with input_field.open("rb") as stream:
             return self.upload_stream(stream, stream_size, remote_path)
 
+    def upload_django_files(self, files: Sequence[tuple[FieldFile, PurePosixPath]]):
+        """
+        Upload the files concurrently, with at most ``MS_GRAPH_UPLOAD_WORKERS`` at the
+        same time.
+
+        The remote folders are created by the first upload into them - upload a file
+        to new folders first, otherwise the concurrent uploads race to create them.
+        """
+        if len(files) <= 1:
+            for input_field, remote_path in files:
+                self.upload_django_file(input_field, remote_path)
+            return
+
+        max_workers = min(len(files), settings.MS_GRAPH_UPLOAD_WORKERS)
+        with parallel(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.upload_django_file, input_field, remote_path)
+                for input_field, remote_path in files
+            ]
+        # surface the first error, after all uploads were attempted
+        for future in futures:
+            future.result()
+
     def upload_json(self, json_data: dict, remote_path: PurePosixPath | None):
         json_str = json.dumps(json_data)
         return self.upload_string(json_str, remote_path)
@@ -115,3 +145,54 @@ class MSGraphUploadHelper:
             stream_size=stream_size,
             conflict_handling=ConflictHandling.replace,
         )
+
+
+_upload_helpers: dict[tuple, tuple[float, MSGraphUploadHelper]] = {}
+_upload_helpers_lock = threading.Lock()
+
+
+def get_upload_helper(
+    service: MSGraphService, options: MSGraphOptions
+) -> MSGraphUploadHelper:
+    """
+    Return an upload helper for the service, reusing the resolved drive and folder.
+
+    Resolving the drive and its root folder requires API calls, so the helpers are kept
+    in memory for ``MS_GRAPH_DRIVE_CACHE_TIMEOUT`` seconds per service and drive.
+    """
+    timeout = settings.MS_GRAPH_DRIVE_CACHE_TIMEOUT
+    if not timeout:
+        return MSGraphUploadHelper(MSGraphClient(service), options)
+
+    # include the credentials, so that changes to the service are picked up
+    key = (
+        service.pk,
+        service.tenant_id,
+        service.client_id,
+        service.secret,
+        service.timeout,
+        options.get("drive_id") or "",
+    )
+    now = time.monotonic()
+    with _upload_helpers_lock:
+        expires_at, helper = _upload_helpers.get(key, (0.0, None))
+    if helper is not None and expires_at > now:
+        return helper
+
+    helper = MSGraphUploadHelper(MSGraphClient(service), options)
+    with _upload_helpers_lock:
+        # drop the expired helpers, e.g. of services with changed credentials
+        stale_keys = [
+            cached_key
+            for cached_key, (cached_expires_at, _) in _upload_helpers.items()
+            if cached_expires_at <= now
+        ]
+        for stale_key in stale_keys:
+            del _upload_helpers[stale_key]
+        _upload_helpers[key] = (now + timeout, helper)
+    return helper
+
+
+def clear_upload_helpers() -> None:
+    with _upload_helpers_lock:
+        _upload_helpers.clear()
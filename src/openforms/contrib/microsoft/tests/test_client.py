@@ -1,11 +1,20 @@
-from unittest.mock import patch
+from pathlib import PurePosixPath
+from unittest.mock import patch, sentinel
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 import requests_mock
 from O365 import Account
+from O365.drive import Drive
 
-from ..client import MSGraphClient
+from openforms.utils.tests.concurrent import mock_parallel_executor
+
+from ..client import (
+    MSGraphClient,
+    MSGraphUploadHelper,
+    clear_upload_helpers,
+    get_upload_helper,
+)
 from ..exceptions import MSAuthenticationError
 from .factories import MSGraphServiceFactory
 
@@ -29,3 +38,80 @@ class MSGraphClientTests(TestCase):
             with patch.object(Account, "is_authenticated", True):
                 client = MSGraphClient(service)
                 self.assertTrue(client.is_authenticated)
+
+
+@requests_mock.Mocker(real_http=False)
+class MSGraphUploadHelperTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_upload_helpers()
+        self.addCleanup(clear_upload_helpers)
+
+        patcher = patch.object(Account, "is_authenticated", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.options = {"folder_path": "/open-forms/", "drive_id": None}
+
+    @override_settings(MS_GRAPH_DRIVE_CACHE_TIMEOUT=60)
+    def test_drive_resolution_is_cached_per_service(self, m):
+        service = MSGraphServiceFactory.create()
+        other_service = MSGraphServiceFactory.create()
+
+        with patch.object(Drive, "get_root_folder") as get_root_folder:
+            uploader = get_upload_helper(service, self.options)
+            self.assertIs(get_upload_helper(service, self.options), uploader)
+            self.assertIsNot(get_upload_helper(other_service, self.options), uploader)
+
+        self.assertEqual(get_root_folder.call_count, 2)
+
+    @override_settings(MS_GRAPH_DRIVE_CACHE_TIMEOUT=60)
+    def test_changed_credentials_resolve_again(self, m):
+        service = MSGraphServiceFactory.create()
+
+        with patch.object(Drive, "get_root_folder") as get_root_folder:
+            uploader = get_upload_helper(service, self.options)
+            service.secret = "new-secret"
+            service.save()
+
+            self.assertIsNot(get_upload_helper(service, self.options), uploader)
+
+        self.assertEqual(get_root_folder.call_count, 2)
+
+    @override_settings(MS_GRAPH_DRIVE_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self, m):
+        service = MSGraphServiceFactory.create()
+
+        with patch.object(Drive, "get_root_folder") as get_root_folder:
+            get_upload_helper(service, self.options)
+            get_upload_helper(service, self.options)
+
+        self.assertEqual(get_root_folder.call_count, 2)
+
+    @override_settings(MS_GRAPH_UPLOAD_WORKERS=2)
+    def test_upload_django_files(self, m):
+        service = MSGraphServiceFactory.create()
+        folder = PurePosixPath("/open-forms/attachments")
+        files = [
+            (sentinel.file1, folder / "file1.txt"),
+            (sentinel.file2, folder / "file2.txt"),
+            (sentinel.file3, folder / "file3.txt"),
+        ]
+
+        with (
+            patch.object(Drive, "get_root_folder"),
+            patch.object(MSGraphUploadHelper, "upload_django_file") as upload_mock,
+            mock_parallel_executor(),
+        ):
+            uploader = get_upload_helper(service, self.options)
+            uploader.upload_django_files(files)
+
+        self.assertEqual(
+            sorted(str(call.args[1]) for call in upload_mock.call_args_list),
+            [
+                "/open-forms/attachments/file1.txt",
+                "/open-forms/attachments/file2.txt",
+                "/open-forms/attachments/file3.txt",
+            ],
+        )
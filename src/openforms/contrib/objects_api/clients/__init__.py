@@ -47,4 +47,4 @@ def get_documents_client(config: "ObjectsAPIGroupConfig") -> DocumentenClient:
 def get_catalogi_client(config: "ObjectsAPIGroupConfig") -> CatalogiClient:
     if not (service := config.catalogi_service):
         raise NoServiceConfigured("No Catalogi API service configured!")
-    return build_client(service, client_factory=CatalogiClient)
+    return build_client(service, client_factory=CatalogiClient, service_pk=service.pk)
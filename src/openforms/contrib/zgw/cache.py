@@ -0,0 +1,127 @@
+"""
+Shared cache for (read-only) Catalogi API resources.
+
+Catalogue resources like case types, role types, status types, properties and
+document types rarely change, yet they are looked up on every registration and in the
+admin option endpoints. The responses of ``GET`` requests are cached (per service, URL
+and query parameters) and considered fresh for ``ZGW_CATALOGI_CACHE_TIMEOUT`` seconds. After that,
+the stale entry is kept around for ``ZGW_CATALOGI_CACHE_STALE_TIMEOUT`` seconds so that
+it can be revalidated with a conditional request if the API provided an ``ETag``.
+
+The cache is versioned - bumping the version with :func:`invalidate_catalogi_cache`
+makes all existing entries unreachable at once.
+"""
+
+import hashlib
+import time
+from typing import Callable, NotRequired, TypedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+__all__ = ["cached_get", "invalidate_catalogi_cache"]
+
+CACHE_PREFIX = "zgw:catalogi"
+VERSION_KEY = f"{CACHE_PREFIX}:version"
+
+# headers that are required to reconstruct a response
+CACHED_HEADERS = ("API-version", "Content-Type", "ETag")
+
+
+class CacheEntry(TypedDict):
+    url: str
+    content: bytes
+    headers: dict[str, str]
+    fresh_until: float
+    etag: NotRequired[str]
+
+
+def _get_version() -> int:
+    return cache.get_or_set(VERSION_KEY, 1, timeout=None)
+
+
+def invalidate_catalogi_cache() -> None:
+    """
+    Invalidate all cached Catalogi API responses.
+    """
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:  # key does not exist (yet)
+        cache.set(VERSION_KEY, 1, timeout=None)
+
+
+def get_cache_key(url: str, params: dict | None, scope: tuple = ()) -> str:
+    normalized_params = sorted((params or {}).items())
+    digest = hashlib.sha256(
+        f"{scope!r}|{url}|{normalized_params!r}".encode()
+    ).hexdigest()
+    return f"{CACHE_PREFIX}:{_get_version()}:{digest}"
+
+
+def _to_response(entry: CacheEntry) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.url = entry["url"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response._content = entry["content"]
+    response.encoding = "utf-8"
+    return response
+
+
+def _store(key: str, response: Response) -> None:
+    entry: CacheEntry = {
+        "url": response.url,
+        "content": response.content,
+        "headers": {
+            header: response.headers[header]
+            for header in CACHED_HEADERS
+            if header in response.headers
+        },
+        "fresh_until": time.time() + settings.ZGW_CATALOGI_CACHE_TIMEOUT,
+    }
+    if etag := response.headers.get("ETag"):
+        entry["etag"] = etag
+    cache.set(key, entry, timeout=settings.ZGW_CATALOGI_CACHE_STALE_TIMEOUT)
+
+
+def cached_get(
+    url: str,
+    params: dict | None,
+    headers: dict | None,
+    do_request: Callable[[dict], Response],
+    scope: tuple = (),
+) -> Response:
+    """
+    Perform a ``GET`` request through the Catalogi cache.
+
+    :arg url: the fully qualified URL that is requested.
+    :arg params: the query string parameters.
+    :arg headers: the extra request headers provided by the caller.
+    :arg do_request: callback to perform the actual request, receiving the (possibly
+      extended) request headers.
+    :arg scope: identifies the service (configuration) the request is made with, so
+      that responses are not shared between clients with different credentials.
+    """
+    key = get_cache_key(url, params, scope)
+    entry: CacheEntry | None = cache.get(key)
+    if entry is not None and entry["fresh_until"] > time.time():
+        return _to_response(entry)
+
+    request_headers = {**(headers or {})}
+    if entry is not None and (etag := entry.get("etag")):
+        request_headers["If-None-Match"] = etag
+
+    response = do_request(request_headers)
+
+    if response.status_code == 304 and entry is not None:
+        entry["fresh_until"] = time.time() + settings.ZGW_CATALOGI_CACHE_TIMEOUT
+        cache.set(key, entry, timeout=settings.ZGW_CATALOGI_CACHE_STALE_TIMEOUT)
+        return _to_response(entry)
+
+    if response.status_code == 200:
+        _store(key, response)
+    return response
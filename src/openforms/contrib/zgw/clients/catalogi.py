@@ -3,12 +3,15 @@ from functools import cached_property
 from operator import itemgetter
 from typing import Callable, Iterator, Literal, NotRequired, TypeAlias, TypedDict
 
+from django.conf import settings
+
 from flags.state import flag_enabled
 from requests import Response
 from zgw_consumers.nlx import NLXClient
 
 from openforms.utils.api_clients import PaginatedResponseData, pagination_helper
 
+from ..cache import cached_get
 from ..exceptions import StandardViolation
 
 
@@ -106,6 +109,12 @@ class InformatieObjectTypeListParams(TypedDict, total=False):
 class CatalogiClient(NLXClient):
     _api_version: CatalogiAPIVersion | None = None
 
+    def __init__(self, *args, service_pk: int | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # the cached responses are scoped to the service, since services with the same
+        # base URL can use different credentials (with different authorizations)
+        self.service_pk = service_pk
+
     @property
     def api_version(self) -> CatalogiAPIVersion:
         if self._api_version is None:
@@ -134,8 +143,24 @@ class CatalogiClient(NLXClient):
         assert enabled is not None
         return enabled
 
-    def request(self, *args, **kwargs):
-        response = super().request(*args, **kwargs)
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() == "GET" and not args and settings.ZGW_CATALOGI_CACHE_TIMEOUT:
+
+            def do_request(headers: dict) -> Response:
+                return super(CatalogiClient, self).request(
+                    method, url, **{**kwargs, "headers": headers}
+                )
+
+            response = cached_get(
+                self.to_absolute_url(url),
+                scope=(self.base_url, self.service_pk),
+                params=kwargs.get("params"),
+                headers=kwargs.get("headers"),
+                do_request=do_request,
+            )
+        else:
+            response = super().request(method, url, *args, **kwargs)
+
         if not self._api_version:
             self._api_version = self._determine_api_version(response)
         return response
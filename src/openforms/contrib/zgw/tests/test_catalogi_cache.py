@@ -0,0 +1,123 @@
+from django.test import SimpleTestCase, override_settings
+
+import requests_mock
+from freezegun import freeze_time
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..cache import invalidate_catalogi_cache
+from ..clients import CatalogiClient
+
+
+@override_settings(
+    ZGW_CATALOGI_CACHE_TIMEOUT=60,
+    ZGW_CATALOGI_CACHE_STALE_TIMEOUT=3600,
+)
+@requests_mock.Mocker()
+class CatalogiCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    def test_get_requests_are_cached(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/statustypen?zaaktype=https%3A%2F%2Fdummy%2Fzaaktypen%2F1",
+            json={"results": [{"url": "https://dummy/statustypen/1"}]},
+            headers={"API-version": "1.3.1"},
+        )
+
+        with CatalogiClient(base_url="https://dummy/") as client:
+            first = client.list_statustypen("https://dummy/zaaktypen/1")
+        with CatalogiClient(base_url="https://dummy/") as client:
+            second = client.list_statustypen("https://dummy/zaaktypen/1")
+            api_version = client.api_version
+
+        self.assertEqual(first, second)
+        self.assertEqual(api_version, (1, 3, 1))
+        self.assertEqual(len(m.request_history), 1)
+
+    def test_different_params_are_cached_separately(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/roltypen",
+            json={"results": []},
+            headers={"API-version": "1.3.1"},
+        )
+
+        with CatalogiClient(base_url="https://dummy/") as client:
+            client.list_roltypen("https://dummy/zaaktypen/1")
+            client.list_roltypen("https://dummy/zaaktypen/1", "initiator")
+            client.list_roltypen("https://dummy/zaaktypen/2")
+            client.list_roltypen("https://dummy/zaaktypen/1")
+
+        self.assertEqual(len(m.request_history), 3)
+
+    def test_services_are_cached_separately(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/statustypen",
+            json={"results": []},
+            headers={"API-version": "1.3.1"},
+        )
+
+        with CatalogiClient(base_url="https://dummy/", service_pk=1) as client:
+            client.list_statustypen("https://dummy/zaaktypen/1")
+        with CatalogiClient(base_url="https://dummy/", service_pk=2) as client:
+            client.list_statustypen("https://dummy/zaaktypen/1")
+        with CatalogiClient(base_url="https://dummy/", service_pk=1) as client:
+            client.list_statustypen("https://dummy/zaaktypen/1")
+
+        self.assertEqual(len(m.request_history), 2)
+
+    def test_stale_entry_revalidated_with_etag(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/statustypen",
+            [
+                {
+                    "json": {"results": [{"url": "https://dummy/statustypen/1"}]},
+                    "headers": {"API-version": "1.3.1", "ETag": '"abc"'},
+                },
+                {"status_code": 304, "headers": {"API-version": "1.3.1"}},
+            ],
+        )
+
+        with freeze_time("2024-10-01T12:00:00Z") as frozen_time:
+            with CatalogiClient(base_url="https://dummy/") as client:
+                client.list_statustypen("https://dummy/zaaktypen/1")
+
+            frozen_time.tick(120)
+
+            with CatalogiClient(base_url="https://dummy/") as client:
+                statustypen = client.list_statustypen("https://dummy/zaaktypen/1")
+
+        self.assertEqual(statustypen, [{"url": "https://dummy/statustypen/1"}])
+        self.assertEqual(len(m.request_history), 2)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+
+    def test_invalidate_cache(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/statustypen",
+            json={"results": []},
+            headers={"API-version": "1.3.1"},
+        )
+
+        with CatalogiClient(base_url="https://dummy/") as client:
+            client.list_statustypen("https://dummy/zaaktypen/1")
+            invalidate_catalogi_cache()
+            client.list_statustypen("https://dummy/zaaktypen/1")
+
+        self.assertEqual(len(m.request_history), 2)
+
+    @override_settings(ZGW_CATALOGI_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/statustypen",
+            json={"results": []},
+            headers={"API-version": "1.3.1"},
+        )
+
+        with CatalogiClient(base_url="https://dummy/") as client:
+            client.list_statustypen("https://dummy/zaaktypen/1")
+            client.list_statustypen("https://dummy/zaaktypen/1")
+
+        self.assertEqual(len(m.request_history), 2)
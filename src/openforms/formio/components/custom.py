@@ -33,6 +33,10 @@ from ..formatters.formio import DefaultFormatter, TextFieldFormatter
 from ..registry import BasePlugin, register
 from ..typing import AddressNLComponent, Component, DateComponent, DatetimeComponent
 from ..utils import conform_to_mask
+from .np_family_members.cache import (
+    get_family_members as get_cached_family_members,
+    set_family_members as set_cached_family_members,
+)
 from .np_family_members.constants import FamilyMembersDataAPIChoices
 from .np_family_members.haal_centraal import get_np_family_members_haal_centraal
 from .np_family_members.models import FamilyMembersTypeConfig
@@ -276,13 +280,39 @@ class NPFamilyMembers(BasePlugin):
     formatter = DefaultFormatter
 
     @staticmethod
-    def _get_handler() -> FamilyMembersHandler:
+    def _get_handler(data_api: str) -> FamilyMembersHandler:
         handlers = {
             FamilyMembersDataAPIChoices.haal_centraal: get_np_family_members_haal_centraal,
             FamilyMembersDataAPIChoices.stuf_bg: get_np_family_members_stuf_bg,
         }
-        config = FamilyMembersTypeConfig.get_solo()
-        return handlers[config.data_api]
+        return handlers[data_api]
+
+    def _get_family_members(
+        self,
+        bsn: str,
+        include_children: bool,
+        include_partners: bool,
+        submission: Submission,
+    ) -> list[tuple[str, str]]:
+        data_api = FamilyMembersTypeConfig.get_solo().data_api
+        lookup = {
+            "submission": submission,
+            "data_api": data_api,
+            "include_children": include_children,
+            "include_partners": include_partners,
+        }
+        if (family_members := get_cached_family_members(**lookup)) is not None:
+            return family_members
+
+        handler = self._get_handler(data_api)
+        family_members = handler(
+            bsn,
+            include_children=include_children,
+            include_partners=include_partners,
+            submission=submission,
+        )
+        set_cached_family_members(**lookup, family_members=family_members)
+        return family_members
 
     def mutate_config_dynamically(
         self, component: Component, submission: Submission, data: DataMapping
@@ -327,12 +357,11 @@ class NPFamilyMembers(BasePlugin):
             "value": "",
         }
         if not existing_values or existing_values[0] == empty_option:
-            handler = self._get_handler()
-            # make the API call
+            # make the API call (or use the result of an earlier call)
             # TODO: this should eventually be replaced with logic rules/variables that
             # retrieve data from an "arbitrary source", which will cause the data to
             # become available in the ``data`` argument instead.
-            child_choices = handler(
+            child_choices = self._get_family_members(
                 bsn,
                 include_children=component.get("includeChildren", True),
                 include_partners=component.get("includePartners", True),
@@ -0,0 +1,95 @@
+"""
+Per-submission cache of the retrieved family members.
+
+The dynamic configuration of the family members component is evaluated many times for
+a single submission (every step load, logic check, the completion validation and the
+renderers), while the family members of the authenticated person do not change in the
+meantime. Each lookup is a (billable) call to the BRP, so the result is cached per
+submission.
+
+Family members are personal data, so the cached value is encrypted with a key derived
+from the ``SECRET_KEY``. The entry is removed when the sensitive data of the
+submission is removed.
+"""
+
+import base64
+import hashlib
+import json
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+
+from cryptography.fernet import Fernet, InvalidToken
+
+if TYPE_CHECKING:
+    from openforms.submissions.models import Submission
+
+__all__ = ["get_family_members", "set_family_members", "clear_family_members"]
+
+CACHE_PREFIX = "formio:family-members"
+
+FamilyMembers = list[tuple[str, str]]
+
+
+def _get_fernet() -> Fernet:
+    digest = hashlib.sha256(f"{CACHE_PREFIX}:{settings.SECRET_KEY}".encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+def _get_cache_key(submission: "Submission") -> str:
+    return f"{CACHE_PREFIX}:{submission.uuid}"
+
+
+def _get_lookup_key(
+    data_api: str, include_children: bool, include_partners: bool
+) -> str:
+    return f"{data_api}:{int(include_children)}:{int(include_partners)}"
+
+
+def _load(submission: "Submission") -> dict[str, FamilyMembers]:
+    if (token := cache.get(_get_cache_key(submission))) is None:
+        return {}
+    try:
+        return json.loads(_get_fernet().decrypt(token))
+    except InvalidToken:  # e.g. the SECRET_KEY was rotated
+        return {}
+
+
+def get_family_members(
+    submission: "Submission",
+    data_api: str,
+    include_children: bool,
+    include_partners: bool,
+) -> FamilyMembers | None:
+    if not settings.FAMILY_MEMBERS_CACHE_TIMEOUT:
+        return None
+    lookups = _load(submission)
+    key = _get_lookup_key(data_api, include_children, include_partners)
+    if (family_members := lookups.get(key)) is None:
+        return None
+    return [(value, label) for value, label in family_members]
+
+
+def set_family_members(
+    submission: "Submission",
+    data_api: str,
+    include_children: bool,
+    include_partners: bool,
+    family_members: FamilyMembers,
+) -> None:
+    if not settings.FAMILY_MEMBERS_CACHE_TIMEOUT:
+        return
+    lookups = _load(submission)
+    key = _get_lookup_key(data_api, include_children, include_partners)
+    lookups[key] = family_members
+    token = _get_fernet().encrypt(json.dumps(lookups).encode())
+    cache.set(
+        _get_cache_key(submission),
+        token,
+        timeout=settings.FAMILY_MEMBERS_CACHE_TIMEOUT,
+    )
+
+
+def clear_family_members(submission: "Submission") -> None:
+    cache.delete(_get_cache_key(submission))
@@ -0,0 +1,137 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from openforms.authentication.service import AuthAttribute
+from openforms.formio.service import get_dynamic_configuration
+from openforms.logging.tests.utils import disable_timelinelog
+from openforms.submissions.tests.factories import SubmissionFactory
+from openforms.utils.tests.cache import clear_caches
+
+from ..cache import _get_cache_key, get_family_members, set_family_members
+from ..constants import FamilyMembersDataAPIChoices
+from ..models import FamilyMembersTypeConfig
+
+
+@disable_timelinelog()
+class FamilyMembersCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.submission = SubmissionFactory.from_components(
+            [
+                {
+                    "key": "npFamilyMembers",
+                    "type": "npFamilyMembers",
+                    "label": "FamilyMembers",
+                    "values": [{"label": "", "value": ""}],
+                    "includePartners": False,
+                    "includeChildren": True,
+                },
+            ],
+            auth_info__attribute=AuthAttribute.bsn,
+            auth_info__value="111222333",
+        )
+
+        patcher = patch(
+            "openforms.formio.components.custom.FamilyMembersTypeConfig.get_solo",
+            return_value=FamilyMembersTypeConfig(
+                data_api=FamilyMembersDataAPIChoices.haal_centraal
+            ),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_values(self) -> list[dict]:
+        formio_wrapper = (
+            self.submission.submissionstep_set.get().form_step.form_definition.configuration_wrapper
+        )
+        updated_config_wrapper = get_dynamic_configuration(
+            formio_wrapper,
+            request=None,
+            submission=self.submission,
+        )
+        return updated_config_wrapper["npFamilyMembers"]["values"]
+
+    @patch(
+        "openforms.formio.components.custom.get_np_family_members_haal_centraal",
+        return_value=[("222333444", "Billy Doe")],
+    )
+    def test_family_members_retrieved_once_per_submission(self, mock_get_members):
+        for _ in range(3):
+            values = self._get_values()
+
+        mock_get_members.assert_called_once()
+        self.assertEqual(values, [{"value": "222333444", "label": "Billy Doe"}])
+
+    @override_settings(FAMILY_MEMBERS_CACHE_TIMEOUT=0)
+    @patch(
+        "openforms.formio.components.custom.get_np_family_members_haal_centraal",
+        return_value=[("222333444", "Billy Doe")],
+    )
+    def test_cache_disabled(self, mock_get_members):
+        self._get_values()
+        self._get_values()
+
+        self.assertEqual(mock_get_members.call_count, 2)
+
+    def test_cached_value_is_encrypted(self):
+        set_family_members(
+            self.submission,
+            data_api=FamilyMembersDataAPIChoices.haal_centraal,
+            include_children=True,
+            include_partners=False,
+            family_members=[("222333444", "Billy Doe")],
+        )
+
+        raw_value = cache.get(_get_cache_key(self.submission))
+
+        self.assertIsInstance(raw_value, bytes)
+        self.assertNotIn(b"222333444", raw_value)
+        self.assertNotIn(b"Billy Doe", raw_value)
+
+    def test_lookups_are_cached_separately(self):
+        set_family_members(
+            self.submission,
+            data_api=FamilyMembersDataAPIChoices.haal_centraal,
+            include_children=True,
+            include_partners=False,
+            family_members=[("222333444", "Billy Doe")],
+        )
+
+        with self.subTest("same lookup"):
+            family_members = get_family_members(
+                self.submission,
+                data_api=FamilyMembersDataAPIChoices.haal_centraal,
+                include_children=True,
+                include_partners=False,
+            )
+
+            self.assertEqual(family_members, [("222333444", "Billy Doe")])
+
+        with self.subTest("other lookup"):
+            family_members = get_family_members(
+                self.submission,
+                data_api=FamilyMembersDataAPIChoices.stuf_bg,
+                include_children=True,
+                include_partners=False,
+            )
+
+            self.assertIsNone(family_members)
+
+    def test_cache_cleared_with_sensitive_data(self):
+        set_family_members(
+            self.submission,
+            data_api=FamilyMembersDataAPIChoices.haal_centraal,
+            include_children=True,
+            include_partners=False,
+            family_members=[("222333444", "Billy Doe")],
+        )
+
+        self.submission.remove_sensitive_data()
+
+        self.assertIsNone(cache.get(_get_cache_key(self.submission)))
@@ -1,9 +1,10 @@
 import re
 from collections import UserDict
 from collections.abc import Hashable
+from functools import lru_cache
 from typing import Iterator, cast
 
-from glom import PathAccessError, assign, glom
+from glom import glom
 
 from openforms.typing import DataMapping, JSONValue
 
@@ -158,20 +159,72 @@ class FormioData(UserDict):
             data[component["key"]] = ...
 
     without having to worry about potential deep assignments or leak implementation
-    details (such as using ``glom`` for this).
+    details.
+
+    Keys without a dot are looked up directly in the underlying dict, dotted keys are
+    split once (the split paths are cached) and traversed segment by segment.
     """
 
     data: dict[str, JSONValue]
 
     def __getitem__(self, key: Hashable):
-        return cast(JSONValue, glom(self.data, key))
+        if not isinstance(key, str) or "." not in key:
+            return self.data[key]
+
+        value = self.data
+        for bit in _split_path(key):
+            value = _get_child(value, bit)
+        return cast(JSONValue, value)
 
     def __setitem__(self, key: Hashable, value: JSONValue):
-        assign(self.data, key, value, missing=dict)
+        if not isinstance(key, str) or "." not in key:
+            self.data[key] = value
+            return
+
+        *parents, leaf = _split_path(key)
+        container = self.data
+        for bit in parents:
+            try:
+                container = _get_child(container, bit)
+            except KeyError:
+                # create missing intermediate containers, like lodash.set
+                child = container[bit] = {}
+                container = child
+        if isinstance(container, list):
+            container[_to_index(container, leaf)] = value
+        else:
+            container[leaf] = value
 
     def __contains__(self, key: Hashable) -> bool:
         try:
             self[key]
-        except PathAccessError:
+        except KeyError:
             return False
         return True
+
+
+@lru_cache(maxsize=4096)
+def _split_path(key: str) -> tuple[str, ...]:
+    return tuple(key.split("."))
+
+
+def _to_index(container: list, bit: str) -> int:
+    try:
+        index = int(bit)
+    except ValueError:
+        raise KeyError(bit)
+    if not -len(container) <= index < len(container):
+        raise KeyError(bit)
+    return index
+
+
+def _get_child(container, bit: str):
+    """
+    Look up a single path segment - dict keys or (numeric) list indices.
+    """
+    if isinstance(container, list):
+        return container[_to_index(container, bit)]
+    try:
+        return container[bit]
+    except TypeError as exc:  # not a container, e.g. ``None`` or a string
+        raise KeyError(bit) from exc
@@ -9,8 +9,13 @@ from openforms.typing import DataMapping
 
 from ..datastructures import FormioConfigurationWrapper
 from ..registry import register
+from .localization import localize_configuration
 
-__all__ = ["rewrite_formio_components", "rewrite_formio_components_for_request"]
+__all__ = [
+    "rewrite_formio_components",
+    "rewrite_formio_components_for_request",
+    "localize_configuration",
+]
 
 
 def rewrite_formio_components(
@@ -49,6 +54,12 @@ def rewrite_formio_components_for_request(
 
 def get_translated_custom_error_messages(
     config_wrapper: FormioConfigurationWrapper, submission: Submission
+) -> FormioConfigurationWrapper:
+    return apply_custom_error_messages(config_wrapper, submission.language_code)
+
+
+def apply_custom_error_messages(
+    config_wrapper: FormioConfigurationWrapper, language_code: str
 ) -> FormioConfigurationWrapper:
     for component in config_wrapper:
         if (
@@ -57,8 +68,7 @@ def get_translated_custom_error_messages(
         ):
             continue
 
-        language = submission.language_code
-        component["errors"] = custom_error_messages[language]
+        component["errors"] = custom_error_messages[language_code]
 
     return config_wrapper
 
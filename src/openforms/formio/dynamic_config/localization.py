@@ -0,0 +1,111 @@
+"""
+Localize the Formio configuration, with a cache of the localized variants.
+
+Applying the custom error messages and component translations walks every component
+and copies the translations from the ``openForms.translations`` structures into the
+configuration. The outcome only depends on the configuration, the language and whether
+translations are enabled, so it is computed once for each combination.
+
+What is cached is the difference between the configuration and its localized variant,
+per component. Applying it updates the existing component dictionaries in place, as
+other datastructures (like the total configuration of a submission) refer to them.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from ..datastructures import FormioConfigurationWrapper
+from ..typing import Component
+from ..utils import iter_components
+
+__all__ = ["localize_configuration"]
+
+# number of (configuration, language) variants for which the changes are kept around
+LOCALIZATION_CACHE_SIZE = 512
+
+# keys holding the nested components - these are compared component by component
+_NESTED_KEYS = ("components", "columns")
+
+# (component index, updated properties, deleted properties)
+ComponentChanges = tuple[int, dict[str, object], list[str]]
+
+_localizations: OrderedDict[tuple[str, str, bool], str] = OrderedDict()
+_localizations_lock = threading.Lock()
+
+
+def _get_changes(
+    original: Component, localized: Component
+) -> tuple[dict[str, object], list[str]] | None:
+    updated = {
+        key: value
+        for key, value in localized.items()
+        if key not in _NESTED_KEYS and original.get(key) != value
+    }
+    deleted = [key for key in original if key not in localized]
+    return (updated, deleted) if updated or deleted else None
+
+
+def _localize(
+    configuration: dict, language_code: str, enabled: bool
+) -> list[ComponentChanges]:
+    # deferred import to avoid import cycles
+    from . import apply_custom_error_messages, localize_components
+
+    localized_wrapper = FormioConfigurationWrapper(
+        json.loads(json.dumps(configuration))
+    )
+    apply_custom_error_messages(localized_wrapper, language_code)
+    localize_components(localized_wrapper, language_code, enabled=enabled)
+
+    changes = []
+    for index, (original, localized) in enumerate(
+        zip(
+            iter_components(configuration),
+            iter_components(localized_wrapper.configuration),
+        )
+    ):
+        if component_changes := _get_changes(original, localized):
+            changes.append((index, *component_changes))
+    return changes
+
+
+def localize_configuration(
+    config_wrapper: FormioConfigurationWrapper, language_code: str, enabled: bool
+) -> None:
+    """
+    Apply the custom error messages and component translations for the language.
+
+    .. note:: this function mutates the configuration.
+    """
+    configuration = config_wrapper.configuration
+    config_hash = hashlib.md5(
+        json.dumps(configuration, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    key = (config_hash, language_code, enabled)
+
+    with _localizations_lock:
+        if (serialized_changes := _localizations.get(key)) is not None:
+            _localizations.move_to_end(key)
+
+    if serialized_changes is None:
+        serialized_changes = json.dumps(
+            _localize(configuration, language_code, enabled)
+        )
+        with _localizations_lock:
+            _localizations[key] = serialized_changes
+            while len(_localizations) > LOCALIZATION_CACHE_SIZE:
+                _localizations.popitem(last=False)
+
+    # deserialize for every use, the configuration is mutated further down the line
+    changes: list[ComponentChanges] = json.loads(serialized_changes)
+    if not changes:
+        return
+
+    components = list(iter_components(configuration))
+    for index, updated, deleted in changes:
+        component = components[index]
+        component.update(updated)  # type: ignore
+        for key in deleted:
+            del component[key]
@@ -0,0 +1,115 @@
+from copy import deepcopy
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from ...datastructures import FormioConfigurationWrapper
+from .. import localize_components
+from ..localization import _localizations, localize_configuration
+
+CONFIGURATION = {
+    "components": [
+        {
+            "type": "fieldset",
+            "key": "fieldset",
+            "label": "Fieldset",
+            "openForms": {"translations": {"en": {"label": "Group"}}},
+            "components": [
+                {
+                    "type": "radio",
+                    "key": "radio",
+                    "label": "Kies",
+                    "openForms": {"translations": {"en": {"label": "Choose"}}},
+                    "values": [
+                        {
+                            "value": "a",
+                            "label": "Optie A",
+                            "openForms": {
+                                "translations": {"en": {"label": "Option A"}}
+                            },
+                        },
+                    ],
+                    "translatedErrors": {
+                        "nl": {"required": "Verplicht!"},
+                        "en": {"required": "Required!"},
+                    },
+                },
+            ],
+        },
+    ],
+}
+
+
+class LocalizeConfigurationTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        _localizations.clear()
+        self.addCleanup(_localizations.clear)
+
+    def test_localize_configuration(self):
+        configuration = deepcopy(CONFIGURATION)
+        fieldset = configuration["components"][0]
+        radio = fieldset["components"][0]
+
+        localize_configuration(
+            FormioConfigurationWrapper(configuration), "en", enabled=True
+        )
+
+        self.assertEqual(fieldset["label"], "Group")
+        self.assertEqual(radio["label"], "Choose")
+        self.assertEqual(radio["values"][0]["label"], "Option A")
+        self.assertEqual(radio["errors"], {"required": "Required!"})
+        self.assertNotIn("translations", radio["openForms"])
+        # the components are updated in place
+        self.assertIs(configuration["components"][0], fieldset)
+        self.assertIs(fieldset["components"][0], radio)
+
+    def test_translations_disabled(self):
+        configuration = deepcopy(CONFIGURATION)
+
+        localize_configuration(
+            FormioConfigurationWrapper(configuration), "en", enabled=False
+        )
+
+        radio = configuration["components"][0]["components"][0]
+        self.assertEqual(radio["label"], "Kies")
+        self.assertEqual(radio["values"][0]["label"], "Optie A")
+        self.assertNotIn("translations", radio["openForms"])
+
+    def test_localized_variant_is_reused(self):
+        with patch(
+            "openforms.formio.dynamic_config.localize_components",
+            wraps=localize_components,
+        ) as mock_localize_components:
+            for _ in range(3):
+                configuration = deepcopy(CONFIGURATION)
+                localize_configuration(
+                    FormioConfigurationWrapper(configuration), "en", enabled=True
+                )
+
+            mock_localize_components.assert_called_once()
+
+            with self.subTest("other language"):
+                localize_configuration(
+                    FormioConfigurationWrapper(deepcopy(CONFIGURATION)),
+                    "nl",
+                    enabled=True,
+                )
+
+                self.assertEqual(mock_localize_components.call_count, 2)
+
+        radio = configuration["components"][0]["components"][0]
+        self.assertEqual(radio["label"], "Choose")
+
+    def test_applied_changes_are_not_shared(self):
+        first = deepcopy(CONFIGURATION)
+        second = deepcopy(CONFIGURATION)
+
+        localize_configuration(FormioConfigurationWrapper(first), "en", enabled=True)
+        localize_configuration(FormioConfigurationWrapper(second), "en", enabled=True)
+        first["components"][0]["components"][0]["values"].append(
+            {"value": "b", "label": "Option B"}
+        )
+
+        self.assertEqual(len(second["components"][0]["components"][0]["values"]), 1)
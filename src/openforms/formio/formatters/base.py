@@ -1,12 +1,15 @@
 import logging
 from dataclasses import dataclass
-from typing import Any, Generic, Iterable, Sequence, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Iterable, Sequence, TypeVar
 
 from django.utils.encoding import force_str
 from django.utils.html import format_html_join
 
 from ..typing import Component
 
+if TYPE_CHECKING:
+    from .formio import OptionsIndexCache
+
 logger = logging.getLogger(__name__)
 
 ComponentT = TypeVar("ComponentT", bound=Component)
@@ -29,6 +32,11 @@ class FormatterBase(Generic[ComponentT]):
     readability.
     """
 
+    options_indexes: "OptionsIndexCache | None" = None
+    """
+    The options indexes shared by the formatters of a render pass, if any.
+    """
+
     # there is an interesting open question on what to do for empty values
     # currently we're eating them in normalise_value_to_list()
     empty_values: Sequence[Any] = (None, "")
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Hashable
 from datetime import datetime
 from typing import Any
 
@@ -22,7 +23,69 @@ from .base import FormatterBase
 logger = logging.getLogger(__name__)
 
 
-def get_value_label(possible_values: list[OptionDict], value: int | str) -> str:
+class OptionsIndex:
+    """
+    Look up the options of a component by their value.
+
+    Building the index is linear in the number of options, after which every lookup
+    (e.g. for each selected value of a multiple select) is constant time. The index
+    maps to the option itself rather than the label, so that labels modified in place
+    (translations, see
+    :meth:`openforms.formio.rendering.default.ChoicesNode.apply_to_labels`) are
+    picked up.
+
+    If multiple options share the same value, the first one wins.
+    """
+
+    def __init__(self, possible_values: list[OptionDict]):
+        self.possible_values = possible_values
+        self._index: dict[Hashable, OptionDict] = {}
+        self._has_unhashable_values = False
+        for option in possible_values:
+            try:
+                self._index.setdefault(option["value"], option)
+            except TypeError:
+                self._has_unhashable_values = True
+
+    def get(self, value: Any) -> OptionDict | None:
+        try:
+            option = self._index.get(value)
+        except TypeError:
+            option = None
+        if option is None and self._has_unhashable_values:
+            # unhashable values (from malformed configurations) can't be indexed
+            option = next(
+                (option for option in self.possible_values if option["value"] == value),
+                None,
+            )
+        return option
+
+
+class OptionsIndexCache:
+    """
+    Share the options indexes between the formatters of a render pass.
+
+    A formatter is created for every formatted component value, while a render pass
+    (like the PDF report) formats the same options lists over and over.
+    The indexes are kept per options list for the lifetime of this holder, which
+    keeps a reference to the lists so their ids can't be reused in the meantime.
+    """
+
+    def __init__(self):
+        self._indexes: dict[int, OptionsIndex] = {}
+
+    def get(self, possible_values: list[OptionDict]) -> OptionsIndex:
+        index = self._indexes.get(id(possible_values))
+        if index is None or index.possible_values is not possible_values:
+            index = self._indexes[id(possible_values)] = OptionsIndex(possible_values)
+        return index
+
+
+def get_value_label(
+    possible_values: list[OptionDict],
+    value: int | str,
+    index: OptionsIndex | None = None,
+) -> str:
     # From #1466 it's clear that Formio does not force the values to be strings, e.g.
     # if you use numeric values for the options. They are stored as string in the form
     # configuration, but the submitted value is a number.
@@ -39,13 +102,38 @@ def get_value_label(possible_values: list[OptionDict], value: int | str) -> str:
             value,
         )
 
-    for possible_value in possible_values:
-        if possible_value["value"] == value:
-            return possible_value["label"]
+    if index is None:
+        # a single lookup doesn't pay off building an index
+        for possible_value in possible_values:
+            if possible_value["value"] == value:
+                return possible_value["label"]
+    elif (option := index.get(value)) is not None:
+        return option["label"]
 
     return value
 
 
+class OptionsFormatterMixin:
+    options_indexes: OptionsIndexCache | None
+    _options_index: OptionsIndex | None = None
+
+    def get_options_index(self, possible_values: list[OptionDict]) -> OptionsIndex:
+        """
+        Return the index of the options, shared with the render pass if possible.
+
+        Without a render pass, the options are indexed once for all (selected) values
+        of the formatted component.
+        """
+        if self.options_indexes is not None:
+            return self.options_indexes.get(possible_values)
+        if (
+            self._options_index is None
+            or self._options_index.possible_values is not possible_values
+        ):
+            self._options_index = OptionsIndex(possible_values)
+        return self._options_index
+
+
 class DefaultFormatter(FormatterBase):
     def format(self, component: Component, value: Any) -> str:
         return str(value)
@@ -123,7 +211,7 @@ class SelectBoxesFormatter(FormatterBase):
         return self.multiple_separator.join(selected_labels)
 
 
-class SelectFormatter(FormatterBase):
+class SelectFormatter(OptionsFormatterMixin, FormatterBase):
     def format(self, component: SelectComponent, value: str | dict) -> str:
         # grab appointment specific data
         if glom(component, "appointments.showDates", default=False):
@@ -145,7 +233,10 @@ class SelectFormatter(FormatterBase):
             # regular value select
             values = component["data"].get("values") or []
             assert isinstance(value, str)
-            return get_value_label(values, value)
+            index = (
+                self.get_options_index(values) if component.get("multiple") else None
+            )
+            return get_value_label(values, value, index=index)
 
 
 class CurrencyFormatter(FormatterBase):
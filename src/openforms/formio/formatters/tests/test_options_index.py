@@ -0,0 +1,144 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from ...service import format_value
+from ...typing import OptionDict
+from ..formio import OptionsIndex, OptionsIndexCache, get_value_label
+
+
+class OptionsIndexTests(SimpleTestCase):
+    def test_first_option_wins_for_duplicate_values(self):
+        options: list[OptionDict] = [
+            {"value": "a", "label": "First"},
+            {"value": "a", "label": "Second"},
+        ]
+
+        self.assertEqual(get_value_label(options, "a"), "First")
+
+    def test_labels_modified_in_place_are_used(self):
+        options: list[OptionDict] = [{"value": "a", "label": "A"}]
+        self.assertEqual(get_value_label(options, "a"), "A")
+
+        options[0]["label"] = "Translated A"
+
+        self.assertEqual(get_value_label(options, "a"), "Translated A")
+
+    def test_options_modified_in_place(self):
+        options: list[OptionDict] = [{"value": "a", "label": "A"}]
+        self.assertEqual(get_value_label(options, "b"), "b")
+
+        options.append({"value": "b", "label": "B"})
+        options[0]["value"] = "c"
+
+        self.assertEqual(get_value_label(options, "b"), "B")
+        self.assertEqual(get_value_label(options, "c"), "A")
+        self.assertEqual(get_value_label(options, "a"), "a")
+
+    def test_unhashable_values(self):
+        options = [
+            {"value": ["malformed"], "label": "Malformed"},
+            {"value": "a", "label": "A"},
+        ]
+        index = OptionsIndex(options)  # type: ignore
+
+        self.assertEqual(index.get("a"), {"value": "a", "label": "A"})
+        self.assertEqual(
+            index.get(["malformed"]), {"value": ["malformed"], "label": "Malformed"}
+        )
+        self.assertIsNone(index.get("b"))
+
+    def test_numeric_values(self):
+        options: list[OptionDict] = [{"value": "1", "label": "One"}]
+
+        self.assertEqual(get_value_label(options, 1), "One")
+
+    def test_multiple_select_with_many_options(self):
+        component = {
+            "type": "select",
+            "key": "select",
+            "label": "Select",
+            "multiple": True,
+            "data": {
+                "values": [
+                    {"value": f"option{i}", "label": f"Option {i}"} for i in range(5000)
+                ]
+            },
+        }
+
+        result = format_value(component, ["option4999", "option0", "unknown"])
+
+        self.assertEqual(result, "Option 4999; Option 0; unknown")
+
+    def test_options_are_indexed_once_per_component(self):
+        component = {
+            "type": "select",
+            "key": "select",
+            "label": "Select",
+            "multiple": True,
+            "data": {
+                "values": [
+                    {"value": "a", "label": "A"},
+                    {"value": "b", "label": "B"},
+                ]
+            },
+        }
+
+        with patch(
+            "openforms.formio.formatters.formio.OptionsIndex", wraps=OptionsIndex
+        ) as mock_options_index:
+            result = format_value(component, ["a", "b"])
+
+        self.assertEqual(result, "A; B")
+        mock_options_index.assert_called_once()
+
+    def test_single_values_are_not_indexed(self):
+        radio = {
+            "type": "radio",
+            "key": "radio",
+            "label": "Radio",
+            "values": [{"value": "a", "label": "A"}],
+        }
+        select = {
+            "type": "select",
+            "key": "select",
+            "label": "Select",
+            "data": {"values": [{"value": "a", "label": "A"}]},
+        }
+
+        with patch(
+            "openforms.formio.formatters.formio.OptionsIndex", wraps=OptionsIndex
+        ) as mock_options_index:
+            radio_result = format_value(radio, "a")
+            select_result = format_value(select, "a")
+
+        self.assertEqual(radio_result, "A")
+        self.assertEqual(select_result, "A")
+        mock_options_index.assert_not_called()
+
+    def test_options_indexes_are_shared_by_the_render_pass(self):
+        component = {
+            "type": "select",
+            "key": "select",
+            "label": "Select",
+            "multiple": True,
+            "data": {
+                "values": [
+                    {"value": "a", "label": "A"},
+                    {"value": "b", "label": "B"},
+                ]
+            },
+        }
+        options_indexes = OptionsIndexCache()
+
+        with patch(
+            "openforms.formio.formatters.formio.OptionsIndex", wraps=OptionsIndex
+        ) as mock_options_index:
+            summary = format_value(component, ["a"], options_indexes=options_indexes)
+            pdf = format_value(
+                component, ["a", "b"], as_html=True, options_indexes=options_indexes
+            )
+
+        self.assertEqual(summary, "A")
+        self.assertEqual(pdf, "A; B")
+        mock_options_index.assert_called_once()
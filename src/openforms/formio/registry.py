@@ -30,11 +30,15 @@ from .utils import is_layout_component
 if TYPE_CHECKING:
     from openforms.submissions.models import Submission
 
+    from .formatters.formio import OptionsIndexCache
+
 ComponentT = TypeVar("ComponentT", bound=Component, contravariant=True)
 
 
 class FormatterProtocol(Protocol[ComponentT]):
-    def __init__(self, as_html: bool): ...
+    def __init__(
+        self, as_html: bool, options_indexes: "OptionsIndexCache | None" = None
+    ): ...
 
     def __call__(self, component: ComponentT, value: Any) -> str: ...
 
@@ -124,7 +128,13 @@ class ComponentRegistry(BaseRegistry[BasePlugin]):
             return value
         return normalizer(component, value)
 
-    def format(self, component: Component, value: Any, as_html=False) -> str:
+    def format(
+        self,
+        component: Component,
+        value: Any,
+        as_html=False,
+        options_indexes: "OptionsIndexCache | None" = None,
+    ) -> str:
         """
         Format a given value in the appropriate way for the specified component.
 
@@ -136,7 +146,9 @@ class ComponentRegistry(BaseRegistry[BasePlugin]):
             component_type = "default"
 
         component_plugin = self[component_type]
-        formatter = component_plugin.formatter(as_html=as_html)
+        formatter = component_plugin.formatter(
+            as_html=as_html, options_indexes=options_indexes
+        )
         return formatter(component, value)
 
     def update_config(
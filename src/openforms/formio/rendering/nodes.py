@@ -270,7 +270,12 @@ class ComponentNode(Node):
         # in export mode, expose the raw datatype
         if self.mode == RenderModes.export:
             return self.value
-        return format_value(self.component, self.value, as_html=self.renderer.as_html)
+        return format_value(
+            self.component,
+            self.value,
+            as_html=self.renderer.as_html,
+            options_indexes=self.renderer.options_indexes,
+        )
 
     @property
     def indent(self) -> str:
@@ -20,11 +20,11 @@ from openforms.typing import DataMapping
 
 from .datastructures import FormioConfigurationWrapper, FormioData
 from .dynamic_config import (
-    get_translated_custom_error_messages,
-    localize_components,
+    localize_configuration,
     rewrite_formio_components,
     rewrite_formio_components_for_request,
 )
+from .formatters.formio import OptionsIndexCache
 from .registry import ComponentRegistry, register
 from .serializers import build_serializer as _build_serializer
 from .typing import Component
@@ -37,6 +37,7 @@ __all__ = [
     "iter_components",
     "inject_variables",
     "format_value",
+    "OptionsIndexCache",
     "rewrite_formio_components_for_request",
     "FormioData",
     "iterate_data_with_components",
@@ -45,11 +46,22 @@ __all__ = [
 ]
 
 
-def format_value(component: Component, value: Any, *, as_html: bool = False):
+def format_value(
+    component: Component,
+    value: Any,
+    *,
+    as_html: bool = False,
+    options_indexes: OptionsIndexCache | None = None,
+):
     """
     Format a submitted value in a way that is most appropriate for the component type.
+
+    Pass the ``options_indexes`` of the render pass to share the option lookups
+    between the formatted components.
     """
-    return register.format(component, value, as_html=as_html)
+    return register.format(
+        component, value, as_html=as_html, options_indexes=options_indexes
+    )
 
 
 def normalize_value_for_component(component: Component, value: Any) -> Any:
@@ -73,15 +85,15 @@ def get_dynamic_configuration(
     The configuration is modified in the context of the provided ``submission``
     parameter.
     """
-    rewrite_formio_components(config_wrapper, submission=submission, data=data)
-
-    # Add to each component the custom errors in the current locale
-    get_translated_custom_error_messages(config_wrapper, submission)
-    localize_components(
+    # Add to each component the custom errors and translations in the current locale.
+    # These only depend on the configuration itself, so they're applied before the
+    # submission-specific rewrites.
+    localize_configuration(
         config_wrapper,
         submission.language_code,
         enabled=submission.form.translation_enabled,
     )
+    rewrite_formio_components(config_wrapper, submission=submission, data=data)
 
     # prefill is still 'special' even though it uses variables, as we specifically
     # set the `defaultValue` key to the resulting variable.
@@ -89,6 +89,39 @@ class FormioDataTests(TestCase):
 
         self.assertEqual(formio_data, expected)
 
+    def test_list_indices_in_paths(self):
+        formio_data = FormioData({"repeatingGroup": [{"name": "a"}, {"name": "b"}]})
+
+        with self.subTest("lookup"):
+            self.assertEqual(formio_data["repeatingGroup.1.name"], "b")
+            self.assertNotIn("repeatingGroup.2.name", formio_data)
+            self.assertNotIn("repeatingGroup.foo", formio_data)
+
+        with self.subTest("assignment"):
+            formio_data["repeatingGroup.0.name"] = "c"
+
+            self.assertEqual(formio_data["repeatingGroup"][0], {"name": "c"})
+
+    def test_lookup_through_non_container(self):
+        formio_data = FormioData({"empty": None, "text": "value"})
+
+        self.assertNotIn("empty.nested", formio_data)
+        self.assertNotIn("text.nested", formio_data)
+        with self.assertRaises(KeyError):
+            formio_data["empty.nested"]
+
+    def test_assignment_keeps_existing_siblings(self):
+        formio_data = FormioData({"container": {"nested1": "foo"}})
+
+        formio_data["container.nested2"] = "bar"
+        formio_data["other.deeply.nested"] = "baz"
+
+        expected = {
+            "container": {"nested1": "foo", "nested2": "bar"},
+            "other": {"deeply": {"nested": "baz"}},
+        }
+        self.assertEqual(formio_data, expected)
+
 
 class FormioConfigurationWrapperTests(TestCase):
 
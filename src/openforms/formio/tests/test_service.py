@@ -3,6 +3,7 @@ from unittest.mock import patch
 from django.test import RequestFactory, TestCase
 from django.urls import reverse
 
+from csp_post_processor.processor import sanitize_html
 from openforms.formio.service import (
     FormioConfigurationWrapper,
     rewrite_formio_components_for_request,
@@ -10,6 +11,13 @@ from openforms.formio.service import (
 
 
 class ServiceTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        # the sanitized markup contains the (mocked) generated IDs
+        sanitize_html.cache_clear()
+        self.addCleanup(sanitize_html.cache_clear)
+
     @patch("csp_post_processor.processor.get_html_id", return_value="1234")
     def test_rewrite_formio_components_for_request(self, m):
         request = RequestFactory().get("/", HTTP_X_CSP_NONCE="dGVzdA==")
@@ -6,6 +6,8 @@ from django.utils import timezone
 
 from freezegun import freeze_time
 
+from openforms.template import _parse
+
 from ..datastructures import FormioConfigurationWrapper
 from ..variables import inject_variables, render
 
@@ -184,3 +186,34 @@ class VariableInjectionTests(SimpleTestCase):
             result,
             {"topLevel": {"nested": "yepp"}},
         )
+
+    def test_large_form_templates_parsed_once(self):
+        _parse.cache_clear()
+        self.addCleanup(_parse.cache_clear)
+        configuration = {
+            "components": [
+                {
+                    "type": "textfield",
+                    "key": f"text{index}",
+                    "label": f"Field {index} for {{{{ name }}}}",
+                    "description": "A description without template syntax",
+                    "placeholder": "{{ placeholder }}",
+                }
+                for index in range(500)
+            ]
+        }
+
+        for name in ("Alice", "Bob"):
+            with self.subTest(name=name):
+                config_wrapper = FormioConfigurationWrapper(deepcopy(configuration))
+
+                inject_variables(config_wrapper, {"name": name, "placeholder": "..."})
+
+                component = config_wrapper["text499"]
+                self.assertEqual(component["label"], f"Field 499 for {name}")
+                self.assertEqual(component["placeholder"], "...")
+
+        cache_info = _parse.cache_info()
+        # one compiled template per distinct label and one for the placeholder
+        self.assertEqual(cache_info.misses, 501)
+        self.assertEqual(cache_info.hits, 1499)
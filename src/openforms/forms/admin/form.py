@@ -1,5 +1,8 @@
+from functools import partial
+
 from django.contrib import admin, messages
 from django.contrib.admin.templatetags.admin_list import result_headers
+from django.db import transaction
 from django.db.models import Count
 from django.http.response import HttpResponse, HttpResponseRedirect
 from django.template.response import TemplateResponse
@@ -17,6 +20,7 @@ from openforms.registrations.admin import RegistrationBackendFieldMixin
 from openforms.typing import StrOrPromise
 from openforms.utils.expressions import FirstNotBlank
 
+from ..cache import invalidate_forms
 from ..models import Category, Form, FormDefinition, FormStep
 from ..models.form import FormsExport
 from ..utils import export_form
@@ -330,7 +334,10 @@ class FormAdmin(
         description=_("Set selected %(verbose_name_plural)s to maintenance mode")
     )
     def set_to_maintenance_mode(self, request, queryset):
-        count = queryset.filter(maintenance_mode=False).update(maintenance_mode=True)
+        forms = queryset.filter(maintenance_mode=False)
+        form_ids = list(forms.values_list("pk", flat=True))
+        count = forms.update(maintenance_mode=True)
+        transaction.on_commit(partial(invalidate_forms, form_ids))
         messages.success(
             request,
             ngettext(
@@ -346,7 +353,10 @@ class FormAdmin(
 
     @admin.action(description=_("Remove %(verbose_name_plural)s from maintenance mode"))
     def remove_from_maintenance_mode(self, request, queryset):
-        count = queryset.filter(maintenance_mode=True).update(maintenance_mode=False)
+        forms = queryset.filter(maintenance_mode=True)
+        form_ids = list(forms.values_list("pk", flat=True))
+        count = forms.update(maintenance_mode=False)
+        transaction.on_commit(partial(invalidate_forms, form_ids))
         messages.success(
             request,
             ngettext(
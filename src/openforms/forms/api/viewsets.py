@@ -4,10 +4,16 @@ from uuid import UUID
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Prefetch
-from django.http.response import HttpResponse
+from django.db.models import Prefetch, prefetch_related_objects
+from django.http.response import HttpResponse, HttpResponseBase
 from django.shortcuts import get_object_or_404
 from django.utils import translation
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+    quote_etag,
+)
 from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.types import OpenApiTypes
@@ -15,10 +21,15 @@ from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema
 from rest_framework import parsers, permissions, response, status, views, viewsets
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.mixins import ListModelMixin
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from csp_post_processor import post_process_html, uses_nonce
+from csp_post_processor.constants import NONCE_HTTP_HEADER
+from csp_post_processor.fields import CSPPostProcessedWYSIWYGField
 from openforms.api.pagination import PageNumberPagination
 from openforms.api.serializers import ExceptionSerializer, ValidationErrorSerializer
 from openforms.translations.utils import set_language_cookie
@@ -26,8 +37,17 @@ from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSet
 from openforms.utils.urls import is_admin_request
 from openforms.variables.constants import FormVariableSources
 
+from ..cache import (
+    get_form_definition_version,
+    get_form_version,
+    get_representation,
+    is_enabled as is_cache_enabled,
+    set_conditional_headers,
+    store_representation,
+)
 from ..messages import add_success_message
 from ..models import Form, FormDefinition, FormStep, FormVersion
+from ..step_configuration import get_static_configuration
 from ..tasks import on_variables_bulk_update_event
 from ..utils import export_form, import_form
 from .datastructures import FormVariableWrapper
@@ -59,6 +79,24 @@ from .serializers.logic.form_logic import FormLogicListSerializer
 from .serializers.logic.form_logic_price import FormPriceLogicListSerializer
 
 
+def _get_html_fields() -> list[str]:
+    # the CSP nonce of the request is inserted in the HTML content of these fields
+    return [
+        field.name
+        for field in Form._meta.get_fields()
+        if isinstance(field, CSPPostProcessedWYSIWYGField)
+    ]
+
+
+# the static configurations are addressed by their revision (a content hash)
+STATIC_CONFIGURATION_MAX_AGE = 365 * 24 * 60 * 60
+
+FORM_STEPS_PREFETCH = Prefetch(
+    "formstep_set",
+    queryset=FormStep.objects.select_related("form_definition").order_by("order"),
+)
+
+
 @extend_schema(
     parameters=[
         OpenApiParameter(
@@ -104,6 +142,60 @@ class FormStepViewSet(
             )
         return context
 
+    @extend_schema(
+        summary=_("Retrieve the static form step configuration"),
+        description=_(
+            "Retrieve the localized Formio configuration of the form step, without "
+            "the dynamic modifications applied for a submission. The URL is "
+            "provided by the submission step endpoints with the `configuration=overlay` "
+            "query parameter and contains the revision of the configuration - the "
+            "response can be cached indefinitely."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="language",
+                location=OpenApiParameter.PATH,
+                type=str,
+                description=_("The language of the configuration."),
+            ),
+            OpenApiParameter(
+                name="revision",
+                location=OpenApiParameter.PATH,
+                type=str,
+                description=_("The revision of the configuration."),
+            ),
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"configuration/(?P<language>[a-z]{2})/(?P<revision>[0-9a-f]{32})",
+        url_name="static-configuration",
+        permission_classes=[permissions.AllowAny],
+        renderer_classes=[JSONRenderer],
+    )
+    def static_configuration(
+        self, request: Request, language: str, revision: str, *args, **kwargs
+    ):
+        if language not in dict(settings.LANGUAGES):
+            raise NotFound()
+        form_step = self.get_object()
+        static_configuration = get_static_configuration(form_step, language)
+        # the configuration changed in the meantime - the client needs to fetch the
+        # submission step again to obtain the URL of the new revision
+        if static_configuration.revision != revision:
+            raise NotFound()
+
+        response = Response(static_configuration.configuration)
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=STATIC_CONFIGURATION_MAX_AGE,
+            immutable=True,
+        )
+        return response
+
 
 _FORMSTEP_ADMIN_FIELDS_MARKDOWN = get_admin_fields_markdown(FormStepSerializer)
 FormStepViewSet.__doc__ = inspect.getdoc(FormStepViewSet).format(
@@ -196,7 +288,16 @@ class FormDefinitionViewSet(viewsets.ModelViewSet):
         may be custom field types in play.
         """
         definition = self.get_object()
-        return Response(data=definition.configuration, status=status.HTTP_200_OK)
+        if not is_cache_enabled():
+            return Response(data=definition.configuration, status=status.HTTP_200_OK)
+
+        version = get_form_definition_version(definition.pk)
+        etag = version.get_etag()
+        response = get_conditional_response(
+            request, etag=quote_etag(etag), last_modified=version.last_modified
+        ) or Response(data=definition.configuration, status=status.HTTP_200_OK)
+        set_conditional_headers(response, etag, version.last_modified)
+        return response
 
 
 FormDefinitionViewSet.__doc__ = inspect.getdoc(FormDefinitionViewSet).format(
@@ -331,14 +432,7 @@ class FormViewSet(viewsets.ModelViewSet):
 
     parser_classes = (FormCamelCaseJSONParser,)
     renderer_classes = (FormCamelCaseJSONRenderer,)
-    queryset = Form.objects.all().prefetch_related(
-        Prefetch(
-            "formstep_set",
-            queryset=FormStep.objects.select_related("form_definition").order_by(
-                "order"
-            ),
-        )
-    )
+    queryset = Form.objects.all().prefetch_related(FORM_STEPS_PREFETCH)
     lookup_url_kwarg = "uuid_or_slug"
     # lookup_value_regex = "[0-9a-fA-F]{8}\-[0-9a-fA-F]{4}\-[0-9a-fA-F]{4}\-[0-9a-fA-F]{4}\-[0-9a-fA-F]{12}"
     serializer_class = FormSerializer
@@ -369,6 +463,10 @@ class FormViewSet(viewsets.ModelViewSet):
         ):
             queryset = queryset.select_related(None).prefetch_related(None)
 
+        # ⚡️ - the steps are only needed when the cached representation is missing
+        if self._use_public_cache():
+            queryset = queryset.prefetch_related(None)
+
         return queryset
 
     def get_serializer(self, *args, **kwargs):
@@ -395,13 +493,87 @@ class FormViewSet(viewsets.ModelViewSet):
 
         return request
 
+    def _use_public_cache(self) -> bool:
+        return (
+            self.action == "retrieve"
+            and is_cache_enabled()
+            and not self.request.user.is_staff
+            and not is_admin_request(self.request)
+        )
+
+    def _get_public_response(self, request: Request, form: Form) -> HttpResponseBase:
+        """
+        Return the (cached) public representation of the form.
+
+        The response can be revalidated with the ``ETag`` or ``Last-Modified`` headers.
+        """
+        version = get_form_version(form.pk)
+        html_fields = _get_html_fields()
+        # the representation contains absolute URLs and translated content
+        variants = (translation.get_language(), request.build_absolute_uri("/"))
+        representation_key = version.get_etag(*variants)
+
+        # The CSP nonce of the request is inserted in the HTML content with inline
+        # styles. The nonce changes on every page load, so it's only part of the
+        # validator if the content actually contains it. Without a nonce, the HTML
+        # content is not post-processed at all.
+        nonce = request.headers.get(NONCE_HTTP_HEADER, "")
+        nonce_in_content = bool(nonce) and any(
+            uses_nonce(value) for name in html_fields if (value := getattr(form, name))
+        )
+        if nonce_in_content:
+            etag = version.get_etag(*variants, nonce)
+            # the modification time says nothing about the nonce in the content
+            last_modified = None
+        else:
+            etag = version.get_etag(*variants, "post-processed" if nonce else "")
+            last_modified = version.last_modified
+
+        response = get_conditional_response(
+            request, etag=quote_etag(etag), last_modified=last_modified
+        )
+        if response is None:
+            if (data := get_representation(representation_key)) is None:
+                prefetch_related_objects([form], FORM_STEPS_PREFETCH)
+                data = self.get_serializer(form).data
+                # store the HTML content before the nonce is inserted
+                store_representation(
+                    representation_key,
+                    {
+                        **data,
+                        **{
+                            name: getattr(form, name)
+                            for name in html_fields
+                            if name in data
+                        },
+                    },
+                )
+            else:
+                data = {
+                    **data,
+                    **{
+                        name: post_process_html(data[name], request)
+                        for name in html_fields
+                        if data.get(name)
+                    },
+                }
+            response = Response(data)
+
+        set_conditional_headers(response, etag, last_modified)
+        if nonce_in_content:
+            patch_vary_headers(response, (NONCE_HTTP_HEADER,))
+        return response
+
     def retrieve(self, request, *args, **kwargs):
         form = self.get_object()
         if not form.translation_enabled and not is_admin_request(request):
             translation.activate(settings.LANGUAGE_CODE)
             current_language = translation.get_language()
 
-        response = super().retrieve(request, *args, **kwargs)
+        if self._use_public_cache():
+            response = self._get_public_response(request, form)
+        else:
+            response = Response(self.get_serializer(form).data)
 
         if not form.translation_enabled and not is_admin_request(request):
             set_language_cookie(response, current_language)
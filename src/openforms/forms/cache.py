@@ -0,0 +1,150 @@
+"""
+Cache the public representation of forms.
+
+Every page load of the SDK retrieves the form, which serializes the form, its steps,
+the literals, translations, login options and the statement checkboxes derived from
+the global configuration. For anonymous users, this representation is identical for
+every request and only changes when a form is edited.
+
+Every form, form definition and the global configuration has a version in the cache,
+which is replaced when the object is saved (see :mod:`openforms.forms.signals`). The
+versions are used to build strong ``ETag`` and ``Last-Modified`` headers, and the
+cache key of the serialized representation, so that an edit invalidates both. The form
+version also changes when its logic rules or variables are edited, which other caches
+(like the logic check outcomes and the form variables) rely on.
+
+The HTML content of the representation contains the CSP nonce of the request. It's
+cached without the nonce, which is inserted for every request, and the nonce is part of
+the ``ETag`` so that clients don't reuse content with the nonce of another page load.
+"""
+
+import hashlib
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponseBase
+from django.utils.cache import patch_cache_control, quote_etag
+from django.utils.http import http_date
+
+__all__ = [
+    "is_enabled",
+    "get_form_version",
+    "get_form_definition_version",
+    "invalidate_forms",
+    "invalidate_form_definition",
+    "invalidate_all_forms",
+    "get_representation",
+    "store_representation",
+    "set_conditional_headers",
+]
+
+CACHE_PREFIX = "forms:api"
+GLOBAL_VERSION_KEY = f"{CACHE_PREFIX}:version:global"
+
+Version = tuple[float, str]
+
+
+@dataclass
+class CacheVersion:
+    token: str
+    last_modified: int  # timestamp
+
+    def get_etag(self, *variants: str) -> str:
+        """
+        Return the (unquoted) entity tag of the representation of this version.
+
+        :arg variants: the other inputs the representation depends on, like the
+          active language.
+        """
+        value = ":".join([self.token, *variants])
+        return hashlib.sha256(value.encode()).hexdigest()[:32]
+
+
+def is_enabled() -> bool:
+    return bool(settings.FORM_API_CACHE_TIMEOUT)
+
+
+def _get_version(key: str) -> Version:
+    if (version := cache.get(key)) is not None:
+        return version
+    # Unknown or evicted - start a new version. If another process raced us, use its
+    # version instead.
+    cache.add(key, (time.time(), uuid.uuid4().hex), timeout=None)
+    return cache.get(key) or (time.time(), uuid.uuid4().hex)
+
+
+def _bump_versions(keys: Iterable[str]) -> None:
+    now = time.time()
+    cache.set_many({key: (now, uuid.uuid4().hex) for key in keys}, timeout=None)
+
+
+def _to_cache_version(*versions: Version) -> CacheVersion:
+    return CacheVersion(
+        token=":".join(token for _, token in versions),
+        # HTTP dates have a resolution of seconds
+        last_modified=int(max(timestamp for timestamp, _ in versions)),
+    )
+
+
+def _form_key(form_id: int) -> str:
+    return f"{CACHE_PREFIX}:version:form:{form_id}"
+
+
+def _form_definition_key(form_definition_id: int) -> str:
+    return f"{CACHE_PREFIX}:version:form-definition:{form_definition_id}"
+
+
+def get_form_version(form_id: int) -> CacheVersion:
+    return _to_cache_version(
+        _get_version(GLOBAL_VERSION_KEY), _get_version(_form_key(form_id))
+    )
+
+
+def get_form_definition_version(form_definition_id: int) -> CacheVersion:
+    return _to_cache_version(_get_version(_form_definition_key(form_definition_id)))
+
+
+def invalidate_forms(form_ids: Iterable[int]) -> None:
+    _bump_versions(_form_key(form_id) for form_id in form_ids)
+
+
+def invalidate_form_definition(
+    form_definition_id: int, form_ids: Iterable[int]
+) -> None:
+    _bump_versions(
+        [
+            _form_definition_key(form_definition_id),
+            *(_form_key(form_id) for form_id in form_ids),
+        ]
+    )
+
+
+def invalidate_all_forms() -> None:
+    _bump_versions([GLOBAL_VERSION_KEY])
+
+
+def get_representation(etag: str) -> dict[str, Any] | None:
+    return cache.get(f"{CACHE_PREFIX}:representation:{etag}")
+
+
+def store_representation(etag: str, data: dict[str, Any]) -> None:
+    cache.set(
+        f"{CACHE_PREFIX}:representation:{etag}",
+        data,
+        timeout=settings.FORM_API_CACHE_TIMEOUT,
+    )
+
+
+def set_conditional_headers(
+    response: HttpResponseBase, etag: str, last_modified: int | None
+) -> None:
+    response["ETag"] = quote_etag(etag)
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    # clients may store the response, but must revalidate it before using it
+    patch_cache_control(response, no_cache=True)
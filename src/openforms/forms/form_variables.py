@@ -0,0 +1,46 @@
+"""
+Cache the form variables of forms.
+
+Every request operating on a submission loads the variables of its form, which only
+change when the form is edited. The form variables are cached per version of the form,
+which is replaced when the form, its steps, form definitions or variables are edited
+(see :mod:`openforms.forms.cache`) - this includes the bulk update of the variables
+through the API, which deletes the existing variables.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache import get_form_version, is_enabled as is_cache_enabled
+from .models import Form, FormVariable
+
+__all__ = ["get_form_variables"]
+
+CACHE_PREFIX = "forms:variables"
+
+
+def _get_form_variables(form_id: int) -> list[FormVariable]:
+    return list(FormVariable.objects.filter(form_id=form_id))
+
+
+def get_form_variables(form: Form) -> list[FormVariable]:
+    """
+    Return the form variables of the form.
+
+    Each call returns new instances, so they can be modified by the caller.
+    """
+    if not is_cache_enabled():
+        form_variables = _get_form_variables(form.pk)
+    else:
+        # retrieve the version before the variables, so that a concurrent edit can't
+        # store the old variables under the new version
+        version = get_form_version(form.pk)
+        key = f"{CACHE_PREFIX}:{form.pk}:{version.token}"
+        if (form_variables := cache.get(key)) is None:
+            form_variables = _get_form_variables(form.pk)
+            cache.set(key, form_variables, timeout=settings.FORM_API_CACHE_TIMEOUT)
+
+    # like the related manager does, avoid queries for the form of the variables
+    for form_variable in form_variables:
+        form_variable.form = form
+    return form_variables
@@ -0,0 +1,123 @@
+# Generated by Django 4.2.16 on 2024-10-21 09:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forms", "0101_fix_empty_default_value"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="formstatistics",
+            name="first_submission",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                help_text="Date and time of the first submitted form.",
+                verbose_name="first submission",
+            ),
+        ),
+        migrations.CreateModel(
+            name="FormSubmissionEvent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "form_name",
+                    models.CharField(
+                        help_text="The name of the form at the time of submission.",
+                        max_length=150,
+                        verbose_name="form name",
+                    ),
+                ),
+                (
+                    "timestamp",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="timestamp"
+                    ),
+                ),
+                (
+                    "form",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="forms.form",
+                        verbose_name="form",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "form submission event",
+                "verbose_name_plural": "form submission events",
+            },
+        ),
+        migrations.CreateModel(
+            name="FormStatisticsBucket",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "form_name",
+                    models.CharField(
+                        help_text="The name of the submitted form. This is saved separately in case of form deletion.",
+                        max_length=150,
+                        verbose_name="form name",
+                    ),
+                ),
+                (
+                    "start",
+                    models.DateTimeField(
+                        help_text="Start of the hour in which the forms were submitted.",
+                        verbose_name="start",
+                    ),
+                ),
+                (
+                    "submission_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of the submitted forms.",
+                        verbose_name="Submission count",
+                    ),
+                ),
+                (
+                    "form",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="forms.form",
+                        verbose_name="form",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "form statistics per hour",
+                "verbose_name_plural": "form statistics per hour",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="formstatisticsbucket",
+            constraint=models.UniqueConstraint(
+                fields=("form", "start"), name="unique_form_statistics_bucket"
+            ),
+        ),
+    ]
@@ -2,7 +2,7 @@ from .category import Category
 from .form import Form, FormsExport
 from .form_definition import FormDefinition
 from .form_registration_backend import FormRegistrationBackend
-from .form_statistics import FormStatistics
+from .form_statistics import FormStatistics, FormStatisticsBucket, FormSubmissionEvent
 from .form_step import FormStep
 from .form_variable import FormVariable
 from .form_version import FormVersion
@@ -18,6 +18,8 @@ __all__ = [
     "FormLogic",
     "FormPriceLogic",
     "FormStatistics",
+    "FormStatisticsBucket",
+    "FormSubmissionEvent",
     "FormVariable",
     "Category",
     "FormRegistrationBackend",
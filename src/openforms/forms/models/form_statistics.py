@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.utils.formats import localize
 from django.utils.timezone import localtime
 from django.utils.translation import gettext_lazy as _
@@ -27,7 +28,7 @@ class FormStatistics(models.Model):
     first_submission = models.DateTimeField(
         verbose_name=_("first submission"),
         help_text=_("Date and time of the first submitted form."),
-        auto_now_add=True,
+        default=timezone.now,
     )
     last_submission = models.DateTimeField(
         verbose_name=_("last submission"),
@@ -43,3 +44,77 @@ class FormStatistics(models.Model):
             form_name=self.form_name,
             last_submitted=localize(localtime(self.last_submission)),
         )
+
+
+class FormSubmissionEvent(models.Model):
+    """
+    Append-only record of a form submission, pending to be rolled up.
+
+    Recording a submission only inserts a row, so concurrent submissions never wait on
+    each other. The events are periodically aggregated into the :class:`FormStatistics`
+    and :class:`FormStatisticsBucket` records and then removed.
+    """
+
+    form = models.ForeignKey(
+        "forms.Form",
+        verbose_name=_("form"),
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+    )
+    form_name = models.CharField(
+        verbose_name=_("form name"),
+        max_length=150,
+        help_text=_("The name of the form at the time of submission."),
+    )
+    timestamp = models.DateTimeField(
+        verbose_name=_("timestamp"),
+        default=timezone.now,
+    )
+
+    class Meta:
+        verbose_name = _("form submission event")
+        verbose_name_plural = _("form submission events")
+
+
+class FormStatisticsBucket(models.Model):
+    form = models.ForeignKey(
+        "forms.Form",
+        verbose_name=_("form"),
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+    )
+    form_name = models.CharField(
+        verbose_name=_("form name"),
+        max_length=150,
+        help_text=_(
+            "The name of the submitted form. This is saved separately in case of form deletion."
+        ),
+    )
+    start = models.DateTimeField(
+        verbose_name=_("start"),
+        help_text=_("Start of the hour in which the forms were submitted."),
+    )
+    submission_count = models.PositiveIntegerField(
+        verbose_name=_("Submission count"),
+        default=0,
+        help_text=_("The number of the submitted forms."),
+    )
+
+    class Meta:
+        verbose_name = _("form statistics per hour")
+        verbose_name_plural = _("form statistics per hour")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("form", "start"),
+                name="unique_form_statistics_bucket",
+            ),
+        ]
+
+    def __str__(self):
+        return _("{form_name} submitted {count} times at {start}").format(
+            form_name=self.form_name,
+            count=self.submission_count,
+            start=localize(localtime(self.start)),
+        )
@@ -7,7 +7,6 @@ from django.utils.translation import gettext_lazy as _
 from glom import Path, glom
 
 from openforms.formio.utils import (
-    component_in_editgrid,
     get_component_datatype,
     get_component_default_value,
     is_layout_component,
@@ -30,23 +29,41 @@ class FormVariableManager(models.Manager):
 
     @transaction.atomic
     def create_for_form(self, form: "Form") -> None:
+        """
+        Create the component variables for all the steps of the form at once.
+        """
         form_steps = form.formstep_set.select_related("form_definition")
-
-        for form_step in form_steps:
-            self.create_for_formstep(form_step)
+        existing_variables = set(
+            form.formvariable_set.filter(form_definition__isnull=False).values_list(
+                "form_definition_id", "key"
+            )
+        )
+        form_variables = [
+            form_variable
+            for form_step in form_steps
+            for form_variable in self._build_for_formstep(form_step, existing_variables)
+        ]
+        self.bulk_create(form_variables)
 
     def create_for_formstep(self, form_step: "FormStep") -> list["FormVariable"]:
+        existing_variables = set(
+            form_step.form.formvariable_set.filter(
+                form_definition=form_step.form_definition
+            ).values_list("form_definition_id", "key")
+        )
+        return self.bulk_create(self._build_for_formstep(form_step, existing_variables))
+
+    def _build_for_formstep(
+        self, form_step: "FormStep", existing_variables: set[tuple[int, str]]
+    ) -> list["FormVariable"]:
         form_definition_configuration = form_step.form_definition.configuration
-        component_keys = [
+        # keys of the components inside repeating groups, these don't get a variable
+        editgrid_keys = {
             component["key"]
-            for component in iter_components(
-                configuration=form_definition_configuration, recursive=True
-            )
-        ]
-        existing_form_variables_keys = form_step.form.formvariable_set.filter(
-            key__in=component_keys,
-            form_definition=form_step.form_definition,
-        ).values_list("key", flat=True)
+            for editgrid in iter_components(configuration=form_definition_configuration)
+            if editgrid["type"] == "editgrid"
+            for component in iter_components(configuration=editgrid)
+        }
 
         form_variables = []
         for component in iter_components(
@@ -55,8 +72,9 @@ class FormVariableManager(models.Manager):
             if (
                 is_layout_component(component)
                 or component["type"] == "content"
-                or component["key"] in existing_form_variables_keys
-                or component_in_editgrid(form_definition_configuration, component)
+                or (form_step.form_definition.pk, component["key"])
+                in existing_variables
+                or component["key"] in editgrid_keys
             ):
                 continue
 
@@ -93,7 +111,7 @@ class FormVariableManager(models.Manager):
                 )
             )
 
-        return self.bulk_create(form_variables)
+        return form_variables
 
 
 class FormVariable(models.Model):
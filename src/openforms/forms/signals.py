@@ -0,0 +1,76 @@
+"""
+Invalidate the cached public representation of forms when they are edited.
+
+See :mod:`openforms.forms.cache`.
+"""
+
+from collections.abc import Callable
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from openforms.config.models import GlobalConfiguration
+
+from .cache import invalidate_all_forms, invalidate_form_definition, invalidate_forms
+from .models import Form, FormDefinition, FormLogic, FormStep, FormVariable
+
+
+def _invalidate(invalidate: Callable[[], None]) -> None:
+    # Invalidate right away, so that the rest of the transaction doesn't read the old
+    # state, and again after the commit, so that concurrent requests can't store the
+    # old state under the new version.
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+@receiver([post_save, post_delete], sender=Form)
+def invalidate_form_cache(sender, instance: Form, **kwargs):
+    _invalidate(partial(invalidate_forms, [instance.pk]))
+
+
+@receiver([post_save, post_delete], sender=FormStep)
+def invalidate_form_step_cache(sender, instance: FormStep, **kwargs):
+    _invalidate(partial(invalidate_forms, [instance.form_id]))
+
+
+@receiver([post_save, post_delete], sender=FormLogic)
+@receiver([post_save, post_delete], sender=FormVariable)
+def invalidate_form_logic_cache(sender, instance: FormLogic | FormVariable, **kwargs):
+    # not part of the public representation, but the logic check outcomes depend on
+    # them (see :mod:`openforms.submissions.logic.cache`)
+    _invalidate(partial(invalidate_forms, [instance.form_id]))
+
+
+@receiver(post_save, sender=FormDefinition)
+def invalidate_form_definition_cache(sender, instance: FormDefinition, **kwargs):
+    form_ids = list(
+        FormStep.objects.filter(form_definition=instance).values_list(
+            "form_id", flat=True
+        )
+    )
+    _invalidate(partial(invalidate_form_definition, instance.pk, form_ids))
+
+
+@receiver(post_save, sender=GlobalConfiguration)
+def invalidate_global_configuration_cache(sender, **kwargs):
+    _invalidate(invalidate_all_forms)
+
+
+# The login and payment options contain the labels and logos of the plugins, which can
+# depend on their configuration.
+PLUGIN_CONFIGURATION_APPS = (
+    "openforms.authentication.contrib.",
+    "openforms.payments.contrib.",
+    "openforms.contrib.digid_eherkenning",
+    "digid_eherkenning",
+    "mozilla_django_oidc_db",
+)
+
+
+@receiver([post_save, post_delete])
+def invalidate_plugin_configuration_cache(sender, **kwargs):
+    if not sender._meta.app_config.name.startswith(PLUGIN_CONFIGURATION_APPS):
+        return
+    _invalidate(invalidate_all_forms)
@@ -0,0 +1,127 @@
+"""
+Form submission statistics.
+
+Submissions are recorded as append-only :class:`FormSubmissionEvent` rows, which are
+cheap to insert and never block concurrent submissions (unlike incrementing a counter
+on a single row per form). A periodic task rolls the events up into the totals per
+form (:class:`FormStatistics`) and the number of submissions per form per hour
+(:class:`FormStatisticsBucket`).
+"""
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import F
+
+from .models import Form, FormStatistics, FormStatisticsBucket, FormSubmissionEvent
+
+__all__ = ["record_submission", "rollup_submission_events"]
+
+
+def record_submission(form: Form) -> None:
+    FormSubmissionEvent.objects.create(form=form, form_name=form.name)
+
+
+def get_bucket_start(timestamp: datetime) -> datetime:
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+@dataclass
+class _Aggregate:
+    form_name: str
+    count: int
+    first: datetime
+    last: datetime
+
+    def add(self, event: FormSubmissionEvent) -> None:
+        self.count += 1
+        self.first = min(self.first, event.timestamp)
+        if event.timestamp >= self.last:
+            self.last = event.timestamp
+            # the most recent name wins
+            self.form_name = event.form_name
+
+
+def _aggregate(
+    events: list[FormSubmissionEvent],
+    key: Callable[[FormSubmissionEvent], Hashable],
+) -> dict[Hashable, _Aggregate]:
+    aggregates: dict[Hashable, _Aggregate] = {}
+    for event in events:
+        if (aggregate := aggregates.get(key(event))) is not None:
+            aggregate.add(event)
+            continue
+        aggregates[key(event)] = _Aggregate(
+            form_name=event.form_name,
+            count=1,
+            first=event.timestamp,
+            last=event.timestamp,
+        )
+    return aggregates
+
+
+def _rollup(events: list[FormSubmissionEvent]) -> None:
+    totals = _aggregate(events, key=lambda event: event.form_id)
+    for form_id, aggregate in totals.items():
+        updated = FormStatistics.objects.filter(form_id=form_id).update(
+            form_name=aggregate.form_name,
+            submission_count=F("submission_count") + aggregate.count,
+            last_submission=aggregate.last,
+        )
+        if not updated:
+            FormStatistics.objects.create(
+                form_id=form_id,
+                form_name=aggregate.form_name,
+                submission_count=aggregate.count,
+                first_submission=aggregate.first,
+                last_submission=aggregate.last,
+            )
+
+    buckets = _aggregate(
+        events, key=lambda event: (event.form_id, get_bucket_start(event.timestamp))
+    )
+    for (form_id, start), aggregate in buckets.items():
+        updated = FormStatisticsBucket.objects.filter(
+            form_id=form_id, start=start
+        ).update(
+            form_name=aggregate.form_name,
+            submission_count=F("submission_count") + aggregate.count,
+        )
+        if not updated:
+            FormStatisticsBucket.objects.create(
+                form_id=form_id,
+                start=start,
+                form_name=aggregate.form_name,
+                submission_count=aggregate.count,
+            )
+
+
+def rollup_submission_events(batch_size: int = 1000) -> int:
+    """
+    Aggregate the recorded submissions into the form statistics.
+
+    The events are processed in batches, each in its own transaction. Events of forms
+    that have been deleted in the meantime are discarded.
+
+    :returns: the number of processed events.
+    """
+    num_processed = 0
+    while True:
+        with transaction.atomic():
+            events = list(
+                FormSubmissionEvent.objects.select_for_update(skip_locked=True)
+                .filter(form__isnull=False)
+                .order_by("pk")[:batch_size]
+            )
+            if not events:
+                break
+            _rollup(events)
+            FormSubmissionEvent.objects.filter(
+                pk__in=[event.pk for event in events]
+            ).delete()
+        num_processed += len(events)
+
+    FormSubmissionEvent.objects.filter(form__isnull=True).delete()
+    return num_processed
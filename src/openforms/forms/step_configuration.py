@@ -0,0 +1,98 @@
+"""
+Deliver the static part of the form step configurations separately.
+
+The configuration of a submission step is the configuration of the form definition,
+localized and then modified for the submission and the request (logic, prefill,
+component rewrites...). For large form definitions, most of it is static.
+
+Clients opting in to the ``configuration=overlay`` mode of the submission step
+endpoints receive the URL of the static (localized) configuration instead, which
+contains its revision (a content hash) and can be cached indefinitely. The responses
+only include the JSON patch (the overlay) transforming the static configuration into
+the dynamic configuration.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+
+from rest_framework.request import Request
+
+from openforms.formio.datastructures import FormioConfigurationWrapper
+from openforms.formio.typing import FormioConfiguration
+
+from .cache import get_form_definition_version, is_enabled as is_cache_enabled
+from .models import FormDefinition, FormStep
+
+__all__ = [
+    "CONFIGURATION_MODE_QUERY_PARAM",
+    "OVERLAY_MODE",
+    "StaticConfiguration",
+    "get_configuration_revision",
+    "get_static_configuration",
+    "use_configuration_overlay",
+]
+
+CONFIGURATION_MODE_QUERY_PARAM = "configuration"
+OVERLAY_MODE = "overlay"
+
+CACHE_PREFIX = "forms:step-configuration"
+
+
+@dataclass
+class StaticConfiguration:
+    revision: str
+    configuration: FormioConfiguration
+
+
+def get_configuration_revision(configuration: FormioConfiguration) -> str:
+    serialized = json.dumps(configuration, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).hexdigest()[:32]
+
+
+def use_configuration_overlay(request: Request) -> bool:
+    return request.query_params.get(CONFIGURATION_MODE_QUERY_PARAM) == OVERLAY_MODE
+
+
+def _get_static_configuration(
+    form_definition_id: int, language_code: str, translation_enabled: bool
+) -> StaticConfiguration:
+    # deferred import to avoid import cycles
+    from openforms.formio.dynamic_config import localize_configuration
+
+    # load it from the database, as the configuration of the instances in use may have
+    # been modified dynamically
+    configuration = FormDefinition.objects.values_list("configuration", flat=True).get(
+        pk=form_definition_id
+    )
+    config_wrapper = FormioConfigurationWrapper(configuration)
+    localize_configuration(config_wrapper, language_code, enabled=translation_enabled)
+    return StaticConfiguration(
+        revision=get_configuration_revision(config_wrapper.configuration),
+        configuration=config_wrapper.configuration,
+    )
+
+
+def get_static_configuration(
+    form_step: FormStep, language_code: str
+) -> StaticConfiguration:
+    """
+    Return the localized configuration of the form definition of the step.
+    """
+    translation_enabled = form_step.form.translation_enabled
+    if not is_cache_enabled():
+        return _get_static_configuration(
+            form_step.form_definition_id, language_code, translation_enabled
+        )
+
+    version = get_form_definition_version(form_step.form_definition_id)
+    key = f"{CACHE_PREFIX}:{version.token}:{language_code}:{translation_enabled}"
+    if (static_configuration := cache.get(key)) is None:
+        static_configuration = _get_static_configuration(
+            form_step.form_definition_id, language_code, translation_enabled
+        )
+        cache.set(key, static_configuration, timeout=settings.FORM_API_CACHE_TIMEOUT)
+    return static_configuration
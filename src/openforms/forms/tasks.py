@@ -7,6 +7,7 @@ from django.db.utils import IntegrityError
 from django.utils import timezone
 
 from celery import chain
+from celery_once import QueueOnce
 
 from openforms.variables.constants import FormVariableSources
 
@@ -148,3 +149,12 @@ def deactivate_forms():
 
             else:
                 transaction.on_commit(partial(logevent.form_deactivated, form))
+
+
+@app.task(base=QueueOnce, ignore_result=True, once={"graceful": True})
+def rollup_form_statistics() -> None:
+    """Aggregate the recorded form submissions into the form statistics."""
+    from .statistics import rollup_submission_events
+
+    num_processed = rollup_submission_events()
+    logger.debug("Rolled up %d form submission events", num_processed)
@@ -1,4 +1,6 @@
+import json
 import zipfile
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import patch
 
@@ -18,7 +20,7 @@ from openforms.utils.urls import build_absolute_uri
 
 from ...admin.tasks import process_forms_export, process_forms_import
 from ...models.form import Form, FormsExport
-from ..factories import FormFactory
+from ..factories import FormFactory, FormLogicFactory, FormVariableFactory
 
 
 @temp_private_root()
@@ -66,6 +68,34 @@ class ExportFormsTaskTests(TestCase):
         self.assertEqual("Forms export ready", sent_mail.subject)
         self.assertIn("test@email.nl", sent_mail.to)
 
+    def test_form_archives_contain_the_form_resources(self):
+        form1, form2 = FormFactory.create_batch(2, generate_minimal_setup=True)
+        FormLogicFactory.create(form=form1)
+        FormVariableFactory.create(form=form1, user_defined=True, key="userDefined")
+        user = SuperUserFactory.create()
+
+        process_forms_export(forms_uuids=[form1.uuid, form2.uuid], user_id=user.id)
+
+        forms_export = FormsExport.objects.get()
+        with zipfile.ZipFile(forms_export.export_content.path, "r") as archive:
+            with zipfile.ZipFile(
+                BytesIO(archive.read(f"form_{form1.slug}.zip"))
+            ) as form_archive:
+                resources = {
+                    name: json.loads(form_archive.read(name))
+                    for name in form_archive.namelist()
+                }
+
+        self.assertEqual(resources["forms.json"][0]["uuid"], str(form1.uuid))
+        self.assertEqual(len(resources["formSteps.json"]), 1)
+        self.assertEqual(len(resources["formDefinitions.json"]), 1)
+        self.assertEqual(len(resources["formLogic.json"]), 1)
+        # only the user defined variables are exported
+        self.assertEqual(
+            [variable["key"] for variable in resources["formVariables.json"]],
+            ["userDefined"],
+        )
+
 
 @temp_private_root()
 class ImportFormsTaskTests(TestCase):
@@ -0,0 +1,224 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from openforms.accounts.tests.factories import StaffUserFactory
+from openforms.config.models import GlobalConfiguration
+from openforms.payments.contrib.ogone.tests.factories import OgoneMerchantFactory
+from openforms.utils.tests.cache import clear_caches
+
+from ..api.viewsets import FormViewSet
+from .factories import FormDefinitionFactory, FormFactory, FormStepFactory
+
+
+@override_settings(FORM_API_CACHE_TIMEOUT=60)
+class FormRepresentationCacheTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.form = FormFactory.create(name="Cached form")
+        self.step = FormStepFactory.create(form=self.form)
+        self.url = reverse("api:form-detail", kwargs={"uuid_or_slug": self.form.uuid})
+
+    def test_response_can_be_revalidated(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response.headers)
+        self.assertIn("Last-Modified", response.headers)
+        self.assertIn("no-cache", response.headers["Cache-Control"])
+
+        with self.subTest("If-None-Match"):
+            revalidated = self.client.get(
+                self.url, headers={"If-None-Match": response.headers["ETag"]}
+            )
+
+            self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(revalidated.headers["ETag"], response.headers["ETag"])
+
+        with self.subTest("If-Modified-Since"):
+            revalidated = self.client.get(
+                self.url,
+                headers={"If-Modified-Since": response.headers["Last-Modified"]},
+            )
+
+            self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_cached_representation_is_reused(self):
+        self.client.get(self.url)
+
+        with patch.object(FormViewSet, "get_serializer") as mock_get_serializer:
+            response = self.client.get(self.url)
+
+        mock_get_serializer.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["name"], "Cached form")
+        self.assertEqual(len(response.json()["steps"]), 1)
+
+    def test_form_changes_invalidate_the_cache(self):
+        etag = self.client.get(self.url).headers["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.form.name = "Updated form"
+            self.form.save()
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.json()["name"], "Updated form")
+
+    def test_form_step_changes_invalidate_the_cache(self):
+        etag = self.client.get(self.url).headers["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            FormStepFactory.create(form=self.form)
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["steps"]), 2)
+
+    def test_form_definition_changes_invalidate_the_cache(self):
+        etag = self.client.get(self.url).headers["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.step.form_definition.name = "Updated step"
+            self.step.form_definition.save()
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["steps"][0]["name"], "Updated step")
+
+    def test_global_configuration_changes_invalidate_the_cache(self):
+        etag = self.client.get(self.url).headers["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config = GlobalConfiguration.get_solo()
+            config.hide_non_applicable_steps = True
+            config.save()
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["hideNonApplicableSteps"])
+
+    def test_plugin_configuration_changes_invalidate_the_cache(self):
+        etag = self.client.get(self.url).headers["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            OgoneMerchantFactory.create()
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_csp_nonce_is_inserted_per_request(self):
+        self.form.introduction_page_content = (
+            '<p>Some <span style="color: red;">styled</span> content.</p>'
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.form.save()
+        response = self.client.get(self.url, headers={"X-CSP-Nonce": "Zmlyc3Q="})
+
+        other_response = self.client.get(
+            self.url,
+            headers={"X-CSP-Nonce": "c2Vjb25k", "If-None-Match": response["ETag"]},
+        )
+
+        self.assertEqual(other_response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(other_response["ETag"], response["ETag"])
+        self.assertIn(
+            '<style nonce="Zmlyc3Q=">', response.json()["introductionPageContent"]
+        )
+        self.assertIn(
+            '<style nonce="c2Vjb25k">',
+            other_response.json()["introductionPageContent"],
+        )
+        self.assertIn("X-CSP-Nonce", response["Vary"])
+        self.assertNotIn("Last-Modified", response.headers)
+
+    def test_content_without_nonce_can_be_revalidated_across_page_loads(self):
+        self.form.introduction_page_content = "<p>Some <b>plain</b> content.</p>"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.form.save()
+        response = self.client.get(self.url, headers={"X-CSP-Nonce": "Zmlyc3Q="})
+
+        revalidated = self.client.get(
+            self.url,
+            headers={"X-CSP-Nonce": "c2Vjb25k", "If-None-Match": response["ETag"]},
+        )
+
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotIn("X-CSP-Nonce", response.get("Vary", ""))
+        self.assertIn("Last-Modified", response.headers)
+
+    def test_language_is_part_of_the_etag(self):
+        self.form.translation_enabled = True
+        with self.captureOnCommitCallbacks(execute=True):
+            self.form.save()
+        etag = self.client.get(self.url, headers={"Accept-Language": "nl"}).headers[
+            "ETag"
+        ]
+
+        response = self.client.get(
+            self.url, headers={"Accept-Language": "en", "If-None-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_staff_users_are_not_served_from_the_cache(self):
+        self.client.force_authenticate(user=StaffUserFactory.create())
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response.headers)
+
+    @override_settings(FORM_API_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response.headers)
+
+
+@override_settings(FORM_API_CACHE_TIMEOUT=60)
+class FormDefinitionConfigurationCacheTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    def test_configuration_can_be_revalidated(self):
+        definition = FormDefinitionFactory.create()
+        url = reverse(
+            "api:formdefinition-configuration", kwargs={"uuid": definition.uuid}
+        )
+        etag = self.client.get(url).headers["ETag"]
+
+        with self.subTest("unchanged"):
+            response = self.client.get(url, headers={"If-None-Match": etag})
+
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.subTest("changed"):
+            with self.captureOnCommitCallbacks(execute=True):
+                definition.configuration = {"components": []}
+                definition.save()
+
+            response = self.client.get(url, headers={"If-None-Match": etag})
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json(), {"components": []})
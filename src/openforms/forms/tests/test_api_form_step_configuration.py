@@ -0,0 +1,75 @@
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..step_configuration import get_static_configuration
+from .factories import FormStepFactory
+
+
+class StaticStepConfigurationAPITests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.form_step = FormStepFactory.create(
+            form__translation_enabled=False,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "some_field", "label": "Some field"}
+                ]
+            },
+        )
+
+    def _get_url(self, language: str, revision: str) -> str:
+        return reverse(
+            "api:form-steps-static-configuration",
+            kwargs={
+                "form_uuid_or_slug": self.form_step.form.uuid,
+                "uuid": self.form_step.uuid,
+                "language": language,
+                "revision": revision,
+            },
+        )
+
+    def test_retrieve_static_configuration(self):
+        revision = get_static_configuration(self.form_step, "nl").revision
+
+        response = self.client.get(self._get_url("nl", revision))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # the configuration is returned as-is, the keys are not camelized
+        self.assertEqual(
+            response.json()["components"][0]["key"],
+            "some_field",
+        )
+        cache_control = response["Cache-Control"]
+        self.assertIn("public", cache_control)
+        self.assertIn("immutable", cache_control)
+        self.assertIn("max-age=31536000", cache_control)
+
+    def test_unknown_revision(self):
+        response = self.client.get(self._get_url("nl", "0" * 32))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_revision_changes_with_the_form_definition(self):
+        revision = get_static_configuration(self.form_step, "nl").revision
+        form_definition = self.form_step.form_definition
+        form_definition.configuration["components"][0]["label"] = "Other label"
+        with self.captureOnCommitCallbacks(execute=True):
+            form_definition.save()
+
+        response = self.client.get(self._get_url("nl", revision))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unsupported_language(self):
+        revision = get_static_configuration(self.form_step, "nl").revision
+
+        response = self.client.get(self._get_url("xx", revision))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -53,6 +53,8 @@ class FormSerializerTests(APITestCase):
             with self.subTest(field=field):
                 self.assertIn(field, FormSerializer.Meta.fields)
 
+    # the global configuration is mocked differently for the same form
+    @override_settings(FORM_API_CACHE_TIMEOUT=0)
     def test_get_resume_link_lifetime(self):
         form1 = FormFactory.create(
             incomplete_submissions_removal_limit=7, all_submissions_removal_limit=10
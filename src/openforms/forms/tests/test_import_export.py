@@ -1202,6 +1202,60 @@ class ImportExportTests(TempdirMixin, TestCase):
         rule = FormLogic.objects.get(form__slug="old-service-fetch-config", order=0)
         self.assertEqual(rule.actions[0]["action"]["value"], "")
 
+    def test_import_large_form(self):
+        form = FormFactory.create()
+        for index in range(50):
+            FormStepFactory.create(
+                form=form,
+                form_definition__configuration={
+                    "components": [
+                        {"type": "textfield", "key": f"text{index}"},
+                        {"type": "number", "key": f"number{index}"},
+                        {
+                            "type": "editgrid",
+                            "key": f"repeatingGroup{index}",
+                            "components": [
+                                {"type": "textfield", "key": f"nested{index}"}
+                            ],
+                        },
+                    ]
+                },
+            )
+        FormVariableFactory.create(form=form, user_defined=True, key="userDefined")
+        FormLogicFactory.create_batch(
+            3,
+            form=form,
+            json_logic_trigger={"==": [{"var": "text0"}, "trigger"]},
+            actions=[{"action": {"type": "disable-next"}}],
+        )
+        call_command("export", form.pk, self.filepath)
+
+        with patch.object(
+            FormVariable.objects,
+            "create_for_form",
+            wraps=FormVariable.objects.create_for_form,
+        ) as mock_create_for_form:
+            call_command("import", import_file=self.filepath)
+
+        mock_create_for_form.assert_called_once()
+        imported_form = Form.objects.exclude(pk=form.pk).get()
+        self.assertEqual(imported_form.formstep_set.count(), 50)
+        self.assertEqual(
+            imported_form.formvariable_set.filter(
+                source=FormVariableSources.component
+            ).count(),
+            150,
+        )
+        self.assertFalse(
+            imported_form.formvariable_set.filter(key__startswith="nested").exists()
+        )
+        self.assertTrue(
+            imported_form.formvariable_set.filter(
+                source=FormVariableSources.user_defined, key="userDefined"
+            ).exists()
+        )
+        self.assertEqual(imported_form.formlogic_set.count(), 3)
+
     @tag("gh-3964")
     def test_import_form_with_old_simple_conditionals_with_numbers(self):
         """
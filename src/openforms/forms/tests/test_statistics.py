@@ -1,6 +1,7 @@
 import datetime
 from unittest.mock import patch
 
+from django.test import TestCase
 from django.utils import timezone
 
 from freezegun import freeze_time
@@ -14,7 +15,13 @@ from openforms.submissions.tasks import retry_processing_submissions
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.submissions.tests.mixins import SubmissionsMixin
 
-from ..models.form_statistics import FormStatistics
+from ..models.form_statistics import (
+    FormStatistics,
+    FormStatisticsBucket,
+    FormSubmissionEvent,
+)
+from ..statistics import record_submission, rollup_submission_events
+from ..tasks import rollup_form_statistics
 
 
 class FormStatisticsTests(SubmissionsMixin, APITestCase):
@@ -28,6 +35,10 @@ class FormStatisticsTests(SubmissionsMixin, APITestCase):
 
         response = self.client.post(endpoint, {"privacy_policy_accepted": True})
 
+        # the statistics are updated asynchronously
+        self.assertFalse(FormStatistics.objects.exists())
+        rollup_form_statistics()
+
         form_statistics = FormStatistics.objects.get()
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -62,6 +73,7 @@ class FormStatisticsTests(SubmissionsMixin, APITestCase):
             )
 
             response = self.client.post(endpoint, {"privacy_policy_accepted": True})
+            rollup_form_statistics()
 
             form_statistics = FormStatistics.objects.get()
 
@@ -102,6 +114,7 @@ class FormStatisticsTests(SubmissionsMixin, APITestCase):
 
             frozen_datetime.tick(delta=datetime.timedelta(minutes=10))
             retry_processing_submissions()
+            rollup_form_statistics()
 
             form_statistics = FormStatistics.objects.get()
 
@@ -110,3 +123,67 @@ class FormStatisticsTests(SubmissionsMixin, APITestCase):
 
         self.assertEqual(form_statistics.form, form)
         self.assertEqual(form_statistics.submission_count, 1)
+
+
+class FormStatisticsRollupTests(TestCase):
+    def test_submissions_rolled_up_per_hour(self):
+        form = FormFactory.create(name="Form 1")
+        other_form = FormFactory.create(name="Form 2")
+        with freeze_time("2024-10-01T10:15:00+00:00") as frozen_datetime:
+            record_submission(form)
+            record_submission(other_form)
+            frozen_datetime.tick(delta=datetime.timedelta(minutes=30))
+            record_submission(form)
+            frozen_datetime.tick(delta=datetime.timedelta(minutes=30))
+            form.name = "Form 1 renamed"
+            record_submission(form)
+
+        num_processed = rollup_submission_events(batch_size=2)
+
+        self.assertEqual(num_processed, 4)
+        self.assertFalse(FormSubmissionEvent.objects.exists())
+
+        form_statistics = FormStatistics.objects.get(form=form)
+        self.assertEqual(form_statistics.form_name, "Form 1 renamed")
+        self.assertEqual(form_statistics.submission_count, 3)
+        self.assertEqual(
+            form_statistics.first_submission,
+            datetime.datetime(2024, 10, 1, 10, 15, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(
+            form_statistics.last_submission,
+            datetime.datetime(2024, 10, 1, 11, 15, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(
+            FormStatistics.objects.get(form=other_form).submission_count, 1
+        )
+
+        buckets = FormStatisticsBucket.objects.filter(form=form).order_by("start")
+        self.assertQuerySetEqual(
+            buckets.values_list("start", "submission_count"),
+            [
+                (datetime.datetime(2024, 10, 1, 10, tzinfo=datetime.timezone.utc), 2),
+                (datetime.datetime(2024, 10, 1, 11, tzinfo=datetime.timezone.utc), 1),
+            ],
+        )
+
+    def test_rollup_adds_to_existing_counts(self):
+        form = FormFactory.create()
+        with freeze_time("2024-10-01T10:15:00+00:00"):
+            record_submission(form)
+            rollup_submission_events()
+            record_submission(form)
+            rollup_submission_events()
+
+        self.assertEqual(FormStatistics.objects.get().submission_count, 2)
+        self.assertEqual(FormStatisticsBucket.objects.get().submission_count, 2)
+
+    def test_events_of_deleted_forms_are_discarded(self):
+        form = FormFactory.create()
+        record_submission(form)
+        form.delete()
+
+        rollup_submission_events()
+
+        self.assertFalse(FormSubmissionEvent.objects.exists())
+        self.assertFalse(FormStatistics.objects.exists())
@@ -0,0 +1,45 @@
+from django.test import TestCase, override_settings
+
+from openforms.utils.tests.cache import clear_caches
+
+from ...form_variables import get_form_variables
+from ..factories import FormFactory, FormVariableFactory
+
+
+class FormVariablesCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.form = FormFactory.create()
+        FormVariableFactory.create(form=self.form, key="var1", user_defined=True)
+
+    def test_form_variables_are_cached(self):
+        get_form_variables(self.form)
+
+        with self.assertNumQueries(0):
+            form_variables = get_form_variables(self.form)
+
+        self.assertEqual([variable.key for variable in form_variables], ["var1"])
+        self.assertIs(form_variables[0].form, self.form)
+
+    def test_bulk_update_invalidates_the_cache(self):
+        get_form_variables(self.form)
+
+        # the variables bulk update endpoint replaces the variables
+        with self.captureOnCommitCallbacks(execute=True):
+            self.form.formvariable_set.all().delete()
+            FormVariableFactory.create(form=self.form, key="var2", user_defined=True)
+
+        form_variables = get_form_variables(self.form)
+
+        self.assertEqual([variable.key for variable in form_variables], ["var2"])
+
+    @override_settings(FORM_API_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        get_form_variables(self.form)
+
+        with self.assertNumQueries(1):
+            get_form_variables(self.form)
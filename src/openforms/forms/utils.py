@@ -3,12 +3,15 @@ import logging
 import random
 import string
 import zipfile
+from collections.abc import Iterable
+from io import BytesIO
 from typing import Any
 from uuid import uuid4
 
 from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
+from django.db.models import Prefetch, QuerySet
 from django.utils import timezone
 from django.utils.translation import override
 
@@ -67,30 +70,47 @@ def to_json(obj: Any):
     return json.dumps(obj, cls=DjangoJSONEncoder)
 
 
-def form_to_json(form_id: int) -> dict:
-    form = Form.objects.get(pk=form_id)
-
-    # Ignore products in the export
-    form.product = None
-
-    form_steps = FormStep.objects.filter(form__pk=form_id).select_related(
-        "form_definition"
+def get_export_queryset() -> QuerySet[Form]:
+    """
+    Return the forms queryset with everything prefetched that is required to export
+    the forms.
+    """
+    return Form.objects.prefetch_related(
+        Prefetch(
+            "formstep_set",
+            queryset=FormStep.objects.select_related("form_definition"),
+        ),
+        Prefetch(
+            "formlogic_set",
+            queryset=FormLogic.objects.select_related("trigger_from_step__form"),
+        ),
+        # Export only user defined variables
+        # The component variables should be regenerated from the form definition configuration
+        # The static variables should be created for each form
+        Prefetch(
+            "formvariable_set",
+            queryset=FormVariable.objects.filter(
+                source=FormVariableSources.user_defined
+            ).select_related("form", "form_definition"),
+            to_attr="exported_variables",
+        ),
     )
 
-    form_definitions = FormDefinition.objects.filter(
-        pk__in=form_steps.values_list("form_definition", flat=True)
-    )
 
-    form_logic = FormLogic.objects.filter(form=form)
+def serialize_form(form: Form, request=None) -> dict:
+    """
+    Serialize a form retrieved with :func:`get_export_queryset` to its export resources.
+    """
+    request = request or _get_mock_request()
 
-    # Export only user defined variables
-    # The component variables should be regenerated from the form definition configuration
-    # The static variables should be created for each form
-    form_variables = form.formvariable_set.filter(
-        source=FormVariableSources.user_defined
-    )
+    # Ignore products in the export
+    form.product = None
 
-    request = _get_mock_request()
+    form_steps = list(form.formstep_set.all())
+    form_definitions = sorted(
+        {step.form_definition.pk: step.form_definition for step in form_steps}.values(),
+        key=lambda form_definition: form_definition.pk,
+    )
 
     forms = [FormExportSerializer(instance=form, context={"request": request}).data]
     form_definitions = FormDefinitionSerializer(
@@ -102,10 +122,10 @@ def form_to_json(form_id: int) -> dict:
         instance=form_steps, many=True, context={"request": request}
     ).data
     form_logic = FormLogicSerializer(
-        instance=form_logic, many=True, context={"request": request}
+        instance=form.formlogic_set.all(), many=True, context={"request": request}
     ).data
     form_variables = FormVariableSerializer(
-        instance=form_variables, many=True, context={"request": request}
+        instance=form.exported_variables, many=True, context={"request": request}
     ).data
 
     resources = {
@@ -126,16 +146,42 @@ def form_to_json(form_id: int) -> dict:
     return resources
 
 
-def export_form(form_id, archive_name=None, response=None):
-    resources = form_to_json(form_id)
+def form_to_json(form_id: int) -> dict:
+    form = get_export_queryset().get(pk=form_id)
+    return serialize_form(form)
 
-    outfile = response or archive_name
+
+def write_form_archive(resources: dict, outfile) -> None:
     with zipfile.ZipFile(outfile, "w") as zip_file:
         for name, data in resources.items():
             zip_file.writestr(f"{name}.json", data)
+
+
+def export_form(form_id, archive_name=None, response=None):
+    resources = form_to_json(form_id)
+
+    outfile = response or archive_name
+    write_form_archive(resources, outfile)
     return outfile
 
 
+def export_forms(form_ids: Iterable[int], outfile, chunk_size: int = 100) -> None:
+    """
+    Export multiple forms into a single archive, containing one archive per form.
+
+    The forms are retrieved in chunks with their related resources prefetched in
+    bulk, and each form archive is written straight into the outer archive without
+    intermediate files.
+    """
+    request = _get_mock_request()
+    forms = get_export_queryset().filter(pk__in=form_ids).order_by("pk")
+    with zipfile.ZipFile(outfile, "w") as archive:
+        for form in forms.iterator(chunk_size=chunk_size):
+            form_archive = BytesIO()
+            write_form_archive(serialize_form(form, request=request), form_archive)
+            archive.writestr(f"form_{form.slug}.zip", form_archive.getvalue())
+
+
 @transaction.atomic
 def import_form(import_file, existing_form_instance=None):
     import_data = {}
@@ -214,6 +260,16 @@ def import_form_data(
         except KeyError:
             raise ValidationError(f"Unknown resource {resource}")
 
+        if resource in ("formVariables", "formLogic"):
+            # by now, the form resource has been created (or it was an existing one)
+            _import_in_bulk(
+                resource,
+                json.loads(data),
+                form=existing_form_instance or created_form,
+                request=request,
+            )
+            continue
+
         for entry in json.loads(data):
             if old_uuid := entry.get("uuid"):
                 entry["uuid"] = str(uuid4())
@@ -264,45 +320,8 @@ def import_form_data(
             if resource == "forms" and existing_form_instance:
                 serializer_kwargs["instance"] = existing_form_instance
 
-            if resource in ("formVariables", "formLogic"):
-                # by now, the form resource has been created (or it was an existing one)
-                _form = existing_form_instance or created_form
-                serializer_kwargs["context"].update(
-                    {
-                        "forms": {str(_form.uuid): _form},
-                        "form_definitions": {
-                            str(fd.uuid): fd
-                            for fd in FormDefinition.objects.filter(
-                                formstep__form=_form
-                            )
-                        },
-                    }
-                )
-                if "service_fetch_configuration" in entry:
-                    # The transferring between systems case is very tricky
-                    # better not import these, we don't know where this came from.
-                    # services and ids may point to different things
-                    # in different OF instances.
-                    del entry["service_fetch_configuration"]
-
-            if resource == "formLogic":
-                # by now, the form resource has been created (or it was an existing one)
-                _form = existing_form_instance or created_form
-                serializer_kwargs["context"].update(
-                    {
-                        "form_variables": FormVariableWrapper(_form),
-                        "form_steps": {
-                            form_step.uuid: form_step
-                            for form_step in _form.formstep_set.all()
-                        },
-                    }
-                )
-
             deserialized = serializer(**serializer_kwargs)
 
-            if resource == "formLogic" and "order" not in entry:
-                entry["order"] = 0
-
             try:
                 is_create = (
                     deserialized.instance is None or not deserialized.instance.pk
@@ -323,16 +342,9 @@ def import_form_data(
                     if "component_translations" in deserialized.validated_data:
                         del deserialized.validated_data["component_translations"]
 
-                if resource == "formLogic":
-                    clear_old_service_fetch_config(deserialized.validated_data)
-
                 instance = deserialized.save()
                 if resource == "forms":
                     created_form = deserialized.instance
-                if resource == "formSteps":
-                    # Once the form steps have been created, we create the component FormVariables
-                    # based on the form definition configurations.
-                    FormVariable.objects.create_for_form(created_form)
                 if resource == "formDefinitions" and is_create:
                     uuid_mapping[old_uuid] = str(instance.uuid)
 
@@ -363,6 +375,58 @@ def import_form_data(
                 else:
                     raise e
 
+        if resource == "formSteps":
+            # Once the form steps have been created, we create the component FormVariables
+            # based on the form definition configurations, in one pass for all steps.
+            FormVariable.objects.create_for_form(created_form)
+
+
+def _import_in_bulk(resource: str, entries: list[JSONObject], form: Form, request):
+    """
+    Validate all the entries of a resource up front and create them in bulk.
+
+    The variables and logic rules of a form don't have any dependants in the import
+    data, so they don't need to be saved one by one to record the UUID mapping.
+    """
+    context = {
+        "request": request,
+        "form": form,
+        "is_import": True,
+        "forms": {str(form.uuid): form},
+        "form_definitions": {
+            str(fd.uuid): fd
+            for fd in FormDefinition.objects.filter(formstep__form=form)
+        },
+    }
+    if resource == "formLogic":
+        context.update(
+            {
+                "form_variables": FormVariableWrapper(form),
+                "form_steps": {
+                    form_step.uuid: form_step for form_step in form.formstep_set.all()
+                },
+            }
+        )
+
+    for entry in entries:
+        if "uuid" in entry:
+            entry["uuid"] = str(uuid4())
+        if "service_fetch_configuration" in entry:
+            # The transferring between systems case is very tricky
+            # better not import these, we don't know where this came from.
+            # services and ids may point to different things
+            # in different OF instances.
+            del entry["service_fetch_configuration"]
+        if resource == "formLogic" and "order" not in entry:
+            entry["order"] = 0
+
+    deserialized = SERIALIZERS[resource](data=entries, many=True, context=context)
+    deserialized.is_valid(raise_exception=True)
+    if resource == "formLogic":
+        for validated_data in deserialized.validated_data:
+            clear_old_service_fetch_config(validated_data)
+    deserialized.save()
+
 
 def apply_component_conversions(configuration):
     """
@@ -0,0 +1,20 @@
+"""
+Instrumentation of the API endpoints, form logic, plugins and Celery tasks.
+
+Wrap the code to measure in a span:
+
+.. code-block:: python
+
+    from openforms import instrumentation
+
+    with instrumentation.span("registration.register_submission", plugin="email"):
+        ...
+
+The spans record the duration and the number of database queries, and are passed to
+the configured exporters (see :mod:`openforms.instrumentation.exporters`). Without
+exporters, nothing is recorded.
+"""
+
+from .spans import Span, is_enabled, span
+
+__all__ = ["Span", "is_enabled", "span"]
@@ -0,0 +1,21 @@
+from django.apps import AppConfig
+from django.core.signals import setting_changed
+
+
+class InstrumentationConfig(AppConfig):
+    name = "openforms.instrumentation"
+
+    def ready(self):
+        # load the signal receivers
+        from . import celery  # noqa
+
+        setting_changed.connect(clear_exporters_on_settings_changed)
+
+
+def clear_exporters_on_settings_changed(setting, **kwargs):
+    if setting != "INSTRUMENTATION_EXPORTERS":
+        return
+
+    from .spans import get_exporters
+
+    get_exporters.cache_clear()
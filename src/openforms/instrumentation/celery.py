@@ -0,0 +1,28 @@
+"""
+Measure the Celery tasks, through the task signals.
+"""
+
+from celery import Task
+from celery.signals import task_postrun, task_prerun
+
+from .spans import Span, span
+
+# the spans of the running tasks, by task ID
+_task_spans: dict[str, Span] = {}
+
+
+@task_prerun.connect(dispatch_uid="instrumentation.start_task_span")
+def start_task_span(task_id: str, task: Task, **kwargs) -> None:
+    task_span = span("celery.task", task=task.name)
+    if not isinstance(task_span, Span):
+        return
+    task_span.__enter__()
+    _task_spans[task_id] = task_span
+
+
+@task_postrun.connect(dispatch_uid="instrumentation.end_task_span")
+def end_task_span(task_id: str, state: str | None = None, **kwargs) -> None:
+    if (task_span := _task_spans.pop(task_id, None)) is None:
+        return
+    task_span.set_attribute("state", state or "")
+    task_span.__exit__(None, None, None)
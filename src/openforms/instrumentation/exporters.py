@@ -0,0 +1,96 @@
+"""
+Exporters of the recorded spans.
+
+Enable them with the ``INSTRUMENTATION_EXPORTERS`` setting, using the names below or
+the dotted path to a custom :class:`Exporter` subclass.
+"""
+
+import logging
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .spans import Span
+
+__all__ = [
+    "EXPORTERS",
+    "Exporter",
+    "LogExporter",
+    "OpenTelemetryExporter",
+]
+
+logger = logging.getLogger("openforms.instrumentation")
+
+
+class Exporter:
+    def on_start(self, span: Span) -> None:  # pragma: no cover
+        pass
+
+    def on_end(self, span: Span) -> None:  # pragma: no cover
+        pass
+
+
+class LogExporter(Exporter):
+    """
+    Log every span, for log-based pipelines.
+    """
+
+    def on_end(self, span: Span) -> None:
+        logger.info(
+            "%s took %.1fms (%d queries)",
+            span.name,
+            span.duration * 1000,
+            span.queries,
+            extra={
+                "span_name": span.name,
+                "span_attributes": span.attributes,
+                "span_duration": span.duration,
+                "span_queries": span.queries,
+                "span_error": repr(span.error) if span.error else None,
+            },
+        )
+
+
+class OpenTelemetryExporter(Exporter):
+    """
+    Forward the spans to the OpenTelemetry API.
+
+    Requires the ``opentelemetry-api`` package - the SDK and exporter are configured
+    through the OpenTelemetry environment variables (or instrumentation). Use this
+    exporter for metrics too (e.g. with the Prometheus exporter of the OpenTelemetry
+    collector), which aggregates the spans of all web and background processes.
+    """
+
+    def __init__(self):
+        try:
+            from opentelemetry import context, trace
+        except ImportError as exc:  # pragma: no cover
+            raise ImproperlyConfigured(
+                "The 'opentelemetry' instrumentation exporter requires the "
+                "'opentelemetry-api' package."
+            ) from exc
+
+        self._context = context
+        self._trace = trace
+        self._tracer = trace.get_tracer("openforms")
+
+    def on_start(self, span: Span) -> None:
+        otel_span = self._tracer.start_span(
+            span.name, attributes=span.attributes, start_time=span.start_time_ns
+        )
+        token = self._context.attach(self._trace.set_span_in_context(otel_span))
+        span.exporter_state[self] = (otel_span, token)
+
+    def on_end(self, span: Span) -> None:
+        otel_span, token = span.exporter_state.pop(self)
+        otel_span.set_attributes({**span.attributes, "db.query_count": span.queries})
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        otel_span.end()
+        self._context.detach(token)
+
+
+EXPORTERS = {
+    "log": "openforms.instrumentation.exporters.LogExporter",
+    "opentelemetry": "openforms.instrumentation.exporters.OpenTelemetryExporter",
+}
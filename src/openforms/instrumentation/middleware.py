@@ -0,0 +1,23 @@
+from django.http import HttpRequest
+
+from openforms.typing import RequestHandler
+
+from .spans import span
+
+
+class InstrumentationMiddleware:
+    """
+    Measure every request, labeled with the matched URL pattern.
+    """
+
+    def __init__(self, get_response: RequestHandler):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest):
+        with span("http.request", method=request.method or "") as request_span:
+            response = self.get_response(request)
+            # the URL pattern rather than the path, to keep the cardinality low
+            match = request.resolver_match
+            request_span.set_attribute("route", match.route if match else "")
+            request_span.set_attribute("status_code", response.status_code)
+        return response
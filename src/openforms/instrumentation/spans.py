@@ -0,0 +1,120 @@
+"""
+Vendor-neutral spans, measuring the duration and number of database queries.
+
+Spans are only recorded when at least one exporter is configured (see
+:mod:`openforms.instrumentation.exporters`). Otherwise, :func:`span` returns a shared
+no-op instance, so that instrumented code paths cost (close to) nothing.
+
+The attributes of a span are also used as labels of the metrics derived from them, so
+they must have a low cardinality - use identifiers like a plugin or rule ID, never
+submission references.
+"""
+
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from types import TracebackType
+from typing import Any
+
+from django.conf import settings
+from django.db import connection
+from django.utils.module_loading import import_string
+
+__all__ = ["Span", "span", "is_enabled", "get_exporters"]
+
+AttributeValue = str | int | float | bool
+
+
+class Span:
+    """
+    A recorded unit of work.
+
+    Use it as a context manager, the duration and number of queries are measured
+    between entering and exiting it.
+    """
+
+    def __init__(self, name: str, attributes: dict[str, AttributeValue]):
+        self.name = name
+        self.attributes = attributes
+        self.start_time_ns = 0
+        self.duration = 0.0
+        """
+        The duration, in seconds.
+        """
+        self.queries = 0
+        self.error: BaseException | None = None
+        self.exporter_state: dict[object, Any] = {}
+        """
+        Space for the exporters to keep track of their own state of the span.
+        """
+        self._start = 0.0
+        self._execute_wrapper = None
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def _count_query(self, execute: Callable, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self) -> "Span":
+        self.start_time_ns = time.time_ns()
+        for exporter in get_exporters():
+            exporter.on_start(self)
+        self._execute_wrapper = connection.execute_wrapper(self._count_query)
+        self._execute_wrapper.__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.duration = time.perf_counter() - self._start
+        assert self._execute_wrapper is not None
+        self._execute_wrapper.__exit__(exc_type, exc_value, traceback)
+        self.error = exc_value
+        for exporter in get_exporters():
+            exporter.on_end(self)
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+@lru_cache
+def get_exporters() -> tuple:
+    from .exporters import EXPORTERS
+
+    return tuple(
+        import_string(EXPORTERS.get(name, name))()
+        for name in settings.INSTRUMENTATION_EXPORTERS
+    )
+
+
+def is_enabled() -> bool:
+    return bool(get_exporters())
+
+
+def span(name: str, **attributes: AttributeValue) -> Span | _NoopSpan:
+    """
+    Return a span to measure the wrapped block of code with.
+
+    :arg name: the name of the span, e.g. ``registration.register_submission``.
+    :arg attributes: the (low cardinality) attributes of the span.
+    """
+    if not get_exporters():
+        return NOOP_SPAN
+    return Span(name, attributes)
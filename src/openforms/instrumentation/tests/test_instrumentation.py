@@ -0,0 +1,54 @@
+from django.contrib.auth.models import Group
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from ..spans import NOOP_SPAN, Span, span
+
+
+class SpanTests(TestCase):
+    def test_disabled_without_exporters(self):
+        with override_settings(INSTRUMENTATION_EXPORTERS=[]):
+            recorded_span = span("test.disabled", plugin="demo")
+
+        self.assertIs(recorded_span, NOOP_SPAN)
+
+    @override_settings(INSTRUMENTATION_EXPORTERS=["log"])
+    def test_duration_and_queries_are_recorded(self):
+        with self.assertLogs("openforms.instrumentation", level="INFO") as logs:
+            with span("test.queries", plugin="demo") as recorded_span:
+                list(Group.objects.all())
+                list(Group.objects.all())
+
+        assert isinstance(recorded_span, Span)
+        self.assertEqual(recorded_span.queries, 2)
+        self.assertGreater(recorded_span.duration, 0)
+        self.assertEqual(logs.records[0].span_queries, 2)
+        self.assertIsNone(logs.records[0].span_error)
+
+    @override_settings(INSTRUMENTATION_EXPORTERS=["log"])
+    def test_errors_are_recorded(self):
+        with self.assertLogs("openforms.instrumentation", level="INFO") as logs:
+            with self.assertRaises(ValueError):
+                with span("test.error"):
+                    raise ValueError("Boom")
+
+        self.assertEqual(logs.records[0].span_error, "ValueError('Boom')")
+
+    @override_settings(INSTRUMENTATION_EXPORTERS=["log"])
+    def test_log_exporter(self):
+        with self.assertLogs("openforms.instrumentation", level="INFO") as logs:
+            with span("test.logged", plugin="demo"):
+                pass
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].span_attributes, {"plugin": "demo"})
+
+    @override_settings(INSTRUMENTATION_EXPORTERS=["log"])
+    def test_requests_are_labeled_with_the_route(self):
+        with self.assertLogs("openforms.instrumentation", level="INFO") as logs:
+            self.client.get(reverse("api:form-list"))
+
+        (request_record,) = [
+            record for record in logs.records if record.span_name == "http.request"
+        ]
+        self.assertRegex(request_record.span_attributes["route"], r"forms")
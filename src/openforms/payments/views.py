@@ -20,6 +20,7 @@ from rest_framework.views import APIView
 
 from openforms.api.serializers import ExceptionSerializer
 from openforms.api.views import ERR_CONTENT_TYPE
+from openforms.instrumentation import span
 from openforms.logging import logevent
 from openforms.submissions.constants import PostSubmissionEvents
 from openforms.submissions.models import Submission
@@ -129,7 +130,8 @@ class PaymentStartView(PaymentFlowBaseView, GenericAPIView):
             submission.price,
         )
 
-        info = plugin.start_payment(request, payment)
+        with span("payment.start_payment", plugin=plugin_id):
+            info = plugin.start_payment(request, payment)
         logevent.payment_flow_start(payment, plugin)
         return Response(self.get_serializer(instance=info).data)
 
@@ -383,7 +385,8 @@ class PaymentLinkView(DetailView):
                 submission.price,
             )
 
-            info = plugin.start_payment(self.request, payment)
+            with span("payment.start_payment", plugin=plugin_id):
+                info = plugin.start_payment(self.request, payment)
             logevent.payment_flow_start(payment, plugin, from_email=True)
 
             context["url"] = info.url
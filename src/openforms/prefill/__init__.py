@@ -40,6 +40,7 @@ import elasticapm
 from glom import Path, PathAccessError, assign, glom
 from zgw_consumers.concurrent import parallel
 
+from openforms.instrumentation import span
 from openforms.plugins.exceptions import PluginNotEnabled
 from openforms.variables.constants import FormVariableSources
 
@@ -72,7 +73,8 @@ def _fetch_prefill_values(
             raise PluginNotEnabled()
 
         try:
-            values = plugin.get_prefill_values(submission, fields, identifier_role)
+            with span("prefill.get_prefill_values", plugin=plugin_id):
+                values = plugin.get_prefill_values(submission, fields, identifier_role)
         except Exception as e:
             logger.exception(f"exception in prefill plugin '{plugin_id}'")
             logevent.prefill_retrieve_failure(submission, plugin, e)
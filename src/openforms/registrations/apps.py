@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class RegistrationsConfig(AppConfig):
+    name = "openforms.registrations"
+
+    def ready(self):
+        from . import checks  # noqa
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Generic, TypedDict, TypeVar
 
@@ -73,6 +74,15 @@ class BasePlugin(Generic[OptionsT], ABC, AbstractBasePlugin):
         """
         return PreRegistrationResult()
 
+    def registration_batch(self) -> AbstractContextManager[None]:
+        """
+        Return a context manager to share resources between registrations.
+
+        Submissions registered inside the context block may re-use API clients and
+        lookup results. By default, nothing is shared.
+        """
+        return nullcontext()
+
     def get_custom_templatetags_libraries(self) -> list[str]:
         """
         Return a list of custom templatetags libraries that will be added to the 'sandboxed' Django templates backend.
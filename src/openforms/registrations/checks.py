@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+from .throttling import parse_rate
+
+
+@register()
+def check_registration_throttling(app_configs, **kwargs):
+    """
+    Check that the registration backend limits can be parsed.
+    """
+    errors = []
+
+    for backend, rate in settings.REGISTRATION_BACKEND_RATE_LIMITS.items():
+        try:
+            parse_rate(rate)
+        except ValueError as exc:
+            errors.append(
+                Error(
+                    f"Invalid rate limit for registration backend '{backend}': {exc}",
+                    hint="Check the REGISTRATION_BACKEND_RATE_LIMITS setting.",
+                    id="registrations.E001",
+                )
+            )
+
+    for backend, max_concurrency in settings.REGISTRATION_BACKEND_CONCURRENCY.items():
+        try:
+            valid = int(max_concurrency) > 0
+        except ValueError:
+            valid = False
+        if not valid:
+            errors.append(
+                Error(
+                    f"Invalid concurrency limit '{max_concurrency}' for registration "
+                    f"backend '{backend}', expected a positive number.",
+                    hint="Check the REGISTRATION_BACKEND_CONCURRENCY setting.",
+                    id="registrations.E002",
+                )
+            )
+
+    return errors
@@ -8,7 +8,7 @@ from django.utils.translation import gettext_lazy as _
 from openforms.contrib.microsoft.client import (
     MSGraphClient,
     MSGraphOptions,
-    MSGraphUploadHelper,
+    get_upload_helper,
 )
 from openforms.contrib.microsoft.exceptions import MSAuthenticationError
 from openforms.plugins.exceptions import InvalidPluginConfiguration
@@ -54,8 +54,7 @@ class MSGraphRegistration(BasePlugin):
         if not config.service:
             raise RegistrationFailed("No service configured.")
 
-        client = MSGraphClient(config.service)
-        uploader = MSGraphUploadHelper(client, options)
+        uploader = get_upload_helper(config.service, options)
 
         folder_name = self._get_folder_name(submission, options)
 
@@ -68,18 +67,23 @@ class MSGraphRegistration(BasePlugin):
         data["__metadata__"] = {"submission_language": submission.language_code}
         uploader.upload_json(data, folder_name / "data.json")
 
-        for attachment in submission.attachments.all():
-            uploader.upload_django_file(
+        attachments = [
+            (
                 attachment.content,
                 folder_name / "attachments" / attachment.get_display_name(),
             )
+            for attachment in submission.attachments.all()
+        ]
+        if attachments:
+            # the first upload creates the attachments folder
+            uploader.upload_django_file(*attachments[0])
+            uploader.upload_django_files(attachments[1:])
 
         self._set_payment(uploader, submission, folder_name)
 
     def update_payment_status(self, submission: "Submission", options: dict):
         config = MSGraphRegistrationConfig.get_solo()
-        client = MSGraphClient(config.service)
-        uploader = MSGraphUploadHelper(client, options)
+        uploader = get_upload_helper(config.service, options)
 
         folder_name = self._get_folder_name(submission, options)
         self._set_payment(uploader, submission, folder_name)
@@ -2,7 +2,7 @@ import json
 from decimal import Decimal
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils.translation import gettext as _
 
 from freezegun import freeze_time
@@ -37,6 +37,8 @@ class MockFolder:
         pass
 
 
+# the drive and root folder resolution is patched per test
+@override_settings(MS_GRAPH_DRIVE_CACHE_TIMEOUT=0)
 @temp_private_root()
 class MSGraphRegistrationBackendTests(TestCase):
     @classmethod
@@ -201,6 +203,7 @@ class MSGraphRegistrationBackendTests(TestCase):
             self.assertEqual(content, f"{_('payment received')}: € 11.35")
 
 
+@override_settings(MS_GRAPH_DRIVE_CACHE_TIMEOUT=0)
 @temp_private_root()
 @patch.object(MockFolder, "upload_file", return_value=None)
 class MSGraphRegistrationOptionsTests(TestCase):
@@ -27,8 +27,9 @@ class ObjectsAPIGroupMixin(serializers.Serializer):
         objects_api_group: ObjectsAPIGroupConfig = self.validated_data[
             "objects_api_group"
         ]
+        service = objects_api_group.catalogi_service
         return build_client(
-            objects_api_group.catalogi_service, client_factory=CatalogiClient
+            service, client_factory=CatalogiClient, service_pk=service.pk
         )
 
 
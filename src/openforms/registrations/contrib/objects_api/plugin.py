@@ -21,7 +21,7 @@ from ...registry import register
 from .config import ObjectsAPIOptionsSerializer
 from .models import ObjectsAPIConfig
 from .registration_variables import register as variables_registry
-from .submission_registration import HANDLER_MAPPING
+from .submission_registration import HANDLER_MAPPING, documents_batch
 from .typing import RegistrationOptions
 from .utils import apply_defaults_to
 
@@ -108,6 +108,10 @@ class ObjectsAPIRegistration(BasePlugin[RegistrationOptions]):
 
         return response
 
+    @override
+    def registration_batch(self):
+        return documents_batch()
+
     @override
     def check_config(self):
         check_config()
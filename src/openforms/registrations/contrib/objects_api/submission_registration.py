@@ -1,15 +1,29 @@
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Generic, Iterator, Literal, TypeVar, cast, override
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterator,
+    Literal,
+    TypeAlias,
+    TypeVar,
+    cast,
+    override,
+)
 
+from django.conf import settings
 from django.db.models import F
 
 import glom
-from glom import PathAccessError
+from zgw_consumers.concurrent import parallel
 
 from openforms.authentication.service import AuthAttribute
 from openforms.contrib.objects_api.clients import (
@@ -19,6 +33,7 @@ from openforms.contrib.objects_api.clients import (
     get_documents_client,
 )
 from openforms.contrib.objects_api.helpers import prepare_data_for_registration
+from openforms.contrib.objects_api.models import ObjectsAPIGroupConfig
 from openforms.contrib.objects_api.rendering import render_to_json
 from openforms.contrib.zgw.service import (
     DocumentOptions,
@@ -59,6 +74,8 @@ from .typing import (
 
 logger = logging.getLogger(__name__)
 
+_K = TypeVar("_K", bound=Hashable)
+
 
 def _point_coordinate(value: Any) -> dict[str, Any] | object:
     if not isinstance(value, list) or len(value) != 2:
@@ -66,20 +83,13 @@ def _point_coordinate(value: Any) -> dict[str, Any] | object:
     return {"type": "Point", "coordinates": [value[0], value[1]]}
 
 
-def _resolve_documenttype(
+def _get_documenttype_reference(
     field: Literal["submission_report", "submission_csv", "attachment"],
     options: RegistrationOptions,
-    submission: Submission,
-    catalogi_client: CatalogiClient,
-) -> str:
+) -> tuple[str, str]:
     """
-    Given the registration options, resolve the documenttype URL to use.
-
-    :arg field: for which kind of upload the document type must be resolved.
-    :return: the resolved document type URL, if any. Empty string means that the upload
-      should be skipped.
+    Extract the document type description and fixed URL reference from the options.
     """
-    catalogue = options.get("catalogue")
     match field:
         case "submission_report":
             description = options["iot_submission_report"]
@@ -92,6 +102,24 @@ def _resolve_documenttype(
             url_ref = options.get("informatieobjecttype_attachment", "")
         case _:  # pragma: no cover
             raise RuntimeError(f"Unhandled field '{field}'.")
+    return description, url_ref
+
+
+def _resolve_documenttype(
+    field: Literal["submission_report", "submission_csv", "attachment"],
+    options: RegistrationOptions,
+    submission: Submission,
+    catalogi_client: CatalogiClient,
+) -> str:
+    """
+    Given the registration options, resolve the documenttype URL to use.
+
+    :arg field: for which kind of upload the document type must be resolved.
+    :return: the resolved document type URL, if any. Empty string means that the upload
+      should be skipped.
+    """
+    catalogue = options.get("catalogue")
+    description, url_ref = _get_documenttype_reference(field, options)
 
     # descriptions only work if a catalogue is provided to look up the document type
     # inside it
@@ -125,73 +153,179 @@ def _resolve_documenttype(
     return version["url"]
 
 
+@dataclass
+class DocumentsContext:
+    """
+    Hold the API clients and memoized catalogi lookups to register documents.
+
+    The same context is re-used for all the documents of a submission, and for all
+    the submissions of the same Objects API group during a registration batch (see
+    :func:`documents_batch`).
+    """
+
+    documents_client: DocumentenClient
+    catalogi_client: CatalogiClient
+    _document_types: dict[tuple[Any, ...], str] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def resolve_documenttype(
+        self,
+        field: Literal["submission_report", "submission_csv", "attachment"],
+        options: RegistrationOptions,
+        submission: Submission,
+    ) -> str:
+        catalogue = options.get("catalogue") or {}
+        valid_on = (
+            datetime_in_amsterdam(submission.completed_on).date()
+            if submission.completed_on
+            else None
+        )
+        key = (
+            catalogue.get("domain"),
+            catalogue.get("rsin"),
+            *_get_documenttype_reference(field, options),
+            valid_on,
+        )
+        if key not in self._document_types:
+            self._document_types[key] = _resolve_documenttype(
+                field, options, submission, self.catalogi_client
+            )
+        return self._document_types[key]
+
+
+_batch_contexts: ContextVar[tuple[ExitStack, dict[int, DocumentsContext]] | None] = (
+    ContextVar("objects_api_batch_contexts", default=None)
+)
+
+
+@contextmanager
+def documents_batch() -> Iterator[None]:
+    """
+    Share the documents contexts for all registrations in the block.
+
+    The API clients (and their connection pools) and the resolved document types are
+    kept per Objects API group until the block exits.
+    """
+    if _batch_contexts.get() is not None:
+        yield
+        return
+
+    with ExitStack() as stack:
+        token = _batch_contexts.set((stack, {}))
+        try:
+            yield
+        finally:
+            _batch_contexts.reset(token)
+
+
+@contextmanager
+def get_documents_context(
+    api_group: ObjectsAPIGroupConfig,
+) -> Iterator[DocumentsContext]:
+    """
+    Provide the documents context for the API group, re-using the batch one if active.
+    """
+    if (batch := _batch_contexts.get()) is not None:
+        stack, contexts = batch
+        if api_group.pk not in contexts:
+            contexts[api_group.pk] = DocumentsContext(
+                documents_client=stack.enter_context(get_documents_client(api_group)),
+                catalogi_client=stack.enter_context(get_catalogi_client(api_group)),
+            )
+        yield contexts[api_group.pk]
+        return
+
+    with (
+        get_documents_client(api_group) as documents_client,
+        get_catalogi_client(api_group) as catalogi_client,
+    ):
+        yield DocumentsContext(
+            documents_client=documents_client, catalogi_client=catalogi_client
+        )
+
+
+DocumentUpload: TypeAlias = Callable[[], str]
+"""
+A prepared document upload, returning the URL of the created document.
+
+The callable only performs HTTP calls and storage reads, so that it can safely be
+executed in a worker thread.
+"""
+
+
 def register_submission_pdf(
     submission: Submission,
     options: RegistrationOptions,
-    documents_client: DocumentenClient,
-    catalogi_client: CatalogiClient,
-) -> str:
-    document_type = _resolve_documenttype(
-        "submission_report", options, submission, catalogi_client
+    context: DocumentsContext,
+) -> DocumentUpload | None:
+    document_type = context.resolve_documenttype(
+        "submission_report", options, submission
     )
     if not document_type:
-        return ""
+        return None
 
     submission_report = SubmissionReport.objects.get(submission=submission)
-    report_document = create_report_document(
-        client=documents_client,
-        name=submission.form.admin_name,
-        submission_report=submission_report,
-        options={
-            "informatieobjecttype": document_type,
-            "organisatie_rsin": options.get("organisatie_rsin", ""),
-        },
-        language=submission_report.submission.language_code,
-    )
-    return report_document["url"]
+    name = submission.form.admin_name
+    language = submission.language_code
+
+    def upload() -> str:
+        report_document = create_report_document(
+            client=context.documents_client,
+            name=name,
+            submission_report=submission_report,
+            options={
+                "informatieobjecttype": document_type,
+                "organisatie_rsin": options.get("organisatie_rsin", ""),
+            },
+            language=language,
+        )
+        return report_document["url"]
+
+    return upload
 
 
 def register_submission_csv(
     submission: Submission,
     options: RegistrationOptions,
-    documents_client: DocumentenClient,
-    catalogi_client: CatalogiClient,
-) -> str:
+    context: DocumentsContext,
+) -> DocumentUpload | None:
     if not options.get("upload_submission_csv", False):
-        return ""
+        return None
 
-    document_type = _resolve_documenttype(
-        "submission_csv", options, submission, catalogi_client
-    )
+    document_type = context.resolve_documenttype("submission_csv", options, submission)
     if not document_type:
-        return ""
+        return None
 
     qs = Submission.objects.filter(pk=submission.pk).select_related("auth_info")
     submission_csv = create_submission_export(qs).export("csv")
+    name = f"{submission.form.admin_name} (csv)"
+    language = submission.language_code
+
+    def upload() -> str:
+        submission_csv_document = create_csv_document(
+            client=context.documents_client,
+            name=name,
+            csv_data=submission_csv,
+            options={
+                "informatieobjecttype": document_type,
+                "organisatie_rsin": options.get("organisatie_rsin", ""),
+            },
+            language=language,
+        )
+        return submission_csv_document["url"]
 
-    submission_csv_document = create_csv_document(
-        client=documents_client,
-        name=f"{submission.form.admin_name} (csv)",
-        csv_data=submission_csv,
-        options={
-            "informatieobjecttype": document_type,
-            "organisatie_rsin": options.get("organisatie_rsin", ""),
-        },
-        language=submission.language_code,
-    )
-
-    return submission_csv_document["url"]
+    return upload
 
 
 def register_submission_attachment(
     submission: Submission,
     attachment: SubmissionFileAttachment,
     options: RegistrationOptions,
-    documents_client: DocumentenClient,
-    catalogi_client: CatalogiClient,
-) -> str:
-    default_document_type = _resolve_documenttype(
-        "attachment", options, submission, catalogi_client
+    context: DocumentsContext,
+) -> DocumentUpload:
+    default_document_type = context.resolve_documenttype(
+        "attachment", options, submission
     )
     assert default_document_type, "Registration should have been skipped"
 
@@ -218,15 +352,22 @@ def register_submission_attachment(
     if document_type := attachment.informatieobjecttype:
         document_options["informatieobjecttype"] = document_type
 
-    attachment_document = create_attachment_document(
-        client=documents_client,
-        name=submission.form.admin_name,
-        submission_attachment=attachment,
-        options=document_options,
-        language=attachment.submission_step.submission.language_code,  # assume same as submission
-    )
+    name = submission.form.admin_name
+    language = (
+        attachment.submission_step.submission.language_code
+    )  # assume same as submission
+
+    def upload() -> str:
+        attachment_document = create_attachment_document(
+            client=context.documents_client,
+            name=name,
+            submission_attachment=attachment,
+            options=document_options,
+            language=language,
+        )
+        return attachment_document["url"]
 
-    return attachment_document["url"]
+    return upload
 
 
 @contextmanager
@@ -245,6 +386,32 @@ def save_and_raise(
         ObjectsAPISubmissionAttachment.objects.bulk_create(submission_attachments)
 
 
+def run_uploads(uploads: dict[_K, DocumentUpload]) -> Iterator[tuple[_K, str]]:
+    """
+    Execute the prepared document uploads concurrently.
+
+    All uploads are attempted, even if some of them fail. The successful results are
+    yielded first, after which the first encountered error (if any) is re-raised. This
+    allows the caller to persist the partial progress.
+    """
+    if not uploads:
+        return
+
+    max_workers = min(len(uploads), settings.OBJECTS_API_DOCUMENT_UPLOAD_WORKERS)
+    with parallel(max_workers=max_workers) as executor:
+        futures = {key: executor.submit(upload) for key, upload in uploads.items()}
+
+    error: BaseException | None = None
+    for key, future in futures.items():
+        if (exc := future.exception()) is not None:
+            error = error or exc
+            continue
+        yield key, future.result()
+
+    if error is not None:
+        raise error
+
+
 OptionsT = TypeVar(
     "OptionsT", RegistrationOptionsV1, RegistrationOptionsV2, contravariant=True
 )
@@ -288,46 +455,50 @@ class ObjectsAPIRegistrationHandler(ABC, Generic[OptionsT]):
         api_group = options["objects_api_group"]
 
         with (
-            get_documents_client(api_group) as documents_client,
-            get_catalogi_client(api_group) as catalogi_client,
+            get_documents_context(api_group) as context,
             save_and_raise(registration_data, submission_attachments),
         ):
-            if not registration_data.pdf_url:
-                registration_data.pdf_url = register_submission_pdf(
-                    submission,
-                    options,
-                    documents_client,
-                    catalogi_client,
-                )
+            # Prepare the uploads in the current thread - these may perform database
+            # queries and catalogi lookups. The actual uploads are done concurrently.
+            uploads: dict[str | SubmissionFileAttachment, DocumentUpload] = {}
 
-            if not registration_data.csv_url:
-                registration_data.csv_url = register_submission_csv(
-                    submission,
-                    options,
-                    documents_client,
-                    catalogi_client,
-                )
+            if not registration_data.pdf_url and (
+                upload := register_submission_pdf(submission, options, context)
+            ):
+                uploads["pdf_url"] = upload
+
+            if not registration_data.csv_url and (
+                upload := register_submission_csv(submission, options, context)
+            ):
+                uploads["csv_url"] = upload
 
             if _is_attachment_document_type_configured:
-                existing = [
-                    o.submission_file_attachment
+                existing = {
+                    o.submission_file_attachment_id
                     for o in ObjectsAPISubmissionAttachment.objects.filter(
                         submission_file_attachment__submission_step__submission=submission
                     )
-                ]
+                }
 
-                for attachment in submission.attachments:
-                    if attachment not in existing:
-                        document_url = register_submission_attachment(
+                for attachment in submission.attachments.select_related(
+                    "submission_step__submission"
+                ):
+                    if attachment.pk not in existing:
+                        uploads[attachment] = register_submission_attachment(
                             submission,
                             attachment,
                             options,
-                            documents_client,
-                            catalogi_client,
+                            context,
                         )
+
+            for key, document_url in run_uploads(uploads):
+                match key:
+                    case "pdf_url" | "csv_url":
+                        setattr(registration_data, key, document_url)
+                    case SubmissionFileAttachment():
                         submission_attachments.append(
                             ObjectsAPISubmissionAttachment(
-                                submission_file_attachment=attachment,
+                                submission_file_attachment=key,
                                 document_url=document_url,
                             )
                         )
@@ -537,7 +708,7 @@ class ObjectsAPIV2Handler(ObjectsAPIRegistrationHandler[RegistrationOptionsV2]):
         for key, variable in state.variables.items():
             try:
                 submission_value = dynamic_values[key]
-            except PathAccessError:
+            except KeyError:
                 continue
 
             # special casing documents - we transform the formio file upload data into
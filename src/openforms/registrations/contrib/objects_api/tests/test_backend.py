@@ -26,6 +26,7 @@ from openforms.submissions.tests.factories import (
     SubmissionFileAttachmentFactory,
     SubmissionStepFactory,
 )
+from openforms.utils.tests.concurrent import mock_parallel_executor
 from openforms.utils.tests.feature_flags import enable_feature_flag
 from openforms.utils.tests.vcr import OFVCRMixin
 
@@ -241,6 +242,8 @@ class ObjectsAPIBackendVCRTests(OFVCRMixin, TestCase):
 
     def setUp(self):
         super().setUp()
+        # keep the order of the (recorded) document uploads deterministic
+        self.enterContext(mock_parallel_executor())
 
         config_patcher = patch(
             "openforms.registrations.contrib.objects_api.models.ObjectsAPIConfig.get_solo",
@@ -15,6 +15,7 @@ from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionFileAttachmentFactory,
 )
+from openforms.utils.tests.concurrent import mock_parallel_executor
 from openforms.utils.tests.vcr import OFVCRMixin
 
 from ....constants import RegistrationAttribute
@@ -37,6 +38,8 @@ class ObjectsAPIBackendV1Tests(OFVCRMixin, TestCase):
 
     def setUp(self):
         super().setUp()
+        # keep the order of the (recorded) document uploads deterministic
+        self.enterContext(mock_parallel_executor())
 
         config = ObjectsAPIConfig(
             productaanvraag_type="terugbelnotitie",
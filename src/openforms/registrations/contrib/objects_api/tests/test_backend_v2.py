@@ -17,6 +17,7 @@ from openforms.submissions.tests.factories import (
     SubmissionFileAttachmentFactory,
     SubmissionValueVariableFactory,
 )
+from openforms.utils.tests.concurrent import mock_parallel_executor
 from openforms.utils.tests.vcr import OFVCRMixin
 
 from ..models import ObjectsAPIConfig, ObjectsAPIRegistrationData
@@ -40,6 +41,8 @@ class ObjectsAPIBackendV2Tests(OFVCRMixin, TestCase):
 
     def setUp(self):
         super().setUp()
+        # keep the order of the (recorded) document uploads deterministic
+        self.enterContext(mock_parallel_executor())
 
         config_patcher = patch(
             "openforms.registrations.contrib.objects_api.models.ObjectsAPIConfig.get_solo",
@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from openforms.contrib.objects_api.models import ObjectsAPIGroupConfig
+from openforms.submissions.models import Submission
+
+from ..submission_registration import (
+    DocumentsContext,
+    documents_batch,
+    get_documents_context,
+    run_uploads,
+)
+
+
+@override_settings(OBJECTS_API_DOCUMENT_UPLOAD_WORKERS=2)
+class RunUploadsTests(SimpleTestCase):
+    def test_all_uploads_succeed(self):
+        uploads = {
+            "pdf_url": lambda: "https://documenten.nl/1",
+            "csv_url": lambda: "https://documenten.nl/2",
+            "attachment": lambda: "https://documenten.nl/3",
+        }
+
+        results = dict(run_uploads(uploads))
+
+        self.assertEqual(
+            results,
+            {
+                "pdf_url": "https://documenten.nl/1",
+                "csv_url": "https://documenten.nl/2",
+                "attachment": "https://documenten.nl/3",
+            },
+        )
+
+    def test_failing_upload_does_not_prevent_others(self):
+        def fail():
+            raise RuntimeError("upload failed")
+
+        uploads = {
+            "pdf_url": lambda: "https://documenten.nl/1",
+            "csv_url": fail,
+            "attachment": lambda: "https://documenten.nl/3",
+        }
+        results = {}
+
+        with self.assertRaisesMessage(RuntimeError, "upload failed"):
+            for key, url in run_uploads(uploads):
+                results[key] = url
+
+        self.assertEqual(
+            results,
+            {
+                "pdf_url": "https://documenten.nl/1",
+                "attachment": "https://documenten.nl/3",
+            },
+        )
+
+
+class DocumentsContextTests(SimpleTestCase):
+    def test_document_type_resolved_once(self):
+        catalogi_client = MagicMock()
+        catalogi_client.find_catalogus.return_value = {"url": "https://catalogi.nl/1"}
+        catalogi_client.find_informatieobjecttypen.return_value = [
+            {"url": "https://catalogi.nl/iotypen/1"}
+        ]
+        context = DocumentsContext(
+            documents_client=MagicMock(), catalogi_client=catalogi_client
+        )
+        submission = Submission(
+            completed_on=datetime(2024, 10, 1, 12, 0, tzinfo=timezone.utc)
+        )
+        options = {
+            "catalogue": {"domain": "TEST", "rsin": "000000000"},
+            "iot_attachment": "Attachment",
+        }
+
+        for _ in range(3):
+            document_type = context.resolve_documenttype(
+                "attachment", options, submission  # type: ignore
+            )
+
+        self.assertEqual(document_type, "https://catalogi.nl/iotypen/1")
+        catalogi_client.find_catalogus.assert_called_once()
+        catalogi_client.find_informatieobjecttypen.assert_called_once()
+
+    @patch(
+        "openforms.registrations.contrib.objects_api.submission_registration.get_catalogi_client"
+    )
+    @patch(
+        "openforms.registrations.contrib.objects_api.submission_registration.get_documents_client"
+    )
+    def test_batch_reuses_context_per_api_group(
+        self, mock_get_documents_client, mock_get_catalogi_client
+    ):
+        group_1 = ObjectsAPIGroupConfig(pk=1)
+        group_2 = ObjectsAPIGroupConfig(pk=2)
+
+        with documents_batch():
+            with get_documents_context(group_1) as context_1:
+                pass
+            with get_documents_context(group_1) as context_1_again:
+                pass
+            with get_documents_context(group_2) as context_2:
+                pass
+
+        self.assertIs(context_1, context_1_again)
+        self.assertIsNot(context_1, context_2)
+        self.assertEqual(mock_get_documents_client.call_count, 2)
+        self.assertEqual(mock_get_catalogi_client.call_count, 2)
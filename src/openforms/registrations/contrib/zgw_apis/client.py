@@ -35,4 +35,4 @@ def get_documents_client(config: ZGWApiGroupConfig) -> DocumentenClient:
 def get_catalogi_client(config: ZGWApiGroupConfig) -> CatalogiClient:
     if not (service := config.ztc_service):
         raise NoServiceConfigured("No Catalogi API service configured!")
-    return build_client(service, client_factory=CatalogiClient)
+    return build_client(service, client_factory=CatalogiClient, service_pk=service.pk)
@@ -36,6 +36,8 @@ from .factories import ZGWApiGroupConfigFactory
 TEST_FILES = Path(__file__).parent.resolve() / "files"
 
 
+# the tests count the (mocked) requests to the APIs
+@override_settings(ZGW_CATALOGI_CACHE_TIMEOUT=0)
 @temp_private_root()
 @requests_mock.Mocker(real_http=False)
 class ZGWBackendTests(TestCase):
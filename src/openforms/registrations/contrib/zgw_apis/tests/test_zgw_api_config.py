@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 import requests_mock
 from privates.test import temp_private_root
@@ -17,6 +17,8 @@ from ..typing import RegistrationOptions
 from .factories import ZGWApiGroupConfigFactory
 
 
+# the tests count the (mocked) requests to the APIs
+@override_settings(ZGW_CATALOGI_CACHE_TIMEOUT=0)
 @temp_private_root()
 @requests_mock.Mocker()
 class ZGWRegistrationMultipleZGWAPIsTests(TestCase):
@@ -0,0 +1,128 @@
+from datetime import date
+from typing import Callable
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from openforms.contrib.objects_api.clients import (
+    get_catalogi_client as get_objects_api_catalogi_client,
+)
+from openforms.contrib.zgw.cache import invalidate_catalogi_cache
+from openforms.contrib.zgw.clients import CatalogiClient
+from openforms.forms.models import FormRegistrationBackend
+from openforms.utils.date import datetime_in_amsterdam
+
+from ...base import BasePlugin
+from ...contrib.objects_api.plugin import ObjectsAPIRegistration
+from ...contrib.objects_api.utils import apply_defaults_to
+from ...contrib.zgw_apis.client import get_catalogi_client as get_zgw_catalogi_client
+from ...contrib.zgw_apis.plugin import ZGWRegistration
+from ...registry import register
+
+Warmer = Callable[[dict, date], None]
+
+
+def warm_case_type(client: CatalogiClient, zaaktype: str) -> None:
+    client.list_statustypen(zaaktype)
+    client.list_roltypen(zaaktype)
+    client.list_roltypen(zaaktype, omschrijving_generiek="initiator")
+    client.list_eigenschappen(zaaktype)
+
+
+def warm_zgw_apis(options: dict, valid_on: date) -> None:
+    zgw = options["zgw_api_group"]
+    zgw.apply_defaults_to(options)
+
+    with get_zgw_catalogi_client(zgw) as client:
+        case_types: list[str] = []
+        if (case_type_identification := options.get("case_type_identification")) and (
+            catalogue := options.get("catalogue")
+        ):
+            if catalogus := client.find_catalogus(**catalogue):
+                versions = client.find_case_types(
+                    catalogus=catalogus["url"],
+                    identification=case_type_identification,
+                    valid_on=valid_on,
+                )
+                case_types += [version["url"] for version in versions or []]
+        elif zaaktype := options.get("zaaktype"):
+            case_types.append(zaaktype)
+
+        for zaaktype in case_types:
+            warm_case_type(client, zaaktype)
+
+
+def warm_objects_api(options: dict, valid_on: date) -> None:
+    api_group = options["objects_api_group"]
+    apply_defaults_to(api_group, options)
+    if not (catalogue := options.get("catalogue")):
+        return
+
+    with get_objects_api_catalogi_client(api_group) as client:
+        if not (catalogus := client.find_catalogus(**catalogue)):
+            return
+        for option in ("iot_submission_report", "iot_submission_csv", "iot_attachment"):
+            if description := options.get(option):
+                client.find_informatieobjecttypen(
+                    catalogus=catalogus["url"],
+                    description=description,
+                    valid_on=valid_on,
+                )
+
+
+WARMERS: dict[type[BasePlugin], Warmer] = {
+    ZGWRegistration: warm_zgw_apis,
+    ObjectsAPIRegistration: warm_objects_api,
+}
+
+
+def get_warmers() -> dict[str, Warmer]:
+    """
+    Map the identifiers of the registered plugins to their cache warmer.
+    """
+    return {
+        plugin.identifier: WARMERS[type(plugin)]
+        for plugin in register
+        if type(plugin) in WARMERS
+    }
+
+
+class Command(BaseCommand):
+    help = "Preload the Catalogi API cache with the resources used by live forms."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Invalidate the existing cache entries before warming the cache.",
+        )
+
+    def handle(self, **options):
+        if options["clear"]:
+            invalidate_catalogi_cache()
+            self.stdout.write("Invalidated the Catalogi API cache.")
+
+        valid_on = datetime_in_amsterdam(timezone.now()).date()
+        warmers = get_warmers()
+        backends = FormRegistrationBackend.objects.filter(
+            form__active=True,
+            form___is_deleted=False,
+            backend__in=warmers.keys(),
+        ).select_related("form")
+
+        for backend in backends:
+            plugin = register[backend.backend]
+            serializer = plugin.configuration_options(
+                data=backend.options,
+                context={"validate_business_logic": False},
+            )
+            if not serializer.is_valid():
+                self.stderr.write(f"Skipping {backend}: invalid options.")
+                continue
+
+            try:
+                warmers[backend.backend](serializer.validated_data, valid_on)
+            except Exception as exc:
+                self.stderr.write(f"Warming the cache for {backend} failed: {exc}")
+            else:
+                self.stdout.write(f"Warmed the cache for {backend}.")
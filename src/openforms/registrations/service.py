@@ -1,11 +1,15 @@
 import logging
+from contextlib import ExitStack, contextmanager
+from typing import Iterator
 
 from openforms.submissions.models import Submission
 
 from .base import BasePlugin
+from .registry import register
 
 __all__ = [
     "get_registration_plugin",
+    "registration_batch",
 ]
 
 logger = logging.getLogger(__name__)
@@ -19,3 +23,16 @@ def get_registration_plugin(submission: Submission) -> BasePlugin | None:
 
     registry = backend._meta.get_field("backend").registry
     return registry[backend.backend]
+
+
+@contextmanager
+def registration_batch() -> Iterator[None]:
+    """
+    Share the plugin resources for all the registrations performed in the block.
+
+    See :meth:`openforms.registrations.base.BasePlugin.registration_batch`.
+    """
+    with ExitStack() as stack:
+        for plugin in register:
+            stack.enter_context(plugin.registration_batch())
+        yield
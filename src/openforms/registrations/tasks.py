@@ -1,6 +1,7 @@
 import logging
 import traceback
 from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
 from django.db import transaction
 from django.utils import timezone
@@ -11,6 +12,7 @@ from rest_framework.exceptions import ValidationError
 
 from openforms.celery import app
 from openforms.config.models import GlobalConfiguration
+from openforms.instrumentation import span
 from openforms.logging import logevent
 from openforms.submissions.constants import PostSubmissionEvents, RegistrationStatuses
 from openforms.submissions.models import Submission
@@ -18,6 +20,10 @@ from openforms.submissions.public_references import set_submission_reference
 
 from .exceptions import RegistrationFailed
 from .service import get_registration_plugin
+from .throttling import RegistrationThrottled, throttle_registration
+
+if TYPE_CHECKING:
+    from openforms.forms.models import FormRegistrationBackend
 
 logger = logging.getLogger(__name__)
 
@@ -133,10 +139,13 @@ def pre_registration(submission_id: int, event: PostSubmissionEvents) -> None:
 
 @app.task(
     base=QueueOnce,
+    bind=True,
     ignore_result=False,
     once={"graceful": True},  # do not spam error monitoring
 )
-def register_submission(submission_id: int, event: PostSubmissionEvents | str) -> None:
+def register_submission(
+    task, submission_id: int, event: PostSubmissionEvents | str
+) -> None:
     """
     Attempt to register the submission with the configured backend.
 
@@ -153,10 +162,41 @@ def register_submission(submission_id: int, event: PostSubmissionEvents | str) -
 
     Submission registration is only executed for "completed" forms, and is delegated
     to the underlying registration backend (if set).
+
+    The concurrency and rate limits configured for the registration backend are
+    applied, see :mod:`openforms.registrations.throttling`. Throttled registrations are
+    retried later.
     """
     submission = Submission.objects.select_related("auth_info", "form").get(
         id=submission_id
     )
+    backend_config = submission.registration_backend
+
+    if not backend_config:
+        _register_submission(submission, event, backend_config)
+        return
+
+    try:
+        with throttle_registration(backend_config.backend):
+            _register_submission(submission, event, backend_config)
+    except RegistrationThrottled as exc:
+        # eager execution (batched retries) does not support delayed retries, the
+        # caller reschedules the registration instead
+        if task.request.is_eager:
+            raise
+        logger.info(
+            "Registration of submission '%s' is throttled, retrying in %ss",
+            submission,
+            exc.countdown,
+        )
+        raise task.retry(exc=exc, countdown=exc.countdown, max_retries=None)
+
+
+def _register_submission(
+    submission: Submission,
+    event: PostSubmissionEvents | str,
+    backend_config: "FormRegistrationBackend | None",
+) -> None:
     logger.debug("Register submission '%s'", submission)
 
     if submission.registration_status == RegistrationStatuses.success:
@@ -222,7 +262,6 @@ def register_submission(submission_id: int, event: PostSubmissionEvents | str) -
 
     # figure out which registry and backend to use from the model field used
     form = submission.form
-    backend_config = submission.registration_backend
 
     if not backend_config or not backend_config.backend:
         logger.info("Form %s has no registration plugin configured, aborting", form)
@@ -274,9 +313,10 @@ def register_submission(submission_id: int, event: PostSubmissionEvents | str) -
     logger.debug("Invoking the '%r' plugin callback", plugin)
 
     try:
-        result = plugin.register_submission(
-            submission, options_serializer.validated_data
-        )
+        with span("registration.register_submission", plugin=plugin.identifier):
+            result = plugin.register_submission(
+                submission, options_serializer.validated_data
+            )
     except RegistrationFailed as exc:
         logger.warning(
             "Registration using plugin '%r' for submission '%s' failed",
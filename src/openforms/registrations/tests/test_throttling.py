@@ -0,0 +1,133 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from freezegun import freeze_time
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..checks import check_registration_throttling
+from ..throttling import RegistrationThrottled, parse_rate, throttle_registration
+
+
+class ThrottleRegistrationTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("10/s"), (10, 1))
+        self.assertEqual(parse_rate("30/m"), (30, 60))
+        self.assertEqual(parse_rate("100/hour"), (100, 3600))
+
+        with self.assertRaises(ValueError):
+            parse_rate("10/d")
+        with self.assertRaises(ValueError):
+            parse_rate("10")
+
+    @override_settings(
+        REGISTRATION_BACKEND_CONCURRENCY={},
+        REGISTRATION_BACKEND_RATE_LIMITS={},
+    )
+    def test_no_limits_configured(self):
+        for _ in range(10):
+            with throttle_registration("stuf-zds-create-zaak"):
+                pass
+
+    @override_settings(
+        REGISTRATION_BACKEND_CONCURRENCY={"stuf-zds-create-zaak": "2"},
+        REGISTRATION_BACKEND_RATE_LIMITS={},
+        REGISTRATION_THROTTLE_RETRY_DELAY=15,
+    )
+    def test_concurrency_limit(self):
+        with (
+            throttle_registration("stuf-zds-create-zaak"),
+            throttle_registration("stuf-zds-create-zaak"),
+        ):
+            # other backends are not affected
+            with throttle_registration("objects_api"):
+                pass
+
+            with self.assertRaises(RegistrationThrottled) as exc_context:
+                with throttle_registration("stuf-zds-create-zaak"):
+                    pass
+
+        self.assertEqual(exc_context.exception.countdown, 15)
+
+        # the slots are released again
+        with (
+            throttle_registration("stuf-zds-create-zaak"),
+            throttle_registration("stuf-zds-create-zaak"),
+        ):
+            pass
+
+    @override_settings(
+        REGISTRATION_BACKEND_CONCURRENCY={},
+        REGISTRATION_BACKEND_RATE_LIMITS={"stuf-zds-create-zaak": "2/m"},
+    )
+    def test_rate_limit(self):
+        with freeze_time("2024-10-01T12:00:15Z") as frozen_time:
+            for _ in range(2):
+                with throttle_registration("stuf-zds-create-zaak"):
+                    pass
+
+            with self.assertRaises(RegistrationThrottled) as exc_context:
+                with throttle_registration("stuf-zds-create-zaak"):
+                    pass
+
+            self.assertEqual(exc_context.exception.countdown, 45)
+
+            frozen_time.tick(60)
+
+            with throttle_registration("stuf-zds-create-zaak"):
+                pass
+
+    @override_settings(
+        REGISTRATION_BACKEND_CONCURRENCY={"stuf-zds-create-zaak": "1"},
+        REGISTRATION_BACKEND_RATE_LIMITS={"stuf-zds-create-zaak": "2/m"},
+    )
+    def test_rejected_registrations_do_not_count_against_the_rate(self):
+        with freeze_time("2024-10-01T12:00:15Z"):
+            with throttle_registration("stuf-zds-create-zaak"):
+                for _ in range(3):
+                    with self.assertRaises(RegistrationThrottled):
+                        with throttle_registration("stuf-zds-create-zaak"):
+                            pass
+
+            with throttle_registration("stuf-zds-create-zaak"):
+                pass
+
+    @override_settings(
+        REGISTRATION_BACKEND_CONCURRENCY={"stuf-zds-create-zaak": "1"},
+        REGISTRATION_BACKEND_RATE_LIMITS={},
+    )
+    def test_evicted_concurrency_counter(self):
+        with throttle_registration("stuf-zds-create-zaak"):
+            cache.clear()
+
+        with throttle_registration("stuf-zds-create-zaak"):
+            cache.clear()
+            with throttle_registration("stuf-zds-create-zaak"):
+                cache.clear()
+
+
+class ThrottlingSystemCheckTests(SimpleTestCase):
+    @override_settings(
+        REGISTRATION_BACKEND_CONCURRENCY={"stuf-zds-create-zaak": "2"},
+        REGISTRATION_BACKEND_RATE_LIMITS={"stuf-zds-create-zaak": "30/m"},
+    )
+    def test_valid_settings(self):
+        self.assertEqual(check_registration_throttling(None), [])
+
+    @override_settings(
+        REGISTRATION_BACKEND_CONCURRENCY={"stuf-zds-create-zaak": "many"},
+        REGISTRATION_BACKEND_RATE_LIMITS={"stuf-zds-create-zaak": "30/d"},
+    )
+    def test_invalid_settings(self):
+        errors = check_registration_throttling(None)
+
+        self.assertEqual(
+            {error.id for error in errors},
+            {"registrations.E001", "registrations.E002"},
+        )
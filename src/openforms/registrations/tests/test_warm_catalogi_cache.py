@@ -0,0 +1,95 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+import requests_mock
+
+from openforms.forms.tests.factories import FormRegistrationBackendFactory
+from openforms.utils.tests.cache import clear_caches
+
+from ..contrib.zgw_apis.client import get_catalogi_client
+from ..contrib.zgw_apis.tests.factories import ZGWApiGroupConfigFactory
+
+ZAAKTYPE = "https://catalogi.nl/api/v1/zaaktypen/1"
+
+
+@override_settings(
+    ZGW_CATALOGI_CACHE_TIMEOUT=60,
+    ZGW_CATALOGI_CACHE_STALE_TIMEOUT=3600,
+)
+@requests_mock.Mocker()
+class WarmCatalogiCacheCommandTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.zgw_group = ZGWApiGroupConfigFactory.create(
+            ztc_service__api_root="https://catalogi.nl/api/v1/",
+        )
+
+    def _mock_catalogi_api(self, m: requests_mock.Mocker) -> None:
+        m.get(
+            requests_mock.ANY,
+            json={"count": 0, "next": None, "previous": None, "results": []},
+            headers={"API-version": "1.3.1"},
+        )
+
+    def test_resources_of_live_forms_are_cached(self, m: requests_mock.Mocker):
+        self._mock_catalogi_api(m)
+        FormRegistrationBackendFactory.create(
+            backend="zgw-create-zaak",
+            options={
+                "zgw_api_group": self.zgw_group.pk,
+                "zaaktype": ZAAKTYPE,
+                "informatieobjecttype": "https://catalogi.nl/api/v1/informatieobjecttypen/1",
+            },
+        )
+        stdout = StringIO()
+
+        call_command("warm_catalogi_cache", stdout=stdout, stderr=StringIO())
+
+        self.assertIn("Warmed the cache", stdout.getvalue())
+        request_count = len(m.request_history)
+        self.assertGreater(request_count, 0)
+
+        with get_catalogi_client(self.zgw_group) as client:
+            client.list_statustypen(ZAAKTYPE)
+            client.list_roltypen(ZAAKTYPE, omschrijving_generiek="initiator")
+            client.list_eigenschappen(ZAAKTYPE)
+
+        self.assertEqual(len(m.request_history), request_count)
+
+    def test_inactive_forms_and_other_backends_are_skipped(
+        self, m: requests_mock.Mocker
+    ):
+        self._mock_catalogi_api(m)
+        FormRegistrationBackendFactory.create(
+            form__active=False,
+            backend="zgw-create-zaak",
+            options={
+                "zgw_api_group": self.zgw_group.pk,
+                "zaaktype": ZAAKTYPE,
+                "informatieobjecttype": "https://catalogi.nl/api/v1/informatieobjecttypen/1",
+            },
+        )
+        FormRegistrationBackendFactory.create(backend="email")
+
+        call_command("warm_catalogi_cache", stdout=StringIO(), stderr=StringIO())
+
+        self.assertEqual(len(m.request_history), 0)
+
+    def test_invalid_options_are_reported(self, m: requests_mock.Mocker):
+        self._mock_catalogi_api(m)
+        FormRegistrationBackendFactory.create(
+            backend="zgw-create-zaak",
+            options={"zgw_api_group": self.zgw_group.pk},
+        )
+        stderr = StringIO()
+
+        call_command("warm_catalogi_cache", stdout=StringIO(), stderr=stderr)
+
+        self.assertIn("invalid options", stderr.getvalue())
+        self.assertEqual(len(m.request_history), 0)
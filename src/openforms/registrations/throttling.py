@@ -0,0 +1,114 @@
+"""
+Per registration backend concurrency and rate limits.
+
+Slow or fragile registration backends (e.g. StUF-ZDS) can be protected against
+overload by limiting the number of registrations that run at the same time, and/or the
+number of registrations started within a time window. The limits are configured per
+plugin identifier through the ``REGISTRATION_BACKEND_CONCURRENCY`` and
+``REGISTRATION_BACKEND_RATE_LIMITS`` settings.
+
+The counters are kept in the default cache, which is shared by all Celery workers.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from django.conf import settings
+from django.core.cache import cache
+
+__all__ = ["RegistrationThrottled", "throttle_registration"]
+
+CACHE_PREFIX = "registrations:throttle"
+
+RATE_PERIODS = {
+    "s": 1,
+    "m": 60,
+    "h": 60 * 60,
+}
+
+
+class RegistrationThrottled(Exception):
+    def __init__(self, backend: str, countdown: int):
+        self.backend = backend
+        self.countdown = countdown
+        super().__init__(
+            f"Registration backend '{backend}' is throttled, retry in {countdown}s."
+        )
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """
+    Parse a rate like ``"10/m"`` into the number of allowed calls and the period.
+
+    :raises ValueError: if the rate is not valid.
+    """
+    num, _, period = rate.partition("/")
+    if not period or period[0] not in RATE_PERIODS:
+        raise ValueError(
+            f"Invalid rate '{rate}', expected a rate like '10/m' (with a period in "
+            f"{', '.join(RATE_PERIODS)})."
+        )
+    return int(num), RATE_PERIODS[period[0]]
+
+
+def _increment(key: str, timeout: int) -> int:
+    cache.add(key, 0, timeout=timeout)
+    try:
+        value = cache.incr(key)
+    except ValueError:  # the key expired in the meantime
+        cache.set(key, 1, timeout=timeout)
+        return 1
+    cache.touch(key, timeout=timeout)
+    return value
+
+
+def _decrement(key: str) -> None:
+    try:
+        cache.decr(key)
+    except ValueError:  # the key expired or was evicted in the meantime
+        pass
+
+
+def _check_rate_limit(backend: str) -> None:
+    if not (rate := settings.REGISTRATION_BACKEND_RATE_LIMITS.get(backend)):
+        return
+
+    num_requests, period = parse_rate(rate)
+    window = int(time.time() // period)
+    key = f"{CACHE_PREFIX}:rate:{backend}:{window}"
+    if _increment(key, timeout=period) > num_requests:
+        countdown = period - int(time.time() % period)
+        raise RegistrationThrottled(backend, countdown=max(countdown, 1))
+
+
+@contextmanager
+def throttle_registration(backend: str) -> Iterator[None]:
+    """
+    Guard a registration with the limits configured for the backend.
+
+    The concurrency limit is checked first, so that registrations waiting for a slot
+    don't use up the rate limit.
+
+    :raises RegistrationThrottled: if the registration may not start (yet). The
+      exception carries the number of seconds after which a retry makes sense.
+    """
+    if not (max_concurrency := settings.REGISTRATION_BACKEND_CONCURRENCY.get(backend)):
+        _check_rate_limit(backend)
+        yield
+        return
+
+    key = f"{CACHE_PREFIX}:concurrency:{backend}"
+    # the timeout releases slots of workers that were killed without cleaning up, it's
+    # refreshed whenever a registration starts
+    if _increment(key, timeout=settings.CELERY_TASK_TIME_LIMIT) > int(max_concurrency):
+        _decrement(key)
+        raise RegistrationThrottled(
+            backend, countdown=settings.REGISTRATION_THROTTLE_RETRY_DELAY
+        )
+
+    try:
+        _check_rate_limit(backend)
+        yield
+    finally:
+        _decrement(key)
@@ -25,7 +25,12 @@ from openforms.formio.utils import iter_components
 from openforms.forms.api.serializers import FormDefinitionSerializer
 from openforms.forms.constants import SubmissionAllowedChoices
 from openforms.forms.models import FormStep
+from openforms.forms.step_configuration import (
+    get_static_configuration,
+    use_configuration_overlay,
+)
 from openforms.forms.validators import validate_not_deleted
+from openforms.utils.json_patch import make_patch
 from openforms.utils.urls import build_absolute_uri
 
 from ..constants import SUBMISSIONS_SESSION_KEY, ProcessingResults, ProcessingStatuses
@@ -205,11 +210,64 @@ class SubmissionSerializer(serializers.HyperlinkedModelSerializer):
 
 
 class ContextAwareFormStepSerializer(serializers.ModelSerializer):
-    configuration = serializers.SerializerMethodField()
+    # The configuration fields are optional, depending on the mode requested by the
+    # client only some of them are present. They are not model attributes, so they are
+    # skipped in the default representation and set in ``to_representation``.
+    configuration = serializers.JSONField(
+        label=_("configuration"),
+        required=False,
+        help_text=_(
+            "The Form.io configuration of the step, with the logic and dynamic "
+            "configuration applied. Absent with the `overlay` configuration mode and "
+            "when a `configurationPatch` is returned."
+        ),
+    )
+    configuration_url = serializers.URLField(
+        label=_("configuration URL"),
+        required=False,
+        help_text=_(
+            "The URL of the static (cacheable) step configuration. Only present with "
+            "the `overlay` configuration mode."
+        ),
+    )
+    configuration_overlay = serializers.ListField(
+        child=serializers.DictField(),
+        label=_("configuration overlay"),
+        required=False,
+        help_text=_(
+            "JSON patch (RFC 6902) to apply to the static step configuration. Only "
+            "present with the `overlay` configuration mode."
+        ),
+    )
+    configuration_revision = serializers.CharField(
+        label=_("configuration revision"),
+        required=False,
+        help_text=_(
+            "The revision of the step configuration. Only present in logic check "
+            "responses with the delta protocol."
+        ),
+    )
+    configuration_patch = serializers.ListField(
+        child=serializers.DictField(),
+        label=_("configuration patch"),
+        required=False,
+        help_text=_(
+            "JSON patch (RFC 6902) against the configuration revision reported by the "
+            "client, replacing the `configuration`. Only present in logic check "
+            "responses with the delta protocol."
+        ),
+    )
 
     class Meta:
         model = FormStep
-        fields = ("index", "configuration")
+        fields = (
+            "index",
+            "configuration",
+            "configuration_url",
+            "configuration_overlay",
+            "configuration_revision",
+            "configuration_patch",
+        )
         extra_kwargs = {
             "index": {"source": "order"},
         }
@@ -223,6 +281,34 @@ class ContextAwareFormStepSerializer(serializers.ModelSerializer):
         )
         return serializer.data["configuration"]
 
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+        configuration = self.get_configuration(instance)
+        request = self.context.get("request")
+        if request is None or not use_configuration_overlay(request):
+            representation["configuration"] = configuration
+            return representation
+
+        # refer to the static configuration and only include the dynamic changes
+        submission = self.root.instance.submission
+        static_configuration = get_static_configuration(
+            instance, submission.language_code
+        )
+        representation["configuration_url"] = reverse(
+            "api:form-steps-static-configuration",
+            kwargs={
+                "form_uuid_or_slug": instance.form.uuid,
+                "uuid": instance.uuid,
+                "language": submission.language_code,
+                "revision": static_configuration.revision,
+            },
+            request=request,
+        )
+        representation["configuration_overlay"] = make_patch(
+            static_configuration.configuration, configuration
+        )
+        return representation
+
 
 class SubmissionStepSerializer(NestedHyperlinkedModelSerializer):
     form_step = ContextAwareFormStepSerializer(read_only=True)
@@ -308,7 +394,30 @@ class FormDataSerializer(serializers.Serializer):
         help_text=_(
             "The Form.io submission data object. This will be merged with the full "
             "form submission data, including data from other steps, to evaluate the "
-            "configured form logic."
+            "configured form logic. With the delta protocol, only the values that "
+            "changed compared to the saved step data need to be sent."
+        ),
+    )
+    delta = serializers.BooleanField(
+        label=_("delta protocol"),
+        required=False,
+        default=False,
+        help_text=_(
+            "Opt in to the delta protocol. The `data` only contains the changed values "
+            "and the response contains the `configurationRevision` of the step "
+            "configuration. If the `configurationRevision` of the previous response is "
+            "sent along, the configuration is replaced by a `configurationPatch` (a "
+            "JSON patch against that revision)."
+        ),
+    )
+    configuration_revision = serializers.CharField(
+        label=_("configuration revision"),
+        required=False,
+        allow_blank=True,
+        default="",
+        help_text=_(
+            "The revision of the step configuration known to the client. Only used "
+            "with the delta protocol."
         ),
     )
 
@@ -484,6 +593,18 @@ class SubmissionProcessingStatusSerializer(serializers.Serializer):
         return GlobalConfiguration.get_solo().main_website
 
 
+class SubmissionProcessingStatusQuerySerializer(serializers.Serializer):
+    wait = serializers.IntegerField(
+        label=_("wait"),
+        min_value=0,
+        default=0,
+        help_text=_(
+            "Maximum number of seconds to wait for the processing to finish before "
+            "responding."
+        ),
+    )
+
+
 class SubmissionCoSignStatusSerializer(serializers.ModelSerializer):
     co_signed = serializers.SerializerMethodField(
         label=_("is co-signed?"),
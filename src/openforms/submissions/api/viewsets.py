@@ -2,6 +2,7 @@ import contextlib
 import logging
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
 from django.db.models import Exists, OuterRef
 from django.utils.translation import gettext_lazy as _
@@ -23,6 +24,10 @@ from openforms.api.throttle_classes import PollingRateThrottle
 from openforms.authentication.service import is_authenticated_with_an_allowed_plugin
 from openforms.formio.service import FormioData
 from openforms.forms.models import FormStep
+from openforms.forms.step_configuration import (
+    CONFIGURATION_MODE_QUERY_PARAM,
+    OVERLAY_MODE,
+)
 from openforms.logging import logevent
 from openforms.prefill import prefill_variables
 from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSetMixin
@@ -31,6 +36,8 @@ from ..attachments import attach_uploads_to_submission_step
 from ..constants import PostSubmissionEvents
 from ..exceptions import FormDeactivated, FormMaintenance
 from ..form_logic import check_submission_logic, evaluate_form_logic
+from ..logic.cache import get_cache_key, get_logic_check, store_logic_check
+from ..logic.delta import get_delta_payload
 from ..models import Submission, SubmissionStep
 from ..models.submission_step import DirtyData
 from ..parsers import (
@@ -58,6 +65,7 @@ from .serializers import (
     FormDataSerializer,
     SubmissionCompletionSerializer,
     SubmissionCoSignStatusSerializer,
+    SubmissionProcessingStatusQuerySerializer,
     SubmissionProcessingStatusSerializer,
     SubmissionReportUrlSerializer,
     SubmissionSerializer,
@@ -74,6 +82,19 @@ from .validation import (
 
 logger = logging.getLogger(__name__)
 
+CONFIGURATION_MODE_PARAMETER = OpenApiParameter(
+    CONFIGURATION_MODE_QUERY_PARAM,
+    OpenApiTypes.STR,
+    location=OpenApiParameter.QUERY,
+    required=False,
+    enum=[OVERLAY_MODE],
+    description=_(
+        "With the `overlay` mode, the form step contains the `configurationUrl` of "
+        "the static (cacheable) step configuration and the `configurationOverlay` "
+        "(JSON patch, RFC 6902) to apply to it, instead of the `configuration`."
+    ),
+)
+
 
 @contextlib.contextmanager
 def cleanup_deactivated_form_session(request: Request, submission: Submission):
@@ -326,6 +347,7 @@ class SubmissionViewSet(
         request=None,
         responses={
             200: SubmissionProcessingStatusSerializer,
+            400: ValidationErrorSerializer,
             403: ExceptionSerializer,
             429: ExceptionSerializer,
         },
@@ -337,6 +359,17 @@ class SubmissionViewSet(
                 description=_("Time-based authentication token"),
                 required=True,
             ),
+            OpenApiParameter(
+                "wait",
+                OpenApiTypes.INT,
+                OpenApiParameter.QUERY,
+                description=_(
+                    "Maximum number of seconds to wait for the processing to finish "
+                    "before responding (long polling). Capped by the server "
+                    "configuration, which may disable long polling entirely."
+                ),
+                required=False,
+            ),
         ],
     )
     @action(
@@ -354,7 +387,16 @@ class SubmissionViewSet(
         information on the status of this async processing.
         """
         submission = self.get_object()
+        query_serializer = SubmissionProcessingStatusQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
         status = SubmissionProcessingStatus(request, submission)
+        if wait := min(
+            query_serializer.validated_data["wait"],
+            settings.SUBMISSION_STATUS_LONG_POLL_TIMEOUT,
+        ):
+            status.wait_for_completion(timeout=wait)
         status.ensure_failure_can_be_managed()
         serializer = SubmissionProcessingStatusSerializer(
             instance=status,
@@ -432,6 +474,7 @@ class SubmissionViewSet(
             "form step configuration. If there is no data yet for the step, the ID "
             "will be `null`. Set the step data by making a `PUT` request."
         ),
+        parameters=[CONFIGURATION_MODE_PARAMETER],
         responses={
             200: SubmissionStepSerializer,
             403: ExceptionSerializer,
@@ -509,6 +552,7 @@ class SubmissionStepViewSet(
 
     @extend_schema(
         summary=_("Store submission step data"),
+        parameters=[CONFIGURATION_MODE_PARAMETER],
         responses={
             200: SubmissionStepSerializer,
             201: SubmissionStepSerializer,
@@ -601,8 +645,17 @@ class SubmissionStepViewSet(
 
     @extend_schema(
         summary=_("Apply/check form logic"),
-        description=_("Apply/check the logic rules specified on the form step."),
+        description=_(
+            "Apply/check the logic rules specified on the form step.\n\n"
+            "For large forms, clients can opt in to the delta protocol. The submitted "
+            "`data` is merged with the saved step data, so only the changed values "
+            "need to be sent. The `formStep` in the response contains the "
+            "`configurationRevision` of the step configuration and, if the client "
+            "reported a known revision, a `configurationPatch` (JSON patch, RFC 6902) "
+            "against that revision instead of the `configuration`."
+        ),
         request=FormDataSerializer,
+        parameters=[CONFIGURATION_MODE_PARAMETER],
         responses={
             200: SubmissionStateLogicSerializer,
             403: ExceptionSerializer,
@@ -624,6 +677,14 @@ class SubmissionStepViewSet(
         form_data_serializer.is_valid(raise_exception=True)
 
         data = form_data_serializer.validated_data["data"]
+        # identical (repeated) checks are served from the cache, see
+        # :mod:`openforms.submissions.logic.cache`
+        cache_key = get_cache_key(submission_step, data, request=request)
+        if (payload := get_logic_check(cache_key)) is not None:
+            return self._get_logic_check_response(
+                payload, submission_step, form_data_serializer.validated_data
+            )
+
         if data:
             merged_data = FormioData({**submission.data, **data})
             submission_step.data = DirtyData(data)
@@ -641,4 +702,17 @@ class SubmissionStepViewSet(
             instance=SubmissionStateLogic(submission=submission, step=submission_step),
             context={"request": request, "unsaved_data": data},
         )
-        return Response(submission_state_logic_serializer.data)
+        payload = submission_state_logic_serializer.data
+        store_logic_check(cache_key, payload)
+        return self._get_logic_check_response(
+            payload, submission_step, form_data_serializer.validated_data
+        )
+
+    def _get_logic_check_response(
+        self, payload: dict, submission_step: SubmissionStep, options: dict
+    ) -> Response:
+        if options["delta"]:
+            payload = get_delta_payload(
+                payload, submission_step, revision=options["configuration_revision"]
+            )
+        return Response(payload)
@@ -2,13 +2,17 @@ import logging
 import os.path
 import pathlib
 import re
+import time
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import date, timedelta
 from functools import partial
+from itertools import batched
 from typing import Iterable, Iterator
 from urllib.parse import urlparse
 
 from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import Storage
 from django.core.files.temp import NamedTemporaryFile
 from django.db import transaction
 from django.urls import Resolver404, resolve
@@ -28,14 +32,18 @@ from openforms.submissions.models import (
     SubmissionStep,
     TemporaryFileUpload,
 )
+from openforms.submissions.models.submission_files import TEMPORARY_UPLOADS_DIRECTORY
 from openforms.template import render_from_string, sandbox_backend
 from openforms.typing import JSONObject
+from openforms.utils.files import delete_storage_files
 from openforms.utils.glom import _glom_path_to_str
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_IMAGE_MAX_SIZE = (10000, 10000)
 
+ORPHANED_FILES_CURSOR_KEY = "submissions:orphaned-upload-files:cursor"
+
 # validate the size as Formio does (client-side) - meaning 1MB is actually 1MiB
 # https://github.com/formio/formio.js/blob/4.12.x/src/components/file/File.js#L523
 file_size_cast = Filesize(system=Filesize.S_BINARY)
@@ -219,15 +227,122 @@ def attach_uploads_to_submission_step(
 
 
 def cleanup_submission_temporary_uploaded_files(submission: Submission):
-    for attachment in SubmissionFileAttachment.objects.for_submission(
-        submission
-    ).filter(temporary_file__isnull=False):
-        attachment.temporary_file.delete()
+    attachments = SubmissionFileAttachment.objects.for_submission(submission).filter(
+        temporary_file__isnull=False
+    )
+    TemporaryFileUpload.objects.filter(
+        pk__in=attachments.values("temporary_file")
+    ).delete()
+
+
+def cleanup_unclaimed_temporary_uploaded_files(
+    age=timedelta(days=2), deadline: float | None = None
+) -> bool:
+    """
+    Delete the unclaimed temporary uploads older than ``age``, in chunks.
+
+    Every chunk is deleted in its own transaction, so a cleanup that is interrupted
+    (or stopped because the ``deadline`` - a :func:`time.monotonic` value - passed)
+    resumes with the remaining uploads on the next call. The files of a chunk are
+    deleted concurrently after the commit.
+
+    :returns: ``True`` if all unclaimed uploads were deleted, ``False`` if the cleanup
+      stopped early.
+    """
+    batch_size = settings.TEMPORARY_UPLOADS_CLEANUP_BATCH_SIZE
+    storage = TemporaryFileUpload._meta.get_field("content").storage
+    unclaimed = TemporaryFileUpload.objects.select_prune(age).filter(attachments=None)
+    while pks := list(
+        unclaimed.order_by("pk").values_list("pk", flat=True)[:batch_size]
+    ):
+        with transaction.atomic():
+            # re-apply the filter, the upload may have been claimed in the meantime
+            uploads = dict(
+                unclaimed.filter(pk__in=pks)
+                .select_for_update(of=("self",))
+                .values_list("pk", "content")
+            )
+            # the base manager doesn't delete the files one by one, they're deleted
+            # in bulk instead
+            TemporaryFileUpload._base_manager.filter(pk__in=uploads).delete()
+            transaction.on_commit(
+                partial(
+                    delete_storage_files,
+                    storage,
+                    [name for name in uploads.values() if name],
+                )
+            )
+        if deadline is not None and time.monotonic() > deadline:
+            return False
+    return True
+
 
+def _iter_day_directories(storage: Storage, root: str) -> Iterator[str]:
+    """
+    Yield the ``YYYY/MM/DD`` directories (relative to ``root``) in chronological order.
+    """
+    for year in sorted(storage.listdir(root)[0]):
+        for month in sorted(storage.listdir(f"{root}/{year}")[0]):
+            for day in sorted(storage.listdir(f"{root}/{year}/{month}")[0]):
+                yield f"{year}/{month}/{day}"
+
+
+def cleanup_orphaned_temporary_upload_files(
+    age=timedelta(days=2), deadline: float | None = None
+) -> bool:
+    """
+    Delete the temporary upload files older than ``age`` without database record.
+
+    Files can end up orphaned when the record is deleted but the file deletion failed
+    or never happened (e.g. the worker got killed before the transaction commit hooks
+    ran). The upload directories are processed per day, emptied day directories are
+    removed and the last processed day is remembered, so that a cleanup that stopped
+    early because the ``deadline`` (a :func:`time.monotonic` value) passed continues
+    where it left off.
+
+    :returns: ``True`` if all directories were processed, ``False`` if the cleanup
+      stopped early.
+    """
+    storage = TemporaryFileUpload._meta.get_field("content").storage
+    root = TEMPORARY_UPLOADS_DIRECTORY
+    if not storage.exists(root):
+        return True
+
+    # the directories are named after the date of the upload, see ``fmt_upload_to``
+    cutoff = (date.today() - age).strftime("%Y/%m/%d")
+    cursor = cache.get(ORPHANED_FILES_CURSOR_KEY, "")
+    batch_size = settings.TEMPORARY_UPLOADS_CLEANUP_BATCH_SIZE
+    for directory in _iter_day_directories(storage, root):
+        if directory <= cursor:
+            continue
+        # files for recent uploads may be written before the record is committed
+        if directory >= cutoff:
+            break
+
+        filenames = storage.listdir(f"{root}/{directory}")[1]
+        remaining = 0
+        for chunk in batched(filenames, batch_size):
+            names = {f"{root}/{directory}/{filename}" for filename in chunk}
+            known = set(
+                TemporaryFileUpload.objects.filter(content__in=names).values_list(
+                    "content", flat=True
+                )
+            )
+            remaining += len(known)
+            if orphans := sorted(names - known):
+                logger.info("Deleting %d orphaned upload files", len(orphans))
+                delete_storage_files(storage, orphans)
+
+        # no new uploads end up in directories older than the cutoff
+        if not remaining and storage.listdir(f"{root}/{directory}") == ([], []):
+            storage.delete(f"{root}/{directory}")
+
+        cache.set(ORPHANED_FILES_CURSOR_KEY, directory, timeout=None)
+        if deadline is not None and time.monotonic() > deadline:
+            return False
 
-def cleanup_unclaimed_temporary_uploaded_files(age=timedelta(days=2)):
-    for file in TemporaryFileUpload.objects.select_prune(age).filter(attachments=None):
-        file.delete()
+    cache.delete(ORPHANED_FILES_CURSOR_KEY)
+    return True
 
 
 def iter_component_data(components: Iterable[dict], data: dict, filter_types=None):
@@ -0,0 +1,18 @@
+"""
+Benchmarks for the form engine hot paths.
+
+Run them with the ``benchmark_form_engine`` management command, which writes the
+results as JSON so that they can be compared across commits. The command also runs
+microbenchmarks of the ``FormioData`` item access.
+"""
+
+from .formio_data import run_formio_data_benchmarks
+from .runner import BenchmarkResult, run_benchmarks
+from .synthetic import FormSpec
+
+__all__ = [
+    "BenchmarkResult",
+    "FormSpec",
+    "run_benchmarks",
+    "run_formio_data_benchmarks",
+]
@@ -0,0 +1,96 @@
+"""
+Microbenchmarks of the item access of :class:`openforms.formio.datastructures.FormioData`.
+
+The glom based implementation that ``FormioData`` used before is included as a
+reference, so that the dedicated path accessor can be compared with it. Both are
+measured with plain and dotted (nested) keys.
+"""
+
+from collections.abc import Callable, Hashable
+
+from glom import PathAccessError, assign, glom
+
+from openforms.formio.datastructures import FormioData
+from openforms.typing import JSONValue
+
+from .runner import BenchmarkResult, measure
+
+__all__ = ["GlomFormioData", "run_formio_data_benchmarks"]
+
+KEYS = {
+    "plain": "textfield",
+    "dotted": "fieldset.nested.textfield",
+}
+
+
+class GlomFormioData(FormioData):
+    """
+    The previous, glom based, item access of :class:`FormioData`.
+    """
+
+    def __getitem__(self, key: Hashable):
+        return glom(self.data, key)
+
+    def __setitem__(self, key: Hashable, value: JSONValue):
+        assign(self.data, key, value, missing=dict)
+
+    def __contains__(self, key: Hashable) -> bool:
+        try:
+            self[key]
+        except PathAccessError:
+            return False
+        return True
+
+
+IMPLEMENTATIONS: dict[str, type[FormioData]] = {
+    "path_accessor": FormioData,
+    "glom": GlomFormioData,
+}
+
+
+def _get_operations(
+    data: FormioData, key: str, operations: int
+) -> dict[str, Callable[[], None]]:
+    missing_key = f"{key}Missing"
+
+    def getitem():
+        for _ in range(operations):
+            data[key]
+
+    def setitem():
+        for index in range(operations):
+            data[key] = index
+
+    def contains():
+        for _ in range(operations):
+            key in data
+
+    def contains_missing():
+        for _ in range(operations):
+            missing_key in data
+
+    return {
+        "getitem": getitem,
+        "setitem": setitem,
+        "contains": contains,
+        "contains_missing": contains_missing,
+    }
+
+
+def run_formio_data_benchmarks(
+    rounds: int = 5, operations: int = 10_000
+) -> list[BenchmarkResult]:
+    """
+    Measure the item access of both ``FormioData`` implementations.
+
+    Every round performs ``operations`` accesses, the results are named like
+    ``formio_data_getitem_dotted[glom]``.
+    """
+    results = []
+    for implementation, data_cls in IMPLEMENTATIONS.items():
+        for key_type, key in KEYS.items():
+            data = data_cls({key: "value"})
+            for operation, func in _get_operations(data, key, operations).items():
+                name = f"formio_data_{operation}_{key_type}[{implementation}]"
+                results.append(measure(name, func, rounds, items=operations))
+    return results
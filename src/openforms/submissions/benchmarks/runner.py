@@ -0,0 +1,213 @@
+"""
+Measure the hot paths of the form engine on a synthetic form.
+
+Every benchmark is run a number of rounds, recording the duration and the number of
+database queries of each round. The first round is usually the slowest, as it fills
+the (process) caches.
+"""
+
+import statistics
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import patch
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.template.loader import render_to_string
+from django.test import Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.request import Request
+
+from csp_post_processor import post_process_html
+from csp_post_processor.constants import NONCE_HTTP_HEADER
+from openforms.config.templatetags.theme import THEME_OVERRIDE_CONTEXT_VAR
+from openforms.formio.utils import iter_components
+
+from ..api.validation import get_submission_completion_serializer
+from ..constants import SUBMISSIONS_SESSION_KEY
+from ..exports import create_submission_export
+from ..models import Submission
+from ..report import Report
+from .synthetic import FormSpec, create_form, create_submission, get_step_data
+
+__all__ = ["BenchmarkResult", "run_benchmarks"]
+
+HOST = "benchmark.local"
+# the SDK sends the CSP nonce of the page, the HTML content is post-processed for it
+NONCE = "YmVuY2htYXJrLW5vbmNl"
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    durations: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    items: int = 1
+    """
+    The number of items processed in each round, e.g. the rows of an export.
+    """
+
+    def as_dict(self) -> dict[str, Any]:
+        mean = statistics.mean(self.durations)
+        return {
+            "name": self.name,
+            "rounds": len(self.durations),
+            "items": self.items,
+            "min": min(self.durations),
+            "max": max(self.durations),
+            "mean": mean,
+            "median": statistics.median(self.durations),
+            "mean_per_item": mean / self.items,
+            "queries": self.queries,
+        }
+
+
+def measure(
+    name: str, func: Callable[[], object], rounds: int, items: int = 1
+) -> BenchmarkResult:
+    result = BenchmarkResult(name=name, items=items)
+    for _ in range(rounds):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            func()
+            result.durations.append(time.perf_counter() - start)
+        result.queries.append(len(queries))
+    return result
+
+
+@contextmanager
+def _benchmark_environment() -> Iterator[None]:
+    # Throttling is a deployment concern and would fail the repeated requests. The
+    # result caches are disabled, otherwise every round after the first would only
+    # measure a cache hit.
+    with (
+        override_settings(
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, HOST],
+            SUBMISSION_LOGIC_CHECK_CACHE_TIMEOUT=0,
+            SUBMISSION_RENDER_CACHE_TIMEOUT=0,
+        ),
+        patch("rest_framework.views.APIView.get_throttles", return_value=[]),
+    ):
+        yield
+
+
+def _check_response(response) -> None:
+    assert 200 <= response.status_code < 300, response.content
+
+
+def _run(spec: FormSpec, rounds: int, export_rows: int) -> list[BenchmarkResult]:
+    form = create_form(spec)
+    submission = create_submission(form, spec)
+    step_data = get_step_data(form, spec)
+    form_step = form.formstep_set.order_by("order").first()
+    assert form_step is not None, "The synthetic form has no steps"
+    data = step_data[str(form_step.uuid)]
+
+    client = Client(SERVER_NAME=HOST, headers={NONCE_HTTP_HEADER: NONCE})
+    session = client.session
+    session[SUBMISSIONS_SESSION_KEY] = [str(submission.uuid)]
+    session.save()
+
+    url_kwargs = {"submission_uuid": submission.uuid, "step_uuid": form_step.uuid}
+    step_url = reverse("api:submission-steps-detail", kwargs=url_kwargs)
+    logic_check_url = reverse("api:submission-steps-logic-check", kwargs=url_kwargs)
+    request = Request(
+        RequestFactory(SERVER_NAME=HOST, headers={NONCE_HTTP_HEADER: NONCE}).post("/")
+    )
+
+    def validate_completion():
+        serializer = get_submission_completion_serializer(
+            Submission.objects.get(pk=submission.pk), request=request
+        )
+        serializer.is_valid()
+
+    def render_report():
+        report_submission = Submission.objects.get(pk=submission.pk)
+        render_to_string(
+            "report/submission_report.html",
+            context={
+                "report": Report(report_submission),
+                THEME_OVERRIDE_CONTEXT_VAR: form.theme,
+            },
+        )
+
+    results = [
+        measure("step_get", lambda: _check_response(client.get(step_url)), rounds),
+        measure(
+            "step_put",
+            lambda: _check_response(
+                client.put(
+                    step_url, data={"data": data}, content_type="application/json"
+                )
+            ),
+            rounds,
+        ),
+        measure(
+            "check_logic",
+            lambda: _check_response(
+                client.post(
+                    logic_check_url,
+                    data={"data": data},
+                    content_type="application/json",
+                )
+            ),
+            rounds,
+        ),
+        measure("completion_validation", validate_completion, rounds),
+        measure("report_html", render_report, rounds),
+    ]
+
+    if content_html := [
+        component["html"]
+        for component in iter_components(form_step.form_definition.configuration)
+        if component["type"] == "content"
+    ]:
+
+        def post_process_content():
+            for html in content_html:
+                post_process_html(html, request)
+
+        results.append(
+            measure(
+                "content_post_processing",
+                post_process_content,
+                rounds,
+                items=len(content_html),
+            )
+        )
+
+    if export_rows:
+        completed_ids = [
+            create_submission(form, spec, completed=True).pk for _ in range(export_rows)
+        ]
+        results.append(
+            measure(
+                "export",
+                lambda: create_submission_export(
+                    Submission.objects.filter(pk__in=completed_ids)
+                ),
+                rounds,
+                items=export_rows,
+            )
+        )
+
+    return results
+
+
+def run_benchmarks(
+    spec: FormSpec, rounds: int = 5, export_rows: int = 10
+) -> list[BenchmarkResult]:
+    """
+    Create a synthetic form and measure the form engine hot paths for it.
+
+    All the created data is rolled back afterwards.
+    """
+    with _benchmark_environment(), transaction.atomic():
+        results = _run(spec, rounds=rounds, export_rows=export_rows)
+        transaction.set_rollback(True)
+    return results
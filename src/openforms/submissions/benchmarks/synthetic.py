@@ -0,0 +1,234 @@
+"""
+Generate synthetic forms and submissions to benchmark the form engine with.
+
+The generated forms mix the common component types, optionally nested in fieldsets
+and repeating groups (editgrids), and have logic rules and user defined variables
+referring to the components. Steps can contain content blocks with styled (WYSIWYG)
+markup, which is post-processed for the CSP nonce of each request.
+
+.. note:: this relies on the test factories, which are not part of the base
+   dependencies.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from openforms.formio.typing import Component
+from openforms.forms.models import Form
+from openforms.typing import JSONObject
+
+if TYPE_CHECKING:
+    from ..models import Submission
+
+__all__ = ["FormSpec", "create_form", "create_submission", "get_step_data"]
+
+EDITGRID_ROWS = 3
+
+
+@dataclass
+class FormSpec:
+    steps: int = 3
+    components: int = 20
+    """
+    The number of (leaf) components per step.
+    """
+    depth: int = 0
+    """
+    The number of fieldsets the components of a step are nested in.
+    """
+    editgrids: int = 0
+    """
+    The number of repeating groups per step.
+    """
+    rules: int = 10
+    variables: int = 5
+    """
+    The number of user defined variables.
+    """
+    content_blocks: int = 0
+    """
+    The number of content components per step.
+    """
+    content_size: int = 10
+    """
+    The number of styled paragraphs per content block.
+    """
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def _get_leaf_component(key: str, index: int) -> tuple[Component, Any]:
+    """
+    Return a component (of a type depending on the index) and a value for it.
+    """
+    options = [
+        {"value": "a", "label": "Option A"},
+        {"value": "b", "label": "Option B"},
+    ]
+    match index % 6:
+        case 0:
+            return {"type": "textfield", "key": key, "label": key}, f"Value {index}"
+        case 1:
+            return {"type": "number", "key": key, "label": key}, index
+        case 2:
+            return {"type": "date", "key": key, "label": key}, "2024-01-01"
+        case 3:
+            return {"type": "radio", "key": key, "label": key, "values": options}, "a"
+        case 4:
+            component = {
+                "type": "selectboxes",
+                "key": key,
+                "label": key,
+                "values": options,
+            }
+            return component, {"a": True, "b": False}
+        case _:
+            return {"type": "checkbox", "key": key, "label": key}, True
+
+
+def get_content_html(key: str, size: int) -> str:
+    """
+    Return WYSIWYG markup with inline styles, which require CSP post-processing.
+    """
+    return "".join(
+        f'<p style="color: #{index % 10}{index % 10}0000;">{key} paragraph {index} '
+        f'with <span style="font-weight: bold;">styled</span> text.</p>'
+        for index in range(size)
+    )
+
+
+def _get_step_configuration(
+    step_index: int, spec: FormSpec
+) -> tuple[JSONObject, JSONObject]:
+    components: list[Component] = []
+    data: JSONObject = {}
+    for index in range(spec.components):
+        key = f"step{step_index}Field{index}"
+        component, value = _get_leaf_component(key, index)
+        components.append(component)
+        data[key] = value
+
+    for index in range(spec.content_blocks):
+        key = f"step{step_index}Content{index}"
+        components.append(
+            {
+                "type": "content",
+                "key": key,
+                "label": key,
+                "html": get_content_html(key, spec.content_size),
+            }
+        )
+
+    for depth in reversed(range(spec.depth)):
+        key = f"step{step_index}Fieldset{depth}"
+        components = [
+            {"type": "fieldset", "key": key, "label": key, "components": components}
+        ]
+
+    for index in range(spec.editgrids):
+        key = f"step{step_index}Editgrid{index}"
+        nested = [
+            _get_leaf_component(f"{key}Field{nested_index}", nested_index)
+            for nested_index in range(3)
+        ]
+        components.append(
+            {
+                "type": "editgrid",
+                "key": key,
+                "label": key,
+                "components": [component for component, _ in nested],
+            }
+        )
+        data[key] = [
+            {component["key"]: value for component, value in nested}
+            for _ in range(EDITGRID_ROWS)
+        ]
+
+    return {"components": components}, data
+
+
+def get_step_data(form: Form, spec: FormSpec) -> dict[str, JSONObject]:
+    """
+    Return the submission data for each step (by form step UUID) of a synthetic form.
+    """
+    return {
+        str(form_step.uuid): _get_step_configuration(index, spec)[1]
+        for index, form_step in enumerate(form.formstep_set.order_by("order"))
+    }
+
+
+def create_form(spec: FormSpec) -> Form:
+    from openforms.forms.tests.factories import (
+        FormFactory,
+        FormLogicFactory,
+        FormStepFactory,
+        FormVariableFactory,
+    )
+
+    form = FormFactory.create(name="Benchmark")
+    trigger_keys = []
+    for index in range(spec.steps):
+        configuration, _ = _get_step_configuration(index, spec)
+        FormStepFactory.create(
+            form=form,
+            form_definition__name=f"Benchmark step {index}",
+            form_definition__configuration=configuration,
+        )
+        trigger_keys += [f"step{index}Field{n}" for n in range(spec.components)]
+
+    for index in range(spec.variables):
+        FormVariableFactory.create(
+            form=form,
+            user_defined=True,
+            key=f"benchmarkVariable{index}",
+            initial_value="",
+        )
+
+    if not trigger_keys:
+        return form
+
+    for index in range(spec.rules):
+        trigger_key = trigger_keys[index % len(trigger_keys)]
+        target_key = trigger_keys[(index + 1) % len(trigger_keys)]
+        if spec.variables and index % 2:
+            action = {
+                "variable": f"benchmarkVariable{index % spec.variables}",
+                "action": {
+                    "type": "variable",
+                    "value": {"cat": [{"var": trigger_key}, "-updated"]},
+                },
+            }
+        else:
+            action = {
+                "component": target_key,
+                "action": {
+                    "type": "property",
+                    "property": {"value": "hidden", "type": "bool"},
+                    "state": False,
+                },
+            }
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"!=": [{"var": trigger_key}, None]},
+            actions=[action],
+        )
+
+    return form
+
+
+def create_submission(form: Form, spec: FormSpec, **kwargs) -> "Submission":
+    """
+    Create a submission with data for every step of the synthetic form.
+    """
+    from ..tests.factories import SubmissionFactory, SubmissionStepFactory
+
+    submission = SubmissionFactory.create(form=form, **kwargs)
+    step_data = get_step_data(form, spec)
+    for form_step in form.formstep_set.order_by("order"):
+        SubmissionStepFactory.create(
+            submission=submission,
+            form_step=form_step,
+            data=step_data[str(form_step.uuid)],
+        )
+    return submission
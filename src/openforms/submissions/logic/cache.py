@@ -0,0 +1,119 @@
+"""
+Cache the outcome of the logic check of submission steps.
+
+The SDK calls the logic check endpoint on (debounced) input changes, and rapid edits
+ending in the same state or multiple open tabs repeat the exact same evaluation. The
+serialized outcome is cached per submission step, keyed on:
+
+* a fingerprint of the (unsaved) input data,
+* a version of the submission, which is replaced when its persisted state changes -
+  this covers the data of the other steps, the variables, authentication and payment
+  (see :mod:`openforms.submissions.signals`),
+* the version of the form, which is replaced when the form, its steps, logic or
+  variables are edited (see :mod:`openforms.forms.cache`),
+* the request context - the language, host, configuration mode and the CSP nonce,
+  which is written into the HTML content of the components,
+* the current time, truncated to minutes just like the ``now`` static variable.
+"""
+
+import hashlib
+import json
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import get_language
+
+from rest_framework.request import Request
+
+from csp_post_processor.constants import NONCE_HTTP_HEADER
+from openforms.forms.cache import get_form_version
+from openforms.forms.step_configuration import use_configuration_overlay
+from openforms.typing import DataMapping
+
+if TYPE_CHECKING:
+    from ..models import SubmissionStep
+
+__all__ = [
+    "get_cache_key",
+    "get_logic_check",
+    "store_logic_check",
+    "invalidate_logic_check",
+]
+
+CACHE_PREFIX = "submissions:logic-check"
+
+
+def _version_key(submission_id: int) -> str:
+    return f"{CACHE_PREFIX}:version:{submission_id}"
+
+
+def _get_submission_version(submission_id: int) -> str:
+    key = _version_key(submission_id)
+    if (version := cache.get(key)) is not None:
+        return version
+    # Unknown or evicted - start a new version. If another process raced us, use its
+    # version instead.
+    cache.add(key, uuid.uuid4().hex, timeout=None)
+    return cache.get(key) or uuid.uuid4().hex
+
+
+def _bump_submission_version(submission_id: int) -> None:
+    cache.set(_version_key(submission_id), uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_logic_check(submission_id: int) -> None:
+    """
+    Invalidate the cached logic check outcomes of a submission.
+
+    The version is replaced right away, so that the rest of the transaction doesn't
+    read the old outcomes, and again after the transaction commits, so that concurrent
+    requests can't store the old state under the new version.
+    """
+    _bump_submission_version(submission_id)
+    transaction.on_commit(lambda: _bump_submission_version(submission_id))
+
+
+def get_cache_key(
+    submission_step: "SubmissionStep", data: DataMapping, request: Request
+) -> str:
+    """
+    Compute the cache key for the logic check of the step with the input data.
+
+    An empty key is returned if the cache is disabled.
+    """
+    if not settings.SUBMISSION_LOGIC_CHECK_CACHE_TIMEOUT:
+        return ""
+    submission = submission_step.submission
+    fingerprint = json.dumps(
+        {
+            "data": data,
+            "submission": _get_submission_version(submission.pk),
+            "form": get_form_version(submission.form_id).token,
+            "language": get_language(),
+            "host": request.get_host(),
+            "overlay": use_configuration_overlay(request),
+            "nonce": request.headers.get(NONCE_HTTP_HEADER, ""),
+            "now": timezone.now().replace(second=0, microsecond=0),
+        },
+        cls=DjangoJSONEncoder,
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+    return f"{CACHE_PREFIX}:{submission.uuid}:{submission_step.form_step.uuid}:{digest}"
+
+
+def get_logic_check(key: str) -> dict[str, Any] | None:
+    if not key:
+        return None
+    return cache.get(key)
+
+
+def store_logic_check(key: str, payload: dict[str, Any]) -> None:
+    if not key:
+        return
+    cache.set(key, payload, timeout=settings.SUBMISSION_LOGIC_CHECK_CACHE_TIMEOUT)
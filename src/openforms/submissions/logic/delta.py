@@ -0,0 +1,78 @@
+"""
+Delta-encoded responses of the logic check.
+
+With the delta protocol, the client only sends the values that changed compared to the
+saved step data, and reports the revision of the step configuration it received last.
+Instead of the complete (dynamic) configuration, the response contains the revision of
+the new configuration and a JSON patch against the reported revision.
+
+Only the latest configuration (and its revision) of every submission step is kept in
+the cache for a while, rather than every revision that was ever sent. If the reported
+revision isn't the latest one (e.g. with multiple tabs) or expired, the complete
+configuration is returned instead and the client starts over from the new revision.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import cache
+
+from openforms.forms.step_configuration import get_configuration_revision
+from openforms.utils.json_patch import make_patch
+
+if TYPE_CHECKING:
+    from ..models import SubmissionStep
+
+__all__ = ["get_delta_payload"]
+
+CACHE_PREFIX = "submissions:logic-check:configuration"
+
+# how long (in seconds) clients can refer to a configuration revision
+CONFIGURATION_REVISION_TIMEOUT = 30 * 60
+
+
+def _get_cache_key(submission_step: "SubmissionStep") -> str:
+    return (
+        f"{CACHE_PREFIX}:{submission_step.submission.uuid}:"
+        f"{submission_step.form_step.uuid}"
+    )
+
+
+def get_delta_payload(
+    payload: dict[str, Any], submission_step: "SubmissionStep", revision: str
+) -> dict[str, Any]:
+    """
+    Replace the step configuration in the logic check payload with a patch.
+
+    :arg payload: the (serialized) logic check response, which is not modified.
+    :arg revision: the configuration revision the client reported, may be empty.
+    """
+    form_step = {**payload["step"]["form_step"]}
+    # with the configuration overlay mode, there's no complete configuration to patch
+    if "configuration" not in form_step:
+        return payload
+    configuration = form_step.pop("configuration")
+    new_revision = get_configuration_revision(configuration)
+    key = _get_cache_key(submission_step)
+
+    latest_revision, latest_configuration = cache.get(key) or ("", None)
+    if latest_revision == new_revision:
+        # the configuration is unchanged, only keep it around for longer
+        cache.touch(key, timeout=CONFIGURATION_REVISION_TIMEOUT)
+    else:
+        cache.set(
+            key, (new_revision, configuration), timeout=CONFIGURATION_REVISION_TIMEOUT
+        )
+
+    if revision == new_revision:
+        previous = configuration
+    elif revision and revision == latest_revision:
+        previous = latest_configuration
+    else:
+        previous = None
+    form_step["configuration_revision"] = new_revision
+    if previous is None:
+        form_step["configuration"] = configuration
+    else:
+        form_step["configuration_patch"] = make_patch(previous, configuration)
+
+    return {**payload, "step": {**payload["step"], "form_step": form_step}}
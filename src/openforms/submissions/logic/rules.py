@@ -4,6 +4,7 @@ import elasticapm
 from json_logic import jsonLogic
 
 from openforms.forms.models import FormLogic, FormStep
+from openforms.instrumentation import span
 
 from ..models import Submission, SubmissionStep
 from .actions import ActionOperation
@@ -129,10 +130,13 @@ def iter_evaluate_rules(
     :returns: An iterator yielding :class:`ActionOperation` instances.
     """
     for rule in rules:
-        with elasticapm.capture_span(
-            "evaluate_rule",
-            span_type="app.submissions.logic",
-            labels={"ruleId": rule.pk},
+        with (
+            elasticapm.capture_span(
+                "evaluate_rule",
+                span_type="app.submissions.logic",
+                labels={"ruleId": rule.pk},
+            ),
+            span("logic.rule", rule_id=rule.pk),
         ):
             triggered = False
             with log_errors(rule.json_logic_trigger, rule):
@@ -0,0 +1,132 @@
+import json
+import platform
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.utils import timezone
+
+from ...benchmarks import FormSpec, run_benchmarks, run_formio_data_benchmarks
+
+
+class Command(BaseCommand):
+    # The synthetic data is created with the test factories and rolled back afterwards.
+    help = (
+        "Benchmark the form engine hot paths (step GET/PUT, logic check, completion "
+        "validation, report rendering and export) on a synthetic form."
+    )
+
+    def add_arguments(self, parser):
+        defaults = FormSpec()
+        parser.add_argument("--steps", type=int, default=defaults.steps)
+        parser.add_argument(
+            "--components",
+            type=int,
+            default=defaults.components,
+            help="The number of components per step.",
+        )
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=defaults.depth,
+            help="The number of fieldsets the components of a step are nested in.",
+        )
+        parser.add_argument(
+            "--editgrids",
+            type=int,
+            default=defaults.editgrids,
+            help="The number of repeating groups per step.",
+        )
+        parser.add_argument(
+            "--rules",
+            type=int,
+            default=defaults.rules,
+            help="The number of logic rules.",
+        )
+        parser.add_argument(
+            "--variables",
+            type=int,
+            default=defaults.variables,
+            help="The number of user defined variables.",
+        )
+        parser.add_argument(
+            "--content-blocks",
+            type=int,
+            default=defaults.content_blocks,
+            help="The number of content components (with styled markup) per step.",
+        )
+        parser.add_argument(
+            "--content-size",
+            type=int,
+            default=defaults.content_size,
+            help="The number of styled paragraphs per content component.",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=5,
+            help="How many times each benchmark is run.",
+        )
+        parser.add_argument(
+            "--export-rows",
+            type=int,
+            default=10,
+            help="The number of submissions to export. Use 0 to skip the export.",
+        )
+        parser.add_argument(
+            "--formio-data-operations",
+            type=int,
+            default=10_000,
+            help=(
+                "The number of item accesses per round of the FormioData "
+                "microbenchmarks. Use 0 to skip them."
+            ),
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="Write the results as JSON to this file instead of stdout.",
+        )
+
+    def handle(self, **options):
+        if not settings.DEBUG:
+            raise CommandError("This command is only allowed in dev environments")
+
+        if options["rounds"] < 1:
+            raise CommandError("At least one round is required.")
+
+        spec = FormSpec(
+            steps=options["steps"],
+            components=options["components"],
+            depth=options["depth"],
+            editgrids=options["editgrids"],
+            rules=options["rules"],
+            variables=options["variables"],
+            content_blocks=options["content_blocks"],
+            content_size=options["content_size"],
+        )
+        results = run_benchmarks(
+            spec, rounds=options["rounds"], export_rows=options["export_rows"]
+        )
+        microbenchmarks = (
+            run_formio_data_benchmarks(rounds=options["rounds"], operations=operations)
+            if (operations := options["formio_data_operations"])
+            else []
+        )
+
+        output = json.dumps(
+            {
+                "commit": settings.GIT_SHA,
+                "timestamp": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "spec": spec.as_dict(),
+                "results": [result.as_dict() for result in results],
+                "microbenchmarks": [result.as_dict() for result in microbenchmarks],
+            },
+            indent=2,
+        )
+        if options["output"]:
+            options["output"].write_text(output)
+            self.stdout.write(f"Results written to {options['output']}")
+        else:
+            self.stdout.write(output)
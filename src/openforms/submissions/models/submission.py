@@ -469,11 +469,17 @@ class Submission(models.Model):
 
     @transaction.atomic()
     def remove_sensitive_data(self):
+        from openforms.formio.components.np_family_members.cache import (
+            clear_family_members,
+        )
+
         from .submission_files import SubmissionFileAttachment
 
         if self.is_authenticated:
             self.auth_info.clear_sensitive_data()
 
+        clear_family_members(self)
+
         sensitive_variables = self.submissionvaluevariable_set.filter(
             form_variable__is_sensitive_data=True
         )
@@ -27,6 +27,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+TEMPORARY_UPLOADS_DIRECTORY = "temporary-uploads"
+
+
 def fmt_upload_to(prefix, instance, filename):
     name, ext = os.path.splitext(filename)
     return "{p}/{d}/{u}{e}".format(
@@ -35,7 +38,7 @@ def fmt_upload_to(prefix, instance, filename):
 
 
 def temporary_file_upload_to(instance, filename):
-    return fmt_upload_to("temporary-uploads", instance, filename)
+    return fmt_upload_to(TEMPORARY_UPLOADS_DIRECTORY, instance, filename)
 
 
 def submission_file_upload_to(instance, filename):
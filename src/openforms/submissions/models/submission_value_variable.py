@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from typing import TYPE_CHECKING, Any
@@ -12,6 +13,7 @@ from django.utils.functional import empty
 from django.utils.translation import gettext_lazy as _
 
 from openforms.formio.service import FormioData
+from openforms.forms.form_variables import get_form_variables
 from openforms.forms.models.form_variable import FormVariable
 from openforms.typing import DataMapping, JSONEncodable, JSONSerializable
 from openforms.utils.date import format_date_value, parse_datetime, parse_time
@@ -19,6 +21,7 @@ from openforms.variables.constants import FormVariableDataTypes
 from openforms.variables.service import get_static_variables
 
 from ..constants import SubmissionValueVariableSources
+from ..logic.cache import invalidate_logic_check
 from .submission import Submission
 
 if TYPE_CHECKING:
@@ -37,6 +40,13 @@ class SubmissionValueVariablesState:
     _variables: dict[str, SubmissionValueVariable] | None = field(
         init=False, default=None
     )
+    # the variables that are persisted and the form variables they are joined with,
+    # kept separately so that the unsaved variables only need to be created when
+    # they're actually used
+    _saved_variables: dict[str, SubmissionValueVariable] | None = field(
+        init=False, default=None
+    )
+    _form_variables: dict[str, FormVariable] | None = field(init=False, default=None)
     _static_data: dict[str, Any] | None = field(init=False, default=None)
 
     @property
@@ -47,6 +57,11 @@ class SubmissionValueVariablesState:
 
     @property
     def saved_variables(self) -> dict[str, SubmissionValueVariable]:
+        if self._variables is None:
+            self._load_variables()
+            assert self._saved_variables is not None
+            return {**self._saved_variables}
+
         return {
             variable_key: variable
             for variable_key, variable in self.variables.items()
@@ -89,7 +104,7 @@ class SubmissionValueVariablesState:
         configuration_wrapper = (
             submission_step.form_step.form_definition.configuration_wrapper
         )
-        keys_in_step = list(configuration_wrapper.component_map.keys())
+        keys_in_step = configuration_wrapper.component_map.keys()
 
         variables = self.variables
         if not include_unsaved:
@@ -101,7 +116,10 @@ class SubmissionValueVariablesState:
             if variable.key in keys_in_step
         }
 
-    def collect_variables(self) -> dict[str, SubmissionValueVariable]:
+    def _load_variables(self) -> None:
+        if self._saved_variables is not None:
+            return
+
         # leverage the (already populated) submission state to get access to form
         # steps and form definitions
         submission_state = self.submission.load_execution_state()
@@ -113,7 +131,7 @@ class SubmissionValueVariablesState:
         # Build a collection of all form variables
         all_form_variables = {
             form_variable.key: form_variable
-            for form_variable in self.submission.form.formvariable_set.all()
+            for form_variable in get_form_variables(self.submission.form)
         }
         # optimize the access from form_variable.form_definition using the already
         # existing map, saving a `select_related` call on data we (probably) already
@@ -135,8 +153,17 @@ class SubmissionValueVariablesState:
                 continue
             submission_value_variable.form_variable = all_form_variables[variable_key]
 
+        self._form_variables = all_form_variables
+        self._saved_variables = all_submission_variables
+
+    def collect_variables(self) -> dict[str, SubmissionValueVariable]:
+        self._load_variables()
+        assert self._form_variables is not None
+        assert self._saved_variables is not None
+        all_submission_variables = {**self._saved_variables}
+
         # finally, add in the unsaved variables from defualt values
-        for variable_key, form_variable in all_form_variables.items():
+        for variable_key, form_variable in self._form_variables.items():
             # if the key exists from the saved values in the DB, do nothing
             if variable_key in all_submission_variables:
                 continue
@@ -154,8 +181,9 @@ class SubmissionValueVariablesState:
 
     def remove_variables(self, keys: list) -> None:
         for key in keys:
-            if key in self._variables:
-                del self._variables[key]
+            for variables in (self._variables, self._saved_variables):
+                if variables and key in variables:
+                    del variables[key]
 
     def static_data(self) -> dict:
         if self._static_data is None:
@@ -183,6 +211,9 @@ class SubmissionValueVariablesState:
             variable.source = SubmissionValueVariableSources.prefill
 
         SubmissionValueVariable.objects.bulk_create(variables_to_prefill)
+        for variable in variables_to_prefill:
+            variable.mark_value_clean()
+        invalidate_logic_check(self.submission.pk)
 
     def set_values(self, data: DataMapping) -> None:
         """
@@ -241,12 +272,16 @@ class SubmissionValueVariableManager(models.Manager):
 
             if not variable.pk:
                 variables_to_create.append(variable)
-            else:
+            # only write the values that actually changed
+            elif variable.is_value_dirty:
                 variables_to_update.append(variable)
 
         self.bulk_create(variables_to_create)
         self.bulk_update(variables_to_update, fields=["value"])
+        for variable in variables_to_create + variables_to_update:
+            variable.mark_value_clean()
         self.filter(submission=submission, key__in=variables_keys_to_delete).delete()
+        invalidate_logic_check(submission.pk)
 
         # Variables that are deleted are not automatically updated in the state
         # (i.e. they remain present with their pk)
@@ -323,10 +358,67 @@ class SubmissionValueVariable(models.Model):
             )
         return _("Submission value variable {key}").format(key=self.key)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "value" not in instance.get_deferred_fields():
+            instance.mark_value_clean()
+        return instance
+
+    def save(self, *args, update_fields=None, **kwargs):
+        super().save(*args, update_fields=update_fields, **kwargs)
+        if update_fields is None or "value" in update_fields:
+            self.mark_value_clean()
+
+    save.alters_data = True
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if (fields is None or "value" in fields) and (
+            "value" not in self.get_deferred_fields()
+        ):
+            self.mark_value_clean()
+
+    def _get_encoded_value(self) -> str:
+        # compare the JSON representation, which is what ends up in the database -
+        # e.g. ``True == 1`` in Python, but not in JSON
+        return json.dumps(self.value, cls=ValueEncoder, sort_keys=True)
+
+    def mark_value_clean(self) -> None:
+        """
+        Record the current value as the value stored in the database.
+        """
+        self._persisted_value = self._get_encoded_value()
+
+    @property
+    def is_value_dirty(self) -> bool:
+        """
+        Indicate if the value differs from the value stored in the database.
+
+        Instances for which the stored value is not known are always considered dirty.
+        """
+        persisted_value = getattr(self, "_persisted_value", None)
+        return persisted_value is None or self._get_encoded_value() != persisted_value
+
     def to_python(self) -> Any:
         """
         Deserialize the value into the appropriate python type.
 
+        The parsed value is kept until the (raw) value is changed.
+        """
+        cache_key = (self.form_variable_id, timezone.get_current_timezone())
+        cached = getattr(self, "_python_value", None)
+        if cached is not None and cached[0] is self.value and cached[1] == cache_key:
+            return cached[2]
+
+        python_value = self._to_python()
+        self._python_value = (self.value, cache_key, python_value)
+        return python_value
+
+    def _to_python(self) -> Any:
+        """
+        Deserialize the value into the appropriate python type.
+
         TODO: for dates/datetimes, we rely on our django settings for timezone
         information, however - formio submission does send the user's configured
         timezone as metadata, which we can store on the submission/submission step
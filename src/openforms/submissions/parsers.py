@@ -12,4 +12,11 @@ class IgnoreValueFieldCamelCaseJSONParser(CamelCaseJSONParser):
 
 class IgnoreDataAndConfigJSONRenderer(CamelCaseJSONRenderer):
     # This is needed for fields in the submission step data that have keys with underscores
-    json_underscoreize = {"ignore_fields": ("data", "configuration")}
+    json_underscoreize = {
+        "ignore_fields": (
+            "data",
+            "configuration",
+            "configuration_patch",
+            "configuration_overlay",
+        )
+    }
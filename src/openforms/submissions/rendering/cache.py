@@ -0,0 +1,78 @@
+"""
+Cache the outcome of the form logic evaluation for rendering.
+
+After completion, a submission is rendered several times - the PDF report, the
+confirmation email, the registration (e-mail) payload and the summary each use their own
+:class:`openforms.submissions.rendering.Renderer`, often in different Celery tasks. Each
+renderer needs the logic evaluated for every step, which is by far the most expensive
+part of rendering.
+
+The logic outcome does not depend on the render mode, so it is computed once per
+completed submission and stored in the cache: the evaluated configuration, whether the
+step is applicable and the step data resulting from the logic. The cache key contains a
+fingerprint of the submission data and the form step configurations, and the version of
+the form, which is replaced when its logic rules or variables are edited (see
+:mod:`openforms.forms.cache`). This invalidates the entry as soon as any of them
+changes.
+"""
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, TypedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from openforms.formio.typing import FormioConfiguration
+from openforms.forms.cache import get_form_version
+from openforms.typing import DataMapping
+
+if TYPE_CHECKING:
+    from ..models import Submission, SubmissionStep
+
+__all__ = ["get_cache_key", "get_evaluated_steps", "store_evaluated_steps"]
+
+CACHE_PREFIX = "submissions:render"
+
+
+class EvaluatedStep(TypedDict):
+    configuration: FormioConfiguration
+    is_applicable: bool
+    data: DataMapping
+
+
+def get_cache_key(submission: "Submission", steps: list["SubmissionStep"]) -> str:
+    """
+    Compute the cache key for the (not yet evaluated) steps of a submission.
+
+    Only completed submissions are cached - an empty key is returned otherwise.
+    """
+    if not submission.is_completed or not settings.SUBMISSION_RENDER_CACHE_TIMEOUT:
+        return ""
+    fingerprint = json.dumps(
+        {
+            "data": submission.data,
+            "form": get_form_version(submission.form_id).token,
+            "steps": [
+                [str(step.form_step.uuid), step.form_step.form_definition.configuration]
+                for step in steps
+            ],
+        },
+        cls=DjangoJSONEncoder,
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+    return f"{CACHE_PREFIX}:{submission.uuid}:{digest}"
+
+
+def get_evaluated_steps(key: str) -> list[EvaluatedStep] | None:
+    if not key:
+        return None
+    return cache.get(key)
+
+
+def store_evaluated_steps(key: str, evaluated_steps: list[EvaluatedStep]) -> None:
+    if not key:
+        return
+    cache.set(key, evaluated_steps, timeout=settings.SUBMISSION_RENDER_CACHE_TIMEOUT)
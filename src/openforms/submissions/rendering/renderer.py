@@ -8,15 +8,23 @@ printable data.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterator
 
+from openforms.formio.service import OptionsIndexCache
 from openforms.forms.models import Form
 from openforms.variables.rendering.nodes import VariablesNode
 
 from ..form_logic import evaluate_form_logic
-from ..models import Submission
+from ..models import Submission, SubmissionStep
+from ..models.submission_step import DirtyData
 from .base import Node
+from .cache import (
+    EvaluatedStep,
+    get_cache_key,
+    get_evaluated_steps,
+    store_evaluated_steps,
+)
 from .constants import RenderModes
 from .nodes import FormNode, SubmissionStepNode
 from .utils import get_request
@@ -36,6 +44,10 @@ class Renderer:
     submission: Submission
     mode: RenderModes
     as_html: bool
+    # the option lookups are shared by all the formatted components
+    options_indexes: OptionsIndexCache = field(
+        init=False, default_factory=OptionsIndexCache
+    )
 
     def __post_init__(self):
         self.dummy_request = get_request()
@@ -69,8 +81,32 @@ class Renderer:
         """
         Produce only the direct child nodes.
         """
+        steps = self.steps
+        cache_key = get_cache_key(self.submission, steps)
+        evaluated_steps = get_evaluated_steps(cache_key)
+        if evaluated_steps is not None and len(evaluated_steps) == len(steps):
+            for step, evaluated_step in zip(steps, evaluated_steps):
+                step.form_step.form_definition.configuration = evaluated_step[
+                    "configuration"
+                ]
+                step.is_applicable = evaluated_step["is_applicable"]
+                step.data = DirtyData(evaluated_step["data"])
+                step._form_logic_evaluated = True
+                submission_step_node = SubmissionStepNode(renderer=self, step=step)
+                if submission_step_node.is_visible:
+                    yield submission_step_node
+        else:
+            yield from self._evaluate_steps(steps, cache_key)
+
+        variables_node = VariablesNode(renderer=self, submission=self.submission)
+        yield variables_node
+
+    def _evaluate_steps(
+        self, steps: list[SubmissionStep], cache_key: str
+    ) -> Iterator[SubmissionStepNode]:
         submission_data = self.submission.data
-        for step in self.steps:
+        evaluated_steps: list[EvaluatedStep] = []
+        for step in steps:
             new_configuration = evaluate_form_logic(
                 submission=self.submission,
                 step=step,
@@ -82,6 +118,13 @@ class Renderer:
             # an instance here without persisting it to the backend on purpose!
             # this replicates the run-time behaviour while filling out the form
             step.form_step.form_definition.configuration = new_configuration
+            evaluated_steps.append(
+                {
+                    "configuration": new_configuration,
+                    "is_applicable": step.is_applicable,
+                    "data": dict(step.data),
+                }
+            )
             submission_step_node = SubmissionStepNode(renderer=self, step=step)
             if not submission_step_node.is_visible:
                 continue
@@ -96,8 +139,8 @@ class Renderer:
             #     continue
             yield submission_step_node
 
-        variables_node = VariablesNode(renderer=self, submission=self.submission)
-        yield variables_node
+        # only store the complete outcome - the consumer may stop iterating early
+        store_evaluated_steps(cache_key, evaluated_steps)
 
     def __iter__(self) -> Iterator[Node]:
         """
@@ -1,19 +1,23 @@
 import logging
 
 from django.db import transaction
-from django.db.models import F
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
-from django.utils import timezone
 
-from openforms.forms.models.form_statistics import FormStatistics
+from openforms.authentication.models import AuthInfo, RegistratorInfo
+from openforms.forms.statistics import record_submission
+from openforms.payments.models import SubmissionPayment
 from openforms.submissions.models import (
     Submission,
     SubmissionFileAttachment,
     SubmissionReport,
+    SubmissionStep,
+    SubmissionValueVariable,
 )
 from openforms.utils.files import _delete_obj_files, get_file_field_names
 
+from .logic.cache import invalidate_logic_check
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,23 +87,21 @@ def delete_submission_report_files(
 
 @receiver(submission_complete, dispatch_uid="submission.increment_form_counter")
 def increment_form_counter(sender, instance: Submission, **kwargs):
-    submitted_form = instance.form
-
-    # TODO
-    # Replace get_or_create with update_or_create and do this in one block
-    # (needs Django v5.2+)
-    form_statistics, created = FormStatistics.objects.get_or_create(
-        form=submitted_form,
-        defaults={
-            "form": submitted_form,
-            "form_name": submitted_form.name,
-            "submission_count": 1,
-            "last_submission": timezone.now(),
-        },
-    )
-
-    if not created:
-        form_statistics.form_name = submitted_form.name
-        form_statistics.submission_count = F("submission_count") + 1
-        form_statistics.last_submission = timezone.now()
-        form_statistics.save()
+    # only record the submission, the counters are updated asynchronously so that
+    # concurrent completions of the same form don't contend for the same row
+    record_submission(instance.form)
+
+
+@receiver([post_save, post_delete], sender=Submission)
+def invalidate_submission_logic_check(sender, instance: Submission, **kwargs):
+    invalidate_logic_check(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=SubmissionStep)
+@receiver([post_save, post_delete], sender=SubmissionValueVariable)
+@receiver([post_save, post_delete], sender=SubmissionPayment)
+@receiver([post_save, post_delete], sender=AuthInfo)
+@receiver([post_save, post_delete], sender=RegistratorInfo)
+def invalidate_submission_related_logic_check(sender, instance, **kwargs):
+    # bulk operations don't send signals - these invalidate the cache explicitly
+    invalidate_logic_check(instance.submission_id)
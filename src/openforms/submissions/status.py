@@ -1,9 +1,17 @@
 """
 Utility to interact with the celery task status.
+
+The states of the tasks scheduled on submission completion are pushed to the cache as
+the tasks finish, so that the (frequently polled) status endpoint does not need to
+query the Celery result backend for every task. When no state is tracked in the cache
+(anymore), the result backend is used as fallback.
 """
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 
+from django.conf import settings
+from django.core.cache import cache
 from django.urls import reverse
 
 from celery import states
@@ -16,11 +24,60 @@ from .constants import ProcessingResults, ProcessingStatuses
 from .models import Submission
 from .utils import add_submmission_to_session, get_report_download_url
 
+CACHE_PREFIX = "submissions:processing-status"
+
+# interval (in seconds) between checks of the tracked state when long polling
+LONG_POLL_INTERVAL = 0.5
+
+
+def _get_cache_key(submission_id: int) -> str:
+    return f"{CACHE_PREFIX}:{submission_id}"
+
+
+def track_task_states(submission_id: int, task_ids: list[str]) -> None:
+    """
+    Start tracking the states of the tasks scheduled on submission completion.
+    """
+    task_states = {task_id: states.PENDING for task_id in task_ids}
+    cache.set(
+        _get_cache_key(submission_id),
+        task_states,
+        timeout=settings.SUBMISSION_PROCESSING_STATUS_CACHE_TIMEOUT,
+    )
+
+
+def update_task_state(submission_id: int, task_id: str, state: str) -> None:
+    """
+    Record the new state of a tracked task.
+
+    Tasks that are not tracked (e.g. tasks scheduled by other events than the
+    submission completion) are ignored. The tasks of a submission run one after the
+    other, so there are no concurrent updates of the same cache entry.
+    """
+    key = _get_cache_key(submission_id)
+    task_states: dict[str, str] | None = cache.get(key)
+    if task_states is None or task_id not in task_states:
+        return
+    task_states[task_id] = state
+    cache.set(
+        key, task_states, timeout=settings.SUBMISSION_PROCESSING_STATUS_CACHE_TIMEOUT
+    )
+
+
+def get_tracked_task_states(submission_id: int) -> list[str] | None:
+    task_states: dict[str, str] | None = cache.get(_get_cache_key(submission_id))
+    return None if task_states is None else list(task_states.values())
+
+
+def forget_task_states(submission_id: int) -> None:
+    cache.delete(_get_cache_key(submission_id))
+
 
 @dataclass
 class SubmissionProcessingStatus:
     request: Request
     submission: Submission
+    is_tracked: bool = field(default=False, init=False)
 
     def get_async_results(self) -> list[AsyncResult]:
         """Retrieve the results for the task scheduled ONLY when the submission was completed."""
@@ -48,12 +105,40 @@ class SubmissionProcessingStatus:
             self._all_async_results = [AsyncResult(task_id) for task_id in task_ids]
         return self._all_async_results
 
+    def get_task_states(self) -> list[str]:
+        """Retrieve the states of the tasks scheduled when the submission was completed.
+
+        The states pushed to the cache by the tasks take precedence over the (more
+        expensive) lookups in the Celery result backend.
+        """
+        if not hasattr(self, "_task_states"):
+            task_states = get_tracked_task_states(self.submission.pk)
+            self.is_tracked = task_states is not None
+            if task_states is None:
+                task_states = [result.state for result in self.get_async_results()]
+            self._task_states = task_states
+        return self._task_states
+
+    def wait_for_completion(self, timeout: float) -> None:
+        """
+        Block until the processing is done or the timeout (in seconds) expires.
+
+        Only the states tracked in the cache are checked repeatedly - if they're not
+        available, this returns immediately rather than hammering the result backend.
+        """
+        deadline = time.monotonic() + timeout
+        while self.status == ProcessingStatuses.in_progress:
+            if not self.is_tracked or time.monotonic() >= deadline:
+                return
+            time.sleep(LONG_POLL_INTERVAL)
+            del self._task_states
+
     @property
     def status(self) -> str:
-        results = self.get_async_results()
-        any_failed = any((result.state == states.FAILURE for result in results))
-        all_ready = all((result.state in states.READY_STATES for result in results))
-        if results and (any_failed or all_ready):
+        task_states = self.get_task_states()
+        any_failed = any((state == states.FAILURE for state in task_states))
+        all_ready = all((state in states.READY_STATES for state in task_states))
+        if task_states and (any_failed or all_ready):
             return ProcessingStatuses.done
         return ProcessingStatuses.in_progress
 
@@ -62,9 +147,9 @@ class SubmissionProcessingStatus:
         if self.status != ProcessingStatuses.done:
             return ""
 
-        results = self.get_async_results()
-        all_success = all((result.state == states.SUCCESS for result in results))
-        any_failed = any((result.state == states.FAILURE for result in results))
+        task_states = self.get_task_states()
+        all_success = all((state == states.SUCCESS for state in task_states))
+        any_failed = any((state == states.FAILURE for state in task_states))
 
         if all_success:
             return ProcessingResults.success
@@ -135,6 +220,7 @@ class SubmissionProcessingStatus:
         results = self.get_all_async_results()
         for result in results:
             result.forget()
+        forget_task_states(self.submission.pk)
 
     def ensure_failure_can_be_managed(self) -> None:
         """
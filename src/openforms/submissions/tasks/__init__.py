@@ -1,18 +1,24 @@
 import logging
 from datetime import timedelta
+from itertools import batched
 
 from django.conf import settings
 from django.utils import timezone
 
-from celery import chain
+from celery import Signature, chain
+from celery.exceptions import SoftTimeLimitExceeded
 from celery.result import AsyncResult
+from celery.signals import task_postrun
 
 from openforms.appointments.tasks import maybe_register_appointment
 from openforms.celery import app
 from openforms.config.models import GlobalConfiguration
+from openforms.registrations.service import registration_batch
+from openforms.registrations.throttling import RegistrationThrottled
 
 from ..constants import PostSubmissionEvents, RegistrationStatuses
 from ..models import PostCompletionMetadata, Submission
+from ..status import track_task_states, update_task_state
 from .cleanup import *  # noqa
 from .emails import *  # noqa
 from .payments import *  # noqa
@@ -23,16 +29,12 @@ from .user_uploads import *  # noqa
 logger = logging.getLogger(__name__)
 
 
-def on_post_submission_event(submission_id: int, event: PostSubmissionEvents) -> None:
+def _get_post_submission_tasks(
+    submission_id: int, event: PostSubmissionEvents
+) -> list[Signature]:
     """
-    Celery chain of tasks to execute on a submission completion or post completion event.
-
-    This SHOULD be invoked as a transaction.on_commit(...) handler, therefore it should
-    not execute any extra queries in the process this function is running in.
+    Build the (ordered) task signatures to process a submission after an event.
     """
-    # this can run any time because they have been claimed earlier
-    cleanup_temporary_files_for.delay(submission_id)
-
     # If the form involves appointments and no appointment has been scheduled yet, schedule it.
     # Todo: deprecated => Not needed with the new appointment flow
     register_appointment_task = maybe_register_appointment.si(submission_id)
@@ -55,19 +57,42 @@ def on_post_submission_event(submission_id: int, event: PostSubmissionEvents) ->
     # Finalise completion: schedule confirmation emails and maybe hash identifying attributes
     finalise_completion_task = finalise_completion.si(submission_id)
 
-    actions_chain = chain(
+    return [
         register_appointment_task,
         pre_registration_task,
         generate_report_task,
         register_submission_task,
         payment_status_update_task,
         finalise_completion_task,
-    )
+    ]
+
+
+def on_post_submission_event(
+    submission_id: int, event: PostSubmissionEvents, *, countdown: float | None = None
+) -> None:
+    """
+    Celery chain of tasks to execute on a submission completion or post completion event.
+
+    This SHOULD be invoked as a transaction.on_commit(...) handler, therefore it should
+    not execute any extra queries in the process this function is running in.
 
-    async_result: AsyncResult = actions_chain.delay()
+    :arg countdown: optional number of seconds to delay the start of the chain with.
+    """
+    # this can run any time because they have been claimed earlier
+    cleanup_temporary_files_for.delay(submission_id)
+
+    actions_chain = chain(*_get_post_submission_tasks(submission_id, event))
+
+    # freezing assigns the task IDs up front, so that the state of the tasks can be
+    # tracked before any of them runs
+    async_result: AsyncResult = actions_chain.freeze()
 
     # obtain all the task IDs so we can check the state later
     task_ids = async_result.as_list()
+    if event == PostSubmissionEvents.on_completion:
+        track_task_states(submission_id, task_ids)
+
+    actions_chain.apply_async(countdown=countdown)
 
     # NOTE - this is "risky" since we're running outside of the transaction (this code
     # should run in transaction.on_commit)!
@@ -93,12 +118,138 @@ def retry_processing_submissions():
     retry_time_limit = timezone.now() - timedelta(
         hours=settings.RETRY_SUBMISSIONS_TIME_LIMIT
     )
-    for submission in Submission.objects.filter(
+    submissions = Submission.objects.filter(
         needs_on_completion_retry=True,
         completed_on__gte=retry_time_limit,
-    ):
+    )
+
+    spread_period = settings.RETRY_SUBMISSIONS_SPREAD_PERIOD
+
+    if batch_size := settings.RETRY_SUBMISSIONS_BATCH_SIZE:
+        # keep submissions of the same form together, so that they're likely to end up
+        # in the same batch and share the registration backend resources
+        submission_ids = list(
+            submissions.order_by("form_id", "pk").values_list("pk", flat=True)
+        )
+        batches = list(batched(submission_ids, batch_size))
+        for index, batch in enumerate(batches):
+            logger.debug("Retry processing submissions batch %r", batch)
+            retry_processing_submissions_batch.apply_async(
+                args=(list(batch),),
+                countdown=_get_retry_countdown(index, len(batches), spread_period),
+            )
+        return
+
+    submissions = list(submissions)
+    for index, submission in enumerate(submissions):
         logger.debug("Retry processing submission '%s'", submission)
-        on_post_submission_event(submission.id, PostSubmissionEvents.on_retry)
+        on_post_submission_event(
+            submission.id,
+            PostSubmissionEvents.on_retry,
+            countdown=_get_retry_countdown(index, len(submissions), spread_period),
+        )
+
+
+def _get_retry_countdown(index: int, total: int, spread_period: int) -> float | None:
+    """
+    Spread the retries evenly over the spread period.
+    """
+    if not spread_period or not index:
+        return None
+    return spread_period * index / total
+
+
+def _needs_processing_before_registration(submission: Submission) -> bool:
+    """
+    Check if the tasks preceding the registration in the processing chain have work
+    left for the submission.
+    """
+    if not submission.pre_registration_completed:
+        return True
+    report = getattr(submission, "report", None)
+    if report is None or not report.content:
+        return True
+    appointment_info = getattr(submission, "appointment_info", None)
+    return appointment_info is not None and not appointment_info.appointment_id
+
+
+def _retry_registration_in_batch(submission: Submission) -> None:
+    if _needs_processing_before_registration(submission):
+        on_post_submission_event(submission.pk, PostSubmissionEvents.on_retry)
+        return
+
+    cleanup_temporary_files_for.delay(submission.pk)
+    tasks = _get_post_submission_tasks(submission.pk, PostSubmissionEvents.on_retry)
+    # the preceding tasks have nothing left to do, start with the registration
+    register_index = next(
+        index
+        for index, task in enumerate(tasks)
+        if task.task == register_submission.name
+    )
+    tasks = tasks[register_index:]
+    async_result: AsyncResult = chain(*tasks).freeze()
+    PostCompletionMetadata.objects.create(
+        tasks_ids=async_result.as_list(),
+        submission_id=submission.pk,
+        trigger_event=PostSubmissionEvents.on_retry,
+    )
+
+    register_task, *remaining_tasks = tasks
+    try:
+        register_task.apply(throw=True)
+    except RegistrationThrottled as exc:
+        logger.info(
+            "Registration of submission '%s' is throttled, retrying in %ss",
+            submission,
+            exc.countdown,
+        )
+        chain(*tasks).apply_async(countdown=exc.countdown)
+        return
+    except SoftTimeLimitExceeded:
+        raise
+    except Exception:
+        # like in a regular chain, a failed registration aborts the processing
+        logger.exception("Retry registering submission '%s' failed", submission)
+        return
+
+    if remaining_tasks:
+        chain(*remaining_tasks).apply_async()
+
+
+@app.task(ignore_result=True)
+def retry_processing_submissions_batch(submission_ids: list[int]) -> None:
+    """
+    Retry registering a batch of submissions in a single task.
+
+    The registrations are executed in this task, inside a
+    :func:`openforms.registrations.service.registration_batch` block so that the
+    registration plugins can re-use API clients and lookups between submissions. The
+    other tasks of the processing chain are dispatched to their (routed) queues, and
+    submissions for which the tasks preceding the registration still have work left
+    are retried with a regular processing chain.
+
+    When the registration backend is throttled, the registration is handed off to the
+    workers to run once the backend has capacity again. When the task runs out of time,
+    the remaining submissions are handed off to a new batch task.
+    """
+    submissions = Submission.objects.select_related(
+        "report", "appointment_info"
+    ).in_bulk(submission_ids)
+    with registration_batch():
+        for index, submission_id in enumerate(submission_ids):
+            if (submission := submissions.get(submission_id)) is None:
+                continue
+            logger.debug("Retry processing submission '%s'", submission)
+            try:
+                _retry_registration_in_batch(submission)
+            except SoftTimeLimitExceeded:
+                remaining_ids = submission_ids[index:]
+                logger.warning(
+                    "Retry processing batch ran out of time, handing off %d submissions",
+                    len(remaining_ids),
+                )
+                retry_processing_submissions_batch.apply_async(args=(remaining_ids,))
+                raise
 
 
 @app.task()
@@ -147,7 +298,27 @@ def finalise_completion(submission_id: int) -> None:
     schedule_emails_task = schedule_emails.si(submission_id)
     schedule_emails_task.delay()
 
-    hash_identifying_attributes_task = maybe_hash_identifying_attributes.si(
-        submission_id
-    )
-    hash_identifying_attributes_task.delay()
+    # the identifying attributes are hashed in batches by the periodic
+    # hash_pending_identifying_attributes task
+
+
+POST_SUBMISSION_TASKS = {
+    maybe_register_appointment.name,
+    pre_registration.name,
+    generate_submission_report.name,
+    register_submission.name,
+    update_submission_payment_status.name,
+    finalise_completion.name,
+}
+
+
+@task_postrun.connect
+def push_post_submission_task_state(
+    sender=None, task_id=None, args=None, state=None, **kwargs
+):
+    """
+    Push the state of a finished post submission task to the processing status cache.
+    """
+    if sender is None or sender.name not in POST_SUBMISSION_TASKS or not args:
+        return
+    update_task_state(submission_id=args[0], task_id=task_id, state=state)
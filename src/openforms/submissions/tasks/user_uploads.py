@@ -1,3 +1,4 @@
+import time
 from datetime import timedelta
 
 from django.conf import settings
@@ -5,6 +6,7 @@ from django.conf import settings
 from openforms.celery import app
 
 from ..attachments import (
+    cleanup_orphaned_temporary_upload_files,
     cleanup_submission_temporary_uploaded_files,
     cleanup_unclaimed_temporary_uploaded_files,
     resize_attachment,
@@ -26,8 +28,22 @@ def cleanup_temporary_files_for(submission_id: int) -> None:
 
 @app.task(ignore_result=True)
 def cleanup_unclaimed_temporary_files() -> None:
-    days = settings.TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS
-    cleanup_unclaimed_temporary_uploaded_files(timedelta(days=days))
+    """
+    Delete the unclaimed temporary uploads and the orphaned upload files.
+
+    The cleanup runs within a time budget - if there's more work left after that, a
+    new task is scheduled to resume the cleanup, so that a large backlog doesn't block
+    the worker or run into the task time limits.
+    """
+    age = timedelta(days=settings.TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS)
+    deadline = time.monotonic() + settings.TEMPORARY_UPLOADS_CLEANUP_TIME_BUDGET
+
+    if not cleanup_unclaimed_temporary_uploaded_files(age, deadline=deadline):
+        cleanup_unclaimed_temporary_files.delay()
+        return
+
+    if not cleanup_orphaned_temporary_upload_files(age, deadline=deadline):
+        cleanup_unclaimed_temporary_files.delay()
 
 
 @app.task(ignore_result=True)
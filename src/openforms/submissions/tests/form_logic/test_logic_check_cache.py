@@ -0,0 +1,155 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from openforms.authentication.tests.factories import AuthInfoFactory
+from openforms.forms.tests.factories import FormLogicFactory
+from openforms.utils.tests.cache import clear_caches
+
+from ...form_logic import evaluate_form_logic
+from ..factories import SubmissionFactory
+from ..mixins import SubmissionsMixin
+
+
+@override_settings(SUBMISSION_LOGIC_CHECK_CACHE_TIMEOUT=60)
+class LogicCheckCacheTests(SubmissionsMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.submission = SubmissionFactory.from_components(
+            components_list=[
+                {"type": "textfield", "key": "input1", "label": "Input 1"},
+                {"type": "textfield", "key": "input2", "label": "Input 2"},
+            ],
+        )
+        self.form_step = self.submission.form.formstep_set.get()
+        self.logic_rule = FormLogicFactory.create(
+            form=self.submission.form,
+            json_logic_trigger={"==": [{"var": "input1"}, "hide"]},
+            actions=[
+                {
+                    "component": "input2",
+                    "action": {
+                        "type": "property",
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        self._add_submission_to_session(self.submission)
+        self.url = reverse(
+            "api:submission-steps-logic-check",
+            kwargs={
+                "submission_uuid": self.submission.uuid,
+                "step_uuid": self.form_step.uuid,
+            },
+        )
+
+    def _check_logic(self, data: dict, headers: dict | None = None):
+        with patch(
+            "openforms.submissions.api.viewsets.evaluate_form_logic",
+            wraps=evaluate_form_logic,
+        ) as mock_evaluate_form_logic:
+            response = self.client.post(self.url, {"data": data}, headers=headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, mock_evaluate_form_logic.called
+
+    def _get_input2(self, response) -> dict:
+        components = response.json()["step"]["formStep"]["configuration"]["components"]
+        return next(
+            component for component in components if component["key"] == "input2"
+        )
+
+    @freeze_time("2024-01-01T12:00:00Z")
+    def test_identical_check_is_served_from_the_cache(self):
+        response, evaluated = self._check_logic({"input1": "hide"})
+
+        self.assertTrue(evaluated)
+        self.assertTrue(self._get_input2(response)["hidden"])
+
+        cached_response, evaluated = self._check_logic({"input1": "hide"})
+
+        self.assertFalse(evaluated)
+        self.assertEqual(cached_response.json(), response.json())
+
+        with self.subTest("different input"):
+            response, evaluated = self._check_logic({"input1": "show"})
+
+            self.assertTrue(evaluated)
+            self.assertFalse(self._get_input2(response).get("hidden"))
+
+    def test_time_is_part_of_the_key(self):
+        with freeze_time("2024-01-01T12:00:00Z"):
+            self._check_logic({"input1": "hide"})
+        with freeze_time("2024-01-01T12:00:59Z"):
+            _, evaluated = self._check_logic({"input1": "hide"})
+
+            self.assertFalse(evaluated)
+
+        with freeze_time("2024-01-01T12:01:00Z"):
+            _, evaluated = self._check_logic({"input1": "hide"})
+
+            self.assertTrue(evaluated)
+
+    @freeze_time("2024-01-01T12:00:00Z")
+    def test_persisted_changes_invalidate_the_cache(self):
+        self._check_logic({"input1": "hide"})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.submission.save()
+
+        _, evaluated = self._check_logic({"input1": "hide"})
+
+        self.assertTrue(evaluated)
+
+    @freeze_time("2024-01-01T12:00:00Z")
+    def test_authentication_invalidates_the_cache(self):
+        self._check_logic({"input1": "hide"})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AuthInfoFactory.create(submission=self.submission)
+
+        _, evaluated = self._check_logic({"input1": "hide"})
+
+        self.assertTrue(evaluated)
+
+    @freeze_time("2024-01-01T12:00:00Z")
+    def test_csp_nonce_is_part_of_the_key(self):
+        self._check_logic({"input1": "hide"}, headers={"X-CSP-Nonce": "Zmlyc3Q="})
+
+        _, evaluated = self._check_logic(
+            {"input1": "hide"}, headers={"X-CSP-Nonce": "c2Vjb25k"}
+        )
+
+        self.assertTrue(evaluated)
+
+    @freeze_time("2024-01-01T12:00:00Z")
+    def test_logic_changes_invalidate_the_cache(self):
+        self._check_logic({"input1": "hide"})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.logic_rule.json_logic_trigger = {"==": [{"var": "input1"}, "other"]}
+            self.logic_rule.save()
+
+        response, evaluated = self._check_logic({"input1": "hide"})
+
+        self.assertTrue(evaluated)
+        self.assertFalse(self._get_input2(response).get("hidden"))
+
+    @override_settings(SUBMISSION_LOGIC_CHECK_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        self._check_logic({"input1": "hide"})
+
+        _, evaluated = self._check_logic({"input1": "hide"})
+
+        self.assertTrue(evaluated)
@@ -0,0 +1,191 @@
+from unittest.mock import ANY, MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from openforms.forms.step_configuration import get_configuration_revision
+from openforms.forms.tests.factories import FormLogicFactory
+from openforms.utils.tests.cache import clear_caches
+
+from ...logic.delta import get_delta_payload
+from ..factories import SubmissionFactory
+from ..mixins import SubmissionsMixin
+
+
+class LogicCheckDeltaProtocolTests(SubmissionsMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.submission = SubmissionFactory.from_components(
+            components_list=[
+                {"type": "textfield", "key": "input1", "label": "Input 1"},
+                {"type": "textfield", "key": "input2", "label": "Input 2"},
+            ],
+            submitted_data={"input1": "show", "input2": "foo"},
+        )
+        form_step = self.submission.form.formstep_set.get()
+        FormLogicFactory.create(
+            form=self.submission.form,
+            json_logic_trigger={"==": [{"var": "input1"}, "hide"]},
+            actions=[
+                {
+                    "component": "input2",
+                    "action": {
+                        "type": "property",
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        self._add_submission_to_session(self.submission)
+        self.url = reverse(
+            "api:submission-steps-logic-check",
+            kwargs={
+                "submission_uuid": self.submission.uuid,
+                "step_uuid": form_step.uuid,
+            },
+        )
+
+    def _check_logic(self, body: dict) -> dict:
+        response = self.client.post(self.url, body)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()["step"]["formStep"]
+
+    def test_full_configuration_without_revision(self):
+        form_step = self._check_logic({"data": {}, "delta": True})
+
+        self.assertIn("configuration", form_step)
+        self.assertNotIn("configurationPatch", form_step)
+        self.assertTrue(form_step["configurationRevision"])
+
+    def test_patch_against_known_revision(self):
+        revision = self._check_logic({"data": {}, "delta": True})[
+            "configurationRevision"
+        ]
+
+        form_step = self._check_logic(
+            {
+                "data": {"input1": "hide"},
+                "delta": True,
+                "configurationRevision": revision,
+            }
+        )
+
+        self.assertNotIn("configuration", form_step)
+        self.assertNotEqual(form_step["configurationRevision"], revision)
+        hidden_operations = [
+            operation
+            for operation in form_step["configurationPatch"]
+            if operation["path"] == "/components/1/hidden"
+        ]
+        self.assertEqual(len(hidden_operations), 1)
+        self.assertIn(hidden_operations[0]["op"], ("add", "replace"))
+        self.assertTrue(hidden_operations[0]["value"])
+
+        with self.subTest("unchanged configuration"):
+            unchanged = self._check_logic(
+                {
+                    "data": {"input1": "hide"},
+                    "delta": True,
+                    "configurationRevision": form_step["configurationRevision"],
+                }
+            )
+
+            self.assertEqual(unchanged["configurationPatch"], [])
+
+    def test_unknown_revision_falls_back_to_the_full_configuration(self):
+        form_step = self._check_logic(
+            {"data": {}, "delta": True, "configurationRevision": "unknown"}
+        )
+
+        self.assertIn("configuration", form_step)
+        self.assertNotIn("configurationPatch", form_step)
+
+    def test_changed_values_are_merged_with_the_saved_data(self):
+        response = self.client.post(
+            self.url, {"data": {"input2": "bar"}, "delta": True}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        step = response.json()["step"]
+        self.assertEqual(step["data"]["input1"], "show")
+        self.assertEqual(step["data"]["input2"], "bar")
+
+    def test_protocol_is_opt_in(self):
+        form_step = self._check_logic({"data": {"input1": "hide"}})
+
+        self.assertIn("configuration", form_step)
+        self.assertNotIn("configurationRevision", form_step)
+
+
+class DeltaPayloadCacheTests(SimpleTestCase):
+    configuration = {"components": [{"type": "textfield", "key": "input1"}]}
+
+    def _get_payload(self) -> dict:
+        return {"step": {"form_step": {"configuration": self.configuration}}}
+
+    @patch("openforms.submissions.logic.delta.cache")
+    def test_unchanged_revision_is_not_stored_again(self, mock_cache):
+        revision = get_configuration_revision(self.configuration)
+        mock_cache.get.return_value = (revision, self.configuration)
+
+        payload = get_delta_payload(self._get_payload(), MagicMock(), revision)
+
+        self.assertEqual(payload["step"]["form_step"]["configuration_patch"], [])
+        mock_cache.touch.assert_called_once()
+        mock_cache.set.assert_not_called()
+
+    @patch("openforms.submissions.logic.delta.cache")
+    def test_expired_unchanged_revision_is_stored(self, mock_cache):
+        mock_cache.get.return_value = None
+        revision = get_configuration_revision(self.configuration)
+
+        payload = get_delta_payload(self._get_payload(), MagicMock(), revision)
+
+        # the client already has this configuration
+        self.assertEqual(payload["step"]["form_step"]["configuration_patch"], [])
+        mock_cache.set.assert_called_once()
+
+    @patch("openforms.submissions.logic.delta.cache")
+    def test_only_the_latest_revision_is_kept(self, mock_cache):
+        latest_configuration = {"components": []}
+        latest_revision = get_configuration_revision(latest_configuration)
+        mock_cache.get.return_value = (latest_revision, latest_configuration)
+        revision = get_configuration_revision(self.configuration)
+
+        with self.subTest("patch against the latest revision"):
+            payload = get_delta_payload(
+                self._get_payload(), MagicMock(), latest_revision
+            )
+
+            self.assertIn("configuration_patch", payload["step"]["form_step"])
+            mock_cache.set.assert_called_once_with(
+                ANY, (revision, self.configuration), timeout=ANY
+            )
+
+        with self.subTest("older revision"):
+            payload = get_delta_payload(self._get_payload(), MagicMock(), "older")
+
+            self.assertEqual(
+                payload["step"]["form_step"]["configuration"], self.configuration
+            )
+
+    @patch("openforms.submissions.logic.delta.cache")
+    def test_new_revision_is_stored(self, mock_cache):
+        mock_cache.get.return_value = None
+
+        payload = get_delta_payload(self._get_payload(), MagicMock(), "")
+
+        self.assertEqual(
+            payload["step"]["form_step"]["configuration"], self.configuration
+        )
+        mock_cache.set.assert_called_once()
+        mock_cache.touch.assert_not_called()
@@ -0,0 +1,162 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from openforms.forms.tests.factories import FormLogicFactory
+from openforms.utils.tests.cache import clear_caches
+
+from ...form_logic import evaluate_form_logic
+from ...models import Submission
+from ...rendering import Renderer, RenderModes
+from ...rendering.nodes import SubmissionStepNode, VariablesNode
+from ..factories import SubmissionFactory
+
+
+@override_settings(SUBMISSION_RENDER_CACHE_TIMEOUT=60)
+class RenderCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.submission = SubmissionFactory.from_components(
+            components_list=[
+                {"type": "textfield", "key": "input1", "label": "Input 1"},
+                {"type": "textfield", "key": "input2", "label": "Input 2"},
+            ],
+            submitted_data={"input1": "hide", "input2": "foo"},
+            completed=True,
+        )
+        FormLogicFactory.create(
+            form=cls.submission.form,
+            json_logic_trigger={"==": [{"var": "input1"}, "hide"]},
+            actions=[
+                {
+                    "component": "input2",
+                    "action": {
+                        "type": "property",
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    def _render(self, mode: RenderModes) -> list[str]:
+        # every post-completion task loads its own submission instance
+        submission = Submission.objects.get(pk=self.submission.pk)
+        renderer = Renderer(submission=submission, mode=mode, as_html=False)
+        return [node.render() for node in renderer]
+
+    def test_logic_is_evaluated_once_for_all_render_modes(self):
+        with patch(
+            "openforms.submissions.rendering.renderer.evaluate_form_logic",
+            wraps=evaluate_form_logic,
+        ) as mock_evaluate_form_logic:
+            results = {
+                mode: self._render(mode)
+                for mode in (
+                    RenderModes.pdf,
+                    RenderModes.confirmation_email,
+                    RenderModes.registration,
+                    RenderModes.summary,
+                )
+            }
+
+        # one logic pass for the single step
+        self.assertEqual(mock_evaluate_form_logic.call_count, 1)
+        for mode in (RenderModes.pdf, RenderModes.summary):
+            rendered = results[mode]
+            with self.subTest(mode=mode):
+                self.assertIn("Input 1: hide", rendered)
+                self.assertNotIn("Input 2: foo", rendered)
+
+    def test_changed_data_invalidates_the_cache(self):
+        self._render(RenderModes.pdf)
+        variable = self.submission.submissionvaluevariable_set.get(key="input1")
+        variable.value = "show"
+        variable.save()
+
+        with patch(
+            "openforms.submissions.rendering.renderer.evaluate_form_logic",
+            wraps=evaluate_form_logic,
+        ) as mock_evaluate_form_logic:
+            rendered = self._render(RenderModes.pdf)
+
+        self.assertEqual(mock_evaluate_form_logic.call_count, 1)
+        self.assertIn("Input 2: foo", rendered)
+
+    def test_changed_logic_rules_invalidate_the_cache(self):
+        self._render(RenderModes.pdf)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.submission.form.formlogic_set.all().delete()
+
+        with patch(
+            "openforms.submissions.rendering.renderer.evaluate_form_logic",
+            wraps=evaluate_form_logic,
+        ) as mock_evaluate_form_logic:
+            rendered = self._render(RenderModes.pdf)
+
+        self.assertEqual(mock_evaluate_form_logic.call_count, 1)
+        self.assertIn("Input 2: foo", rendered)
+
+    def test_variables_are_rendered_once(self):
+        for cached in (False, True):
+            submission = Submission.objects.get(pk=self.submission.pk)
+            renderer = Renderer(
+                submission=submission, mode=RenderModes.pdf, as_html=False
+            )
+
+            nodes = list(renderer.get_children())
+
+            with self.subTest(cached=cached):
+                self.assertEqual(
+                    len([node for node in nodes if isinstance(node, VariablesNode)]),
+                    1,
+                )
+
+    def test_incomplete_submissions_are_not_cached(self):
+        submission = SubmissionFactory.from_components(
+            components_list=[{"type": "textfield", "key": "input1"}],
+            submitted_data={"input1": "foo"},
+        )
+
+        with patch(
+            "openforms.submissions.rendering.renderer.evaluate_form_logic",
+            wraps=evaluate_form_logic,
+        ) as mock_evaluate_form_logic:
+            for _ in range(2):
+                renderer = Renderer(
+                    submission=Submission.objects.get(pk=submission.pk),
+                    mode=RenderModes.pdf,
+                    as_html=False,
+                )
+                list(renderer)
+
+        self.assertEqual(mock_evaluate_form_logic.call_count, 2)
+
+    @override_settings(SUBMISSION_RENDER_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        with patch(
+            "openforms.submissions.rendering.renderer.evaluate_form_logic",
+            wraps=evaluate_form_logic,
+        ) as mock_evaluate_form_logic:
+            self._render(RenderModes.pdf)
+            self._render(RenderModes.pdf)
+
+        self.assertEqual(mock_evaluate_form_logic.call_count, 2)
+
+    def test_cached_steps_are_marked_as_evaluated(self):
+        self._render(RenderModes.pdf)
+        submission = Submission.objects.get(pk=self.submission.pk)
+        renderer = Renderer(submission=submission, mode=RenderModes.pdf, as_html=False)
+
+        step_nodes = [node for node in renderer if isinstance(node, SubmissionStepNode)]
+
+        self.assertEqual(len(step_nodes), 1)
+        self.assertTrue(step_nodes[0].step._form_logic_evaluated)
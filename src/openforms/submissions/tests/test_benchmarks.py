@@ -0,0 +1,113 @@
+import json
+import tempfile
+from copy import deepcopy
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from openforms.formio.datastructures import FormioData
+from openforms.forms.models import Form
+
+from ..benchmarks import FormSpec, run_benchmarks, run_formio_data_benchmarks
+from ..benchmarks.formio_data import GlomFormioData
+from ..models import Submission
+
+SMALL_SPEC = FormSpec(steps=2, components=6, depth=1, editgrids=1, rules=2, variables=1)
+
+
+class BenchmarkTests(TestCase):
+    """
+    Smoke tests for the benchmarks - the timings are reported by the management command.
+    """
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(SMALL_SPEC, rounds=2, export_rows=2)
+
+        self.assertEqual(
+            [result.name for result in results],
+            [
+                "step_get",
+                "step_put",
+                "check_logic",
+                "completion_validation",
+                "report_html",
+                "export",
+            ],
+        )
+        for result in results:
+            with self.subTest(result.name):
+                summary = result.as_dict()
+
+                self.assertEqual(summary["rounds"], 2)
+                self.assertEqual(len(summary["queries"]), 2)
+                self.assertGreater(summary["min"], 0)
+        self.assertEqual(results[-1].items, 2)
+
+    def test_run_benchmarks_with_content_blocks(self):
+        spec = FormSpec(
+            steps=1,
+            components=2,
+            rules=0,
+            variables=0,
+            content_blocks=3,
+            content_size=2,
+        )
+
+        results = run_benchmarks(spec, rounds=1, export_rows=0)
+
+        self.assertEqual(results[-1].name, "content_post_processing")
+        self.assertEqual(results[-1].items, 3)
+
+    def test_run_formio_data_benchmarks(self):
+        results = run_formio_data_benchmarks(rounds=1, operations=10)
+
+        names = {result.name for result in results}
+        self.assertIn("formio_data_getitem_dotted[path_accessor]", names)
+        self.assertIn("formio_data_getitem_dotted[glom]", names)
+        self.assertEqual(len(results), 16)
+
+    def test_glom_reference_implementation_is_equivalent(self):
+        data = FormioData({"plain": 1, "nested": {"list": [{"key": "value"}]}})
+        reference = GlomFormioData(deepcopy(data.data))
+
+        for key in ("plain", "nested.list", "nested.list.0.key"):
+            with self.subTest(key=key):
+                self.assertEqual(reference[key], data[key])
+                self.assertIn(key, reference)
+        self.assertNotIn("nested.missing", reference)
+
+        reference["new.nested"] = "value"
+        data["new.nested"] = "value"
+        self.assertEqual(reference.data, data.data)
+
+    def test_synthetic_data_is_rolled_back(self):
+        run_benchmarks(SMALL_SPEC, rounds=1, export_rows=0)
+
+        self.assertFalse(Form.objects.exists())
+        self.assertFalse(Submission.objects.exists())
+
+    @override_settings(DEBUG=True)
+    def test_management_command_writes_json(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "results.json"
+
+            call_command(
+                "benchmark_form_engine",
+                steps=1,
+                components=3,
+                rules=1,
+                variables=0,
+                rounds=1,
+                export_rows=0,
+                output=output,
+                stdout=StringIO(),
+            )
+
+            results = json.loads(output.read_text())
+
+        self.assertEqual(results["spec"]["steps"], 1)
+        self.assertEqual(results["spec"]["components"], 3)
+        self.assertEqual(len(results["results"]), 5)
+        self.assertEqual(len(results["microbenchmarks"]), 16)
@@ -1,10 +1,11 @@
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from django.conf import settings
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
+from celery.exceptions import SoftTimeLimitExceeded
 from privates.test import temp_private_root
 
 from openforms.appointments.tests.factories import AppointmentInfoFactory
@@ -12,9 +13,16 @@ from openforms.registrations.contrib.zgw_apis.tests.factories import (
     ZGWApiGroupConfigFactory,
 )
 from openforms.registrations.exceptions import RegistrationFailed
+from openforms.registrations.tasks import register_submission
+from openforms.registrations.throttling import RegistrationThrottled
 
 from ..constants import PostSubmissionEvents, RegistrationStatuses
-from ..tasks import on_post_submission_event, retry_processing_submissions
+from ..models import PostCompletionMetadata
+from ..tasks import (
+    on_post_submission_event,
+    retry_processing_submissions,
+    retry_processing_submissions_batch,
+)
 from .factories import SubmissionFactory
 
 
@@ -313,5 +321,165 @@ class RetrySubmissionTest(TestCase):
 
         self.assertEqual(m.call_count, 1)
         m.assert_called_once_with(
-            failed_within_time_limit.id, PostSubmissionEvents.on_retry
+            failed_within_time_limit.id, PostSubmissionEvents.on_retry, countdown=None
+        )
+
+    @override_settings(RETRY_SUBMISSIONS_BATCH_SIZE=2)
+    @patch("openforms.submissions.tasks.retry_processing_submissions_batch.apply_async")
+    def test_resend_submissions_in_batches(self, mock_apply_async):
+        submissions = SubmissionFactory.create_batch(
+            3,
+            registration_failed=True,
+            needs_on_completion_retry=True,
+            completed_on=timezone.now(),
+        )
+
+        with patch(
+            "openforms.submissions.tasks.on_post_submission_event"
+        ) as mock_on_post_submission_event:
+            retry_processing_submissions()
+
+        mock_on_post_submission_event.assert_not_called()
+        self.assertEqual(mock_apply_async.call_count, 2)
+        batched_ids = [
+            submission_id
+            for call in mock_apply_async.call_args_list
+            for submission_id in call.kwargs["args"][0]
+        ]
+        self.assertEqual(
+            sorted(batched_ids), sorted(submission.pk for submission in submissions)
+        )
+
+    @override_settings(RETRY_SUBMISSIONS_SPREAD_PERIOD=300)
+    @patch("openforms.submissions.tasks.on_post_submission_event")
+    def test_resend_submissions_spread_over_time(self, m):
+        submissions = SubmissionFactory.create_batch(
+            3,
+            registration_failed=True,
+            needs_on_completion_retry=True,
+            completed_on=timezone.now(),
+        )
+
+        retry_processing_submissions()
+
+        self.assertEqual(m.call_count, 3)
+        countdowns = sorted(call.kwargs["countdown"] or 0 for call in m.call_args_list)
+        self.assertEqual(countdowns, [0, 100, 200])
+        self.assertEqual(
+            {call.args[0] for call in m.call_args_list},
+            {submission.pk for submission in submissions},
+        )
+
+
+@temp_private_root()
+@patch("openforms.submissions.tasks.cleanup_temporary_files_for.delay")
+@patch(
+    "openforms.submissions.tasks.chain",
+    **{"return_value.freeze.return_value.as_list.return_value": ["task-1"]},
+)
+@patch("openforms.submissions.tasks._get_post_submission_tasks")
+class RetryProcessingSubmissionsBatchTests(TestCase):
+    def _get_tasks(self) -> list[MagicMock]:
+        names = [
+            "openforms.appointments.tasks.maybe_register_appointment",
+            "openforms.registrations.tasks.pre_registration",
+            "openforms.submissions.tasks.pdf.generate_submission_report",
+            register_submission.name,
+            "openforms.payments.tasks.update_submission_payment_status",
+            "openforms.submissions.tasks.finalise_completion",
+        ]
+        return [MagicMock(task=name) for name in names]
+
+    def test_registration_runs_inline_and_the_rest_is_dispatched(
+        self, mock_get_tasks, mock_chain, mock_cleanup
+    ):
+        submission = SubmissionFactory.create(
+            registration_failed=True, with_report=True
+        )
+        tasks = self._get_tasks()
+        mock_get_tasks.return_value = tasks
+
+        retry_processing_submissions_batch([submission.pk])
+
+        for task in tasks[:3]:
+            task.apply.assert_not_called()
+        tasks[3].apply.assert_called_once_with(throw=True)
+        mock_chain.assert_called_with(*tasks[4:])
+        mock_chain.return_value.apply_async.assert_called_once_with()
+        mock_cleanup.assert_called_once_with(submission.pk)
+        metadata = PostCompletionMetadata.objects.get(
+            trigger_event=PostSubmissionEvents.on_retry
+        )
+        self.assertEqual(metadata.submission, submission)
+        self.assertEqual(metadata.tasks_ids, ["task-1"])
+
+    @patch("openforms.submissions.tasks.on_post_submission_event")
+    def test_submissions_with_pending_preceding_tasks_use_the_regular_chain(
+        self, mock_on_post_submission_event, mock_get_tasks, mock_chain, mock_cleanup
+    ):
+        submission = SubmissionFactory.create(registration_failed=True)
+
+        retry_processing_submissions_batch([submission.pk])
+
+        mock_on_post_submission_event.assert_called_once_with(
+            submission.pk, PostSubmissionEvents.on_retry
+        )
+        mock_get_tasks.assert_not_called()
+
+    def test_batch_failure_only_aborts_failing_submission(
+        self, mock_get_tasks, mock_chain, mock_cleanup
+    ):
+        submission1, submission2 = SubmissionFactory.create_batch(
+            2, registration_failed=True, with_report=True
+        )
+        failing_tasks = self._get_tasks()
+        failing_tasks[3].apply.side_effect = RegistrationFailed("nope")
+        succeeding_tasks = self._get_tasks()
+        mock_get_tasks.side_effect = [failing_tasks, succeeding_tasks]
+
+        retry_processing_submissions_batch([submission1.pk, submission2.pk])
+
+        failing_tasks[3].apply.assert_called_once_with(throw=True)
+        succeeding_tasks[3].apply.assert_called_once_with(throw=True)
+        # only the remainder of the succeeding submission is dispatched
+        mock_chain.assert_called_with(*succeeding_tasks[4:])
+        mock_chain.return_value.apply_async.assert_called_once_with()
+        self.assertEqual(mock_cleanup.call_count, 2)
+
+    def test_batch_hands_off_throttled_registration(
+        self, mock_get_tasks, mock_chain, mock_cleanup
+    ):
+        submission = SubmissionFactory.create(
+            registration_failed=True, with_report=True
+        )
+        tasks = self._get_tasks()
+        tasks[3].apply.side_effect = RegistrationThrottled(
+            "stuf-zds-create-zaak", countdown=10
+        )
+        mock_get_tasks.return_value = tasks
+
+        retry_processing_submissions_batch([submission.pk])
+
+        mock_chain.assert_called_with(*tasks[3:])
+        mock_chain.return_value.apply_async.assert_called_once_with(countdown=10)
+
+    @patch("openforms.submissions.tasks.retry_processing_submissions_batch.apply_async")
+    def test_batch_hands_off_remaining_submissions_on_soft_time_limit(
+        self, mock_apply_async, mock_get_tasks, mock_chain, mock_cleanup
+    ):
+        submission1, submission2, submission3 = SubmissionFactory.create_batch(
+            3, registration_failed=True, with_report=True
+        )
+        succeeding_tasks = self._get_tasks()
+        interrupted_tasks = self._get_tasks()
+        interrupted_tasks[3].apply.side_effect = SoftTimeLimitExceeded()
+        mock_get_tasks.side_effect = [succeeding_tasks, interrupted_tasks]
+        submission_ids = [submission1.pk, submission2.pk, submission3.pk]
+
+        with self.assertRaises(SoftTimeLimitExceeded):
+            retry_processing_submissions_batch(submission_ids)
+
+        mock_apply_async.assert_called_once_with(
+            args=([submission2.pk, submission3.pk],)
         )
+        self.assertEqual(mock_get_tasks.call_count, 2)
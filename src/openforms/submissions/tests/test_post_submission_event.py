@@ -6,6 +6,7 @@ from django.core import mail
 from django.test import TestCase, override_settings, tag
 from django.utils.translation import gettext_lazy as _
 
+from celery import states
 from freezegun import freeze_time
 from privates.test import temp_private_root
 from testfixtures import LogCapture
@@ -22,10 +23,12 @@ from openforms.registrations.base import PreRegistrationResult
 from openforms.registrations.contrib.zgw_apis.tests.factories import (
     ZGWApiGroupConfigFactory,
 )
+from openforms.utils.tests.cache import clear_caches
 from openforms.utils.tests.logging import ensure_logger_level
 
 from ..constants import PostSubmissionEvents
 from ..models import SubmissionReport
+from ..status import get_tracked_task_states
 from ..tasks import on_post_submission_event
 from .factories import SubmissionFactory
 
@@ -1099,6 +1102,45 @@ class TaskOrchestrationPostSubmissionEventTests(TestCase):
         )
         self.assertEqual(submission.registration_attempts, 1)
 
+    def test_task_states_are_tracked_on_completion(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+        submission = SubmissionFactory.from_components(
+            components_list=[{"key": "foo", "type": "textfield", "label": "Foo"}],
+            submitted_data={"foo": "bar"},
+            completed_not_preregistered=True,
+            form__registration_backend="email",
+            form__registration_backend_options={"to_emails": ["test@registration.nl"]},
+        )
+
+        with patch(
+            "openforms.registrations.contrib.email.plugin.EmailRegistration.register_submission"
+        ):
+            on_post_submission_event(submission.id, PostSubmissionEvents.on_completion)
+
+        task_states = get_tracked_task_states(submission.id)
+        assert task_states is not None
+        self.assertEqual(len(task_states), 6)
+        self.assertTrue(all(state == states.SUCCESS for state in task_states))
+
+    def test_task_states_are_not_tracked_for_other_events(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+        submission = SubmissionFactory.from_components(
+            components_list=[{"key": "foo", "type": "textfield", "label": "Foo"}],
+            submitted_data={"foo": "bar"},
+            completed_not_preregistered=True,
+            form__registration_backend="email",
+            form__registration_backend_options={"to_emails": ["test@registration.nl"]},
+        )
+
+        with patch(
+            "openforms.registrations.contrib.email.plugin.EmailRegistration.register_submission"
+        ):
+            on_post_submission_event(submission.id, PostSubmissionEvents.on_retry)
+
+        self.assertIsNone(get_tracked_task_states(submission.id))
+
 
 @temp_private_root()
 @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
@@ -2,7 +2,7 @@ from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import patch
 
-from django.test import TestCase, tag
+from django.test import TestCase, override_settings, tag
 from django.utils import timezone
 
 from celery import states
@@ -17,6 +17,7 @@ from openforms.config.models import GlobalConfiguration
 from openforms.payments.constants import PaymentStatus
 from openforms.payments.contrib.ogone.tests.factories import OgoneMerchantFactory
 from openforms.payments.tests.factories import SubmissionPaymentFactory
+from openforms.utils.tests.cache import clear_caches
 
 from ..constants import (
     SUBMISSIONS_SESSION_KEY,
@@ -24,6 +25,7 @@ from ..constants import (
     ProcessingResults,
     ProcessingStatuses,
 )
+from ..status import get_tracked_task_states, track_task_states, update_task_state
 from ..tasks import cleanup_on_completion_results
 from ..tokens import submission_status_token_generator
 from .factories import (
@@ -427,6 +429,102 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             self.assertEqual(response_data["paymentUrl"], "")
 
 
+class SubmissionStatusTrackedStatesTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.submission = SubmissionFactory.create(
+            completed=True,
+            metadata__tasks_ids=["task-1", "task-2"],
+            metadata__trigger_event=PostSubmissionEvents.on_completion,
+        )
+        token = submission_status_token_generator.make_token(self.submission)
+        self.check_status_url = reverse(
+            "api:submission-status",
+            kwargs={"uuid": self.submission.uuid, "token": token},
+        )
+
+    def test_tracked_states_skip_result_backend(self):
+        track_task_states(self.submission.pk, ["task-1", "task-2"])
+        update_task_state(self.submission.pk, "task-1", states.SUCCESS)
+
+        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
+            response = self.client.get(self.check_status_url)
+
+            self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
+
+            update_task_state(self.submission.pk, "task-2", states.SUCCESS)
+            response = self.client.get(self.check_status_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(response_data["status"], ProcessingStatuses.done)
+        self.assertEqual(response_data["result"], ProcessingResults.success)
+        mock_AsyncResult.assert_not_called()
+
+    def test_untracked_tasks_are_ignored(self):
+        track_task_states(self.submission.pk, ["task-1", "task-2"])
+
+        update_task_state(self.submission.pk, "task-from-retry", states.FAILURE)
+
+        self.assertEqual(
+            get_tracked_task_states(self.submission.pk),
+            [states.PENDING, states.PENDING],
+        )
+
+    @override_settings(SUBMISSION_STATUS_LONG_POLL_TIMEOUT=10)
+    def test_long_poll_waits_for_completion(self):
+        track_task_states(self.submission.pk, ["task-1", "task-2"])
+        update_task_state(self.submission.pk, "task-1", states.SUCCESS)
+
+        def finish_processing(seconds):
+            update_task_state(self.submission.pk, "task-2", states.FAILURE)
+
+        with patch(
+            "openforms.submissions.status.time.sleep", side_effect=finish_processing
+        ) as mock_sleep:
+            response = self.client.get(self.check_status_url, {"wait": 5})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(response_data["status"], ProcessingStatuses.done)
+        self.assertEqual(response_data["result"], ProcessingResults.failed)
+        mock_sleep.assert_called_once()
+
+    @override_settings(SUBMISSION_STATUS_LONG_POLL_TIMEOUT=10)
+    def test_long_poll_times_out(self):
+        track_task_states(self.submission.pk, ["task-1", "task-2"])
+
+        with (
+            freeze_time() as frozen_time,
+            patch(
+                "openforms.submissions.status.time.sleep",
+                side_effect=lambda seconds: frozen_time.tick(seconds),
+            ) as mock_sleep,
+        ):
+            response = self.client.get(self.check_status_url, {"wait": 5})
+
+        self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
+        self.assertEqual(mock_sleep.call_count, 10)
+
+    def test_long_poll_disabled(self):
+        track_task_states(self.submission.pk, ["task-1", "task-2"])
+
+        with patch("openforms.submissions.status.time.sleep") as mock_sleep:
+            response = self.client.get(self.check_status_url, {"wait": 5})
+
+        self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
+        mock_sleep.assert_not_called()
+
+    def test_invalid_wait_parameter(self):
+        response = self.client.get(self.check_status_url, {"wait": "-1"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 @patch("openforms.submissions.status.AsyncResult.forget", return_value=None)
 class CleanupTaskTests(TestCase):
     def test_incomplete_submission(self, mock_forget):
@@ -0,0 +1,77 @@
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from openforms.forms.tests.factories import FormLogicFactory
+from openforms.utils.tests.cache import clear_caches
+from openforms.utils.tests.test_json_patch import apply_patch
+
+from .factories import SubmissionFactory
+from .mixins import SubmissionsMixin
+
+
+class SubmissionStepConfigurationOverlayTests(SubmissionsMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.submission = SubmissionFactory.from_components(
+            components_list=[
+                {"type": "textfield", "key": "input1", "label": "Input 1"},
+                {"type": "textfield", "key": "input2", "label": "Input 2"},
+            ],
+        )
+        self.form_step = self.submission.form.formstep_set.get()
+        FormLogicFactory.create(
+            form=self.submission.form,
+            json_logic_trigger=True,
+            actions=[
+                {
+                    "component": "input2",
+                    "action": {
+                        "type": "property",
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        self._add_submission_to_session(self.submission)
+        self.url = reverse(
+            "api:submission-steps-detail",
+            kwargs={
+                "submission_uuid": self.submission.uuid,
+                "step_uuid": self.form_step.uuid,
+            },
+        )
+
+    def test_configuration_without_overlay_mode(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        form_step = response.json()["formStep"]
+        self.assertIn("configuration", form_step)
+        self.assertNotIn("configurationUrl", form_step)
+        self.assertNotIn("configurationOverlay", form_step)
+
+    def test_overlay_applied_to_static_configuration(self):
+        expected_configuration = self.client.get(self.url).json()["formStep"][
+            "configuration"
+        ]
+
+        response = self.client.get(self.url, {"configuration": "overlay"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        form_step = response.json()["formStep"]
+        self.assertNotIn("configuration", form_step)
+        self.assertNotEqual(form_step["configurationOverlay"], [])
+
+        static_response = self.client.get(form_step["configurationUrl"])
+
+        self.assertEqual(static_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            apply_patch(static_response.json(), form_step["configurationOverlay"]),
+            expected_configuration,
+        )
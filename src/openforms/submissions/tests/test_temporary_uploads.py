@@ -1,8 +1,10 @@
 import os
 import uuid
 from datetime import timedelta
+from unittest.mock import patch
 
-from django.test import RequestFactory, tag
+from django.core.files.base import ContentFile
+from django.test import RequestFactory, TestCase, override_settings, tag
 
 from freezegun import freeze_time
 from maykin_2fa.test import disable_admin_mfa
@@ -13,6 +15,7 @@ from rest_framework.test import APITestCase
 
 from openforms.accounts.tests.factories import SuperUserFactory
 from openforms.submissions.attachments import (
+    cleanup_orphaned_temporary_upload_files,
     cleanup_unclaimed_temporary_uploaded_files,
     temporary_upload_from_url,
     temporary_upload_uuid_from_url,
@@ -25,6 +28,8 @@ from openforms.submissions.tests.factories import (
 )
 from openforms.submissions.tests.mixins import SubmissionsMixin
 from openforms.submissions.utils import append_to_session_list, remove_from_session_list
+from openforms.utils.files import delete_storage_files
+from openforms.utils.tests.cache import clear_caches
 
 
 @temp_private_root()
@@ -250,3 +255,123 @@ class TemporaryFileUploadTest(SubmissionsMixin, APITestCase):
 
         # ignore values never added
         remove_from_session_list(session, "my_key", 3)
+
+
+@temp_private_root()
+@override_settings(TEMPORARY_UPLOADS_CLEANUP_BATCH_SIZE=2)
+class TemporaryUploadsCleanupTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    def test_unclaimed_uploads_deleted_in_chunks(self):
+        with freeze_time("2020-06-01 10:00"):
+            TemporaryFileUploadFactory.create_batch(5)
+
+        with freeze_time("2020-06-04 10:00"):
+            done = cleanup_unclaimed_temporary_uploaded_files(timedelta(days=1))
+
+        self.assertTrue(done)
+        self.assertFalse(TemporaryFileUpload.objects.exists())
+
+    def test_unclaimed_upload_files_deleted_in_bulk_after_commit(self):
+        with freeze_time("2020-06-01 10:00"):
+            uploads = TemporaryFileUploadFactory.create_batch(3)
+        storage = uploads[0].content.storage
+        names = [upload.content.name for upload in uploads]
+
+        with (
+            freeze_time("2020-06-04 10:00"),
+            patch(
+                "openforms.submissions.attachments.delete_storage_files",
+                wraps=delete_storage_files,
+            ) as mock_delete_storage_files,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            cleanup_unclaimed_temporary_uploaded_files(timedelta(days=1))
+
+            mock_delete_storage_files.assert_not_called()
+
+        # one call per chunk
+        self.assertEqual(mock_delete_storage_files.call_count, 2)
+        for name in names:
+            with self.subTest(name=name):
+                self.assertFalse(storage.exists(name))
+
+    def test_unclaimed_uploads_cleanup_stops_after_deadline(self):
+        with freeze_time("2020-06-01 10:00"):
+            TemporaryFileUploadFactory.create_batch(5)
+
+        with freeze_time("2020-06-04 10:00"):
+            done = cleanup_unclaimed_temporary_uploaded_files(
+                timedelta(days=1), deadline=0
+            )
+
+        self.assertFalse(done)
+        self.assertEqual(TemporaryFileUpload.objects.count(), 3)
+
+    def test_orphaned_files_deleted(self):
+        with freeze_time("2020-06-01 10:00"):
+            upload = TemporaryFileUploadFactory.create()
+        storage = upload.content.storage
+        orphan = storage.save(
+            "temporary-uploads/2020/06/01/orphan.dat", ContentFile(b"orphan")
+        )
+        recent_orphan = storage.save(
+            "temporary-uploads/2020/06/04/orphan.dat", ContentFile(b"orphan")
+        )
+
+        with freeze_time("2020-06-04 10:00"):
+            done = cleanup_orphaned_temporary_upload_files(timedelta(days=1))
+
+        self.assertTrue(done)
+        self.assertTrue(storage.exists(upload.content.name))
+        self.assertFalse(storage.exists(orphan))
+        # too recent, the record may not have been committed yet
+        self.assertTrue(storage.exists(recent_orphan))
+
+    def test_emptied_day_directories_removed(self):
+        with freeze_time("2020-06-01 10:00"):
+            upload = TemporaryFileUploadFactory.create()
+        storage = upload.content.storage
+        storage.save("temporary-uploads/2020/06/01/orphan.dat", ContentFile(b"orphan"))
+        storage.save("temporary-uploads/2020/06/02/orphan.dat", ContentFile(b"orphan"))
+
+        with freeze_time("2020-06-04 10:00"):
+            cleanup_orphaned_temporary_upload_files(timedelta(days=1))
+
+        self.assertEqual(storage.listdir("temporary-uploads/2020/06")[0], ["01"])
+
+    def test_orphaned_files_cleanup_resumes(self):
+        storage = TemporaryFileUpload._meta.get_field("content").storage
+        orphan_1 = storage.save(
+            "temporary-uploads/2020/06/01/orphan.dat", ContentFile(b"orphan")
+        )
+        orphan_2 = storage.save(
+            "temporary-uploads/2020/06/02/orphan.dat", ContentFile(b"orphan")
+        )
+
+        with freeze_time("2020-06-04 10:00"):
+            first_run = cleanup_orphaned_temporary_upload_files(
+                timedelta(days=1), deadline=0
+            )
+
+            self.assertFalse(first_run)
+            self.assertFalse(storage.exists(orphan_1))
+            self.assertTrue(storage.exists(orphan_2))
+
+            # a new orphan in an already processed directory is left for the next walk
+            orphan_3 = storage.save(
+                "temporary-uploads/2020/06/01/orphan-3.dat", ContentFile(b"orphan")
+            )
+            second_run = cleanup_orphaned_temporary_upload_files(timedelta(days=1))
+
+            self.assertTrue(second_run)
+            self.assertFalse(storage.exists(orphan_2))
+            self.assertTrue(storage.exists(orphan_3))
+
+            cleanup_orphaned_temporary_upload_files(timedelta(days=1))
+
+            self.assertFalse(storage.exists(orphan_3))
@@ -1,8 +1,10 @@
 from datetime import date, datetime, time
+from unittest.mock import patch
 
 from django.db import IntegrityError
 from django.test import TestCase
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
 from openforms.variables.constants import FormVariableDataTypes
@@ -278,3 +280,103 @@ class SubmissionValueVariableModelTests(TestCase):
         stored = SubmissionValueVariable.objects.get(key=variable1.key)
 
         self.assertEqual(stored.value, 1337)
+
+    def test_value_dirty_tracking(self):
+        SubmissionValueVariableFactory.create(key="var1", value=1)
+        variable = SubmissionValueVariable.objects.get(key="var1")
+
+        with self.subTest("loaded from the database"):
+            self.assertFalse(variable.is_value_dirty)
+
+        with self.subTest("JSON representation differs"):
+            variable.value = True
+
+            self.assertTrue(variable.is_value_dirty)
+
+        with self.subTest("same value again"):
+            variable.value = 1
+
+            self.assertFalse(variable.is_value_dirty)
+
+        with self.subTest("after saving"):
+            variable.value = {"b": 2, "a": 1}
+            variable.save()
+
+            self.assertFalse(variable.is_value_dirty)
+            variable.value = {"a": 1, "b": 2}
+            self.assertFalse(variable.is_value_dirty)
+
+    def test_saving_other_fields_keeps_value_dirty(self):
+        SubmissionValueVariableFactory.create(key="var1", value=1)
+        variable = SubmissionValueVariable.objects.get(key="var1")
+        variable.value = 2
+
+        variable.save(update_fields=["modified_at"])
+
+        self.assertTrue(variable.is_value_dirty)
+
+        variable.save(update_fields=["value"])
+
+        self.assertFalse(variable.is_value_dirty)
+
+    def test_unsaved_value_is_dirty(self):
+        variable = SubmissionValueVariable(key="var1", value="foo")
+
+        self.assertTrue(variable.is_value_dirty)
+
+    def test_to_python_keeps_the_parsed_value_until_the_value_changes(self):
+        variable = SubmissionValueVariableFactory.create(
+            form_variable__user_defined=True,
+            form_variable__data_type=FormVariableDataTypes.date,
+            value="2022-09-13",
+        )
+
+        with patch(
+            "openforms.submissions.models.submission_value_variable.parse_date",
+            wraps=parse_date,
+        ) as mock_parse_date:
+            first = variable.to_python()
+            second = variable.to_python()
+
+            self.assertEqual(first, date(2022, 9, 13))
+            self.assertIs(second, first)
+            mock_parse_date.assert_called_once()
+
+            variable.value = "2022-09-14"
+
+            self.assertEqual(variable.to_python(), date(2022, 9, 14))
+            self.assertEqual(mock_parse_date.call_count, 2)
+
+
+class SubmissionValueVariablesStateTests(TestCase):
+    def test_saved_variables_do_not_create_unsaved_instances(self):
+        submission = SubmissionFactory.from_components(
+            [
+                {"type": "textfield", "key": "saved"},
+                {"type": "textfield", "key": "unsaved"},
+            ],
+            submitted_data={"saved": "foo"},
+        )
+        SubmissionValueVariable.objects.filter(key="unsaved").delete()
+        state = submission.load_submission_value_variables_state()
+
+        self.assertEqual(list(state.saved_variables), ["saved"])
+        self.assertEqual(state.get_data(), {"saved": "foo"})
+        self.assertIsNone(state._variables)
+
+        with self.subTest("variables include the unsaved variables"):
+            self.assertEqual(set(state.variables), {"saved", "unsaved"})
+            self.assertIsNone(state.variables["unsaved"].pk)
+            self.assertIs(state.variables["saved"], state.saved_variables["saved"])
+
+    def test_removed_variables(self):
+        submission = SubmissionFactory.from_components(
+            [{"type": "textfield", "key": "saved"}],
+            submitted_data={"saved": "foo"},
+        )
+        state = submission.load_submission_value_variables_state()
+        self.assertIn("saved", state.saved_variables)
+
+        state.remove_variables(keys=["saved"])
+
+        self.assertEqual(state.saved_variables, {})
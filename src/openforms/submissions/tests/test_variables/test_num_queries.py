@@ -60,10 +60,10 @@ class SubmissionVariablesPerformanceTests(APITestCase):
         submission.load_execution_state()
         del submission._variables_state  # force re-fetching this to count queries
 
-        # 1. Loading the variables state - fetch all the form variables
-        # 2. Loading the variables state - fetch all the submission variables
-        # 3. Retrieve all logic rules related to a form
-        with self.assertNumQueries(3):
+        # The form variables were cached by ``submission.data``
+        # 1. Loading the variables state - fetch all the submission variables
+        # 2. Retrieve all logic rules related to a form
+        with self.assertNumQueries(2):
             evaluate_form_logic(submission, submission_step2, data)
 
     def test_evaluate_form_logic_with_rules(self):
@@ -119,14 +119,14 @@ class SubmissionVariablesPerformanceTests(APITestCase):
         submission.load_execution_state()
         del submission._variables_state  # force re-fetching this to count queries
 
-        # 1.  Loading the variables state - fetch all the form variables
-        # 2.  Loading the variables state - fetch all the submission variables
-        # 3.  Retrieve all logic rules related to a form
-        # 4.  Retrieve the submission variables to be deleted - deletion of data happens
+        # The form variables were cached by ``submission.data``
+        # 1.  Loading the variables state - fetch all the submission variables
+        # 2.  Retrieve all logic rules related to a form
+        # 3.  Retrieve the submission variables to be deleted - deletion of data happens
         #     because the step is marked N/A
-        # 5.  Retrieve the submission attachment files to be deleted
-        # 6.  Delete submission values
-        with self.assertNumQueries(6):
+        # 4.  Retrieve the submission attachment files to be deleted
+        # 5.  Delete submission values
+        with self.assertNumQueries(5):
             evaluate_form_logic(submission, submission_step2, data)
 
     def test_update_step_data(self):
@@ -166,6 +166,55 @@ class SubmissionVariablesPerformanceTests(APITestCase):
                 "var4": "test4",
             }
 
+    def test_update_step_data_only_writes_changed_values(self):
+        form = FormFactory.create()
+        form_step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"key": "var1", "type": "textfield"},
+                    {"key": "var2", "type": "textfield"},
+                    {"key": "var3", "type": "textfield"},
+                ]
+            },
+        )
+        submission = SubmissionFactory.create(form=form)
+        submission_step = SubmissionStepFactory.create(
+            submission=submission,
+            form_step=form_step,
+            data={"var1": "test1", "var2": "test2", "var3": "test3"},
+        )
+        submission.load_execution_state()
+
+        # 1. load_variables_state: retrieve form variables
+        # 2. load_variables_state: retrieve submission value variables
+        # (no writes, nothing changed)
+        with self.assertNumQueries(2):
+            submission_step.data = {"var1": "test1", "var2": "test2", "var3": "test3"}
+
+        # 1. bulk_update var2 submission value variable
+        with self.assertNumQueries(1):
+            submission_step.data = {
+                "var1": "test1",
+                "var2": "test2-modified",
+                "var3": "test3",
+            }
+
+        # the value is now stored, so setting it again is a no-op
+        with self.assertNumQueries(0):
+            submission_step.data = {
+                "var1": "test1",
+                "var2": "test2-modified",
+                "var3": "test3",
+            }
+
+        self.assertEqual(
+            SubmissionValueVariable.objects.get(
+                submission=submission, key="var2"
+            ).value,
+            "test2-modified",
+        )
+
     def test_get_step_data(self):
         form = FormFactory.create()
         form_step = FormStepFactory.create(
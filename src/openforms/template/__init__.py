@@ -6,27 +6,50 @@ The ``template`` package provides generic template rendering constructs. Feature
 * Option to sandbox templates to only allow safe-ish public API
 * Utilities to evaluate templates from string (user-contributed content and inherently
   unsafe).
+* Caching for string-based templates - the same (user-contributed) templates are
+  rendered over and over again, so the compiled templates are kept in a bounded LRU
+  cache per backend.
+"""
 
-Possible future features:
+from functools import lru_cache
 
-* Caching for string-based templates
-* ...
-"""
+from django.utils.safestring import mark_safe
 
 from .backends.sandboxed_django import backend as sandbox_backend, openforms_backend
 
 __all__ = ["render_from_string", "parse", "sandbox_backend", "openforms_backend"]
 
+# maximum number of compiled templates to keep around (across all backends)
+TEMPLATE_CACHE_SIZE = 2048
+
+# the markers of template variables, tags and comments - without any of them, rendering
+# a template results in the source itself
+TEMPLATE_MARKERS = ("{{", "{%", "{#")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _parse(source: str, backend):
+    return backend.from_string(source)
+
 
 def parse(source: str, backend=sandbox_backend):
     """
     Parse the template fragment using the specified backend.
 
+    The compiled templates are cached, so parsing the same source again is cheap.
+
     :returns: A template instance of the specified backend
     :raises: :class:`django.template.TemplateSyntaxError` if there are any
       syntax errors
     """
-    return backend.from_string(source)
+    return _parse(source, backend)
+
+
+def is_static(source: str) -> bool:
+    """
+    Check if the source contains any template syntax at all.
+    """
+    return not any(marker in source for marker in TEMPLATE_MARKERS)
 
 
 def render_from_string(
@@ -46,6 +69,9 @@ def render_from_string(
     :raises: :class:`django.template.TemplateSyntaxError` if the template source is
       invalid
     """
+    # text outside of template syntax is never escaped, so rendering would be a no-op
+    if is_static(source):
+        return mark_safe(source)
     if disable_autoescape:
         source = f"{{% autoescape off %}}{source}{{% endautoescape %}}"
     template = parse(source, backend=backend)
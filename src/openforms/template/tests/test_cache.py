@@ -0,0 +1,55 @@
+from django.template import TemplateSyntaxError
+from django.test import SimpleTestCase
+from django.utils.safestring import SafeString
+
+from .. import _parse, openforms_backend, parse, render_from_string, sandbox_backend
+
+
+class TemplateCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        _parse.cache_clear()
+        self.addCleanup(_parse.cache_clear)
+
+    def test_compiled_template_is_reused(self):
+        template_1 = parse("{{ foo }}")
+        template_2 = parse("{{ foo }}")
+
+        self.assertIs(template_1, template_2)
+        self.assertEqual(template_1.render({"foo": "bar"}), "bar")
+        self.assertEqual(template_2.render({"foo": "baz"}), "baz")
+
+    def test_cache_is_per_backend(self):
+        template_1 = parse("{{ foo }}", backend=sandbox_backend)
+        template_2 = parse("{{ foo }}", backend=openforms_backend)
+
+        self.assertIsNot(template_1, template_2)
+
+    def test_syntax_errors_are_not_cached(self):
+        for _ in range(2):
+            with self.subTest(), self.assertRaises(TemplateSyntaxError):
+                parse("{% invalid %}")
+
+    def test_static_source_is_not_parsed(self):
+        result = render_from_string("<p>No templating here</p>", {"foo": "bar"})
+
+        self.assertEqual(result, "<p>No templating here</p>")
+        self.assertIsInstance(result, SafeString)
+        self.assertEqual(_parse.cache_info().currsize, 0)
+
+    def test_comments_are_rendered(self):
+        result = render_from_string("foo{# a comment #}", {})
+
+        self.assertEqual(result, "foo")
+
+    def test_disable_autoescape(self):
+        for _ in range(2):
+            with self.subTest():
+                result = render_from_string(
+                    "{{ foo }}", {"foo": "<b>"}, disable_autoescape=True
+                )
+
+                self.assertEqual(result, "<b>")
+
+        self.assertEqual(render_from_string("{{ foo }}", {"foo": "<b>"}), "&lt;b&gt;")
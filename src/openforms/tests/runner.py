@@ -1,5 +1,5 @@
 """
-Test runner with reproducible randomness.
+Test runner with reproducible randomness and isolated caches.
 
 To reproduce tests, set the ``TEST_RANDOM_STATE`` envvar from CI output. To report the
 random state locally, set the ``TEST_REPORT_RANDOM_STATE`` envvar to ``true``:
@@ -10,16 +10,27 @@ random state locally, set the ``TEST_REPORT_RANDOM_STATE`` envvar to ``true``:
     src/manage.py test src
 
 See https://factoryboy.readthedocs.io/en/stable/recipes.html#using-reproducible-randomness
+
+The caches are enabled like they are in production, every test starts with empty
+caches so that the entries of one test can't leak into another.
 """
 
 import base64
 import os
 import pickle
+import unittest
 
-from django.test.runner import DiscoverRunner
+from django.test.runner import (
+    DiscoverRunner,
+    ParallelTestSuite,
+    RemoteTestResult,
+    RemoteTestRunner,
+)
 
 import factory.random
 
+from openforms.utils.tests.cache import clear_caches
+
 
 def _setup_random_state():
     state = os.environ.get("TEST_RANDOM_STATE")
@@ -43,8 +54,33 @@ def _setup_random_state():
         print("Current random state: %s" % encoded_state.decode("ascii"))
 
 
+class ClearCachesMixin:
+    def startTest(self, test):
+        clear_caches()
+        super().startTest(test)
+
+
+class ClearCachesRemoteTestResult(ClearCachesMixin, RemoteTestResult):
+    pass
+
+
+class ClearCachesRemoteTestRunner(RemoteTestRunner):
+    resultclass = ClearCachesRemoteTestResult
+
+
+class ClearCachesParallelTestSuite(ParallelTestSuite):
+    runner_class = ClearCachesRemoteTestRunner
+
+
 class RandomStateRunner(DiscoverRunner):
+    parallel_test_suite = ClearCachesParallelTestSuite
 
     def setup_test_environment(self, **kwargs):
         _setup_random_state()
         super().setup_test_environment(**kwargs)
+
+    def get_resultclass(self):
+        resultclass = super().get_resultclass() or unittest.TextTestResult
+        return type(
+            f"ClearCaches{resultclass.__name__}", (ClearCachesMixin, resultclass), {}
+        )
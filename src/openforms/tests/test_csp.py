@@ -7,6 +7,7 @@ from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APIRequestFactory, APITestCase
 
+from csp_post_processor.processor import sanitize_html
 from openforms.config.models import GlobalConfiguration
 from openforms.forms.tests.factories import FormFactory
 from openforms.submissions.tests.factories import SubmissionFactory
@@ -41,6 +42,10 @@ class CSPMixin:
         self.mock_get_html_id = patcher.start()
         self.addCleanup(patcher.stop)
 
+        # the sanitized markup contains the (mocked) generated IDs
+        sanitize_html.cache_clear()
+        self.addCleanup(sanitize_html.cache_clear)
+
 
 class FormInlineStyleCSPTests(CSPMixin, APITestCase):
     """
@@ -5,11 +5,16 @@ These utilities apply to file fields and subclasses thereof.
 """
 
 import logging
+from typing import Sequence
 
+from django.conf import settings
+from django.core.files.storage import Storage
 from django.db import models, transaction
 from django.db.models import Model
 from django.db.models.fields.files import FieldFile
 
+from zgw_consumers.concurrent import parallel
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,6 +63,32 @@ def _delete_obj_files(fields: list[str], obj: models.Model) -> None:
             filefield.delete(save=False)
 
 
+def delete_storage_files(storage: Storage, names: Sequence[str]) -> None:
+    """
+    Delete the files with the given names from the storage, concurrently.
+
+    Meant for bulk deletes outside of a request/response cycle, like the cleanup of
+    orphaned files. Deletes that fail are logged, like :class:`log_failed_deletes`
+    does.
+    """
+
+    def delete(name: str) -> None:
+        try:
+            storage.delete(name)
+        except Exception as exc:
+            logger.warning("File delete (path=%s) failed: %s", name, exc, exc_info=exc)
+
+    if len(names) <= 1:
+        for name in names:
+            delete(name)
+        return
+
+    max_workers = min(len(names), settings.FILE_DELETION_WORKERS)
+    with parallel(max_workers=max_workers) as executor:
+        # consume the results to surface unexpected errors
+        list(executor.map(delete, names))
+
+
 class DeleteFileFieldFilesMixin:
     """
     Model mixin ensuring file deletion on database record deletion.
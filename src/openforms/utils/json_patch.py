@@ -0,0 +1,58 @@
+"""
+Compute the difference between two JSON documents as a JSON patch (RFC 6902).
+
+Only the ``add``, ``remove`` and ``replace`` operations are generated. Objects are
+compared key by key and arrays of the same length item by item, so that a change deep
+down in a large document results in a small patch. Everything else is replaced.
+"""
+
+from typing import Any, Literal, TypedDict
+
+__all__ = ["PatchOperation", "make_patch"]
+
+
+class PatchOperation(TypedDict, total=False):
+    op: Literal["add", "remove", "replace"]
+    path: str
+    value: Any
+
+
+def _escape(token: str | int) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _diff(source: Any, target: Any, path: str, patch: list[PatchOperation]) -> None:
+    if type(source) is not type(target):
+        patch.append({"op": "replace", "path": path, "value": target})
+        return
+
+    if isinstance(source, dict):
+        for key in source:
+            if key not in target:
+                patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in target.items():
+            key_path = f"{path}/{_escape(key)}"
+            if key not in source:
+                patch.append({"op": "add", "path": key_path, "value": value})
+            else:
+                _diff(source[key], value, key_path, patch)
+        return
+
+    if isinstance(source, list) and len(source) == len(target):
+        for index, (source_item, target_item) in enumerate(zip(source, target)):
+            _diff(source_item, target_item, f"{path}/{index}", patch)
+        return
+
+    if source != target:
+        patch.append({"op": "replace", "path": path, "value": target})
+
+
+def make_patch(source: Any, target: Any) -> list[PatchOperation]:
+    """
+    Return the operations transforming the ``source`` document into ``target``.
+
+    Applying the operations in order to (a copy of) ``source`` results in ``target``.
+    """
+    patch: list[PatchOperation] = []
+    _diff(source, target, "", patch)
+    return patch
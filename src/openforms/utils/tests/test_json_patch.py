@@ -0,0 +1,89 @@
+from copy import deepcopy
+
+from django.test import SimpleTestCase
+
+from ..json_patch import PatchOperation, make_patch
+
+
+def apply_patch(document, patch: list[PatchOperation]):
+    # minimal implementation of the operations generated by make_patch, like clients do
+    document = deepcopy(document)
+    for operation in patch:
+        if not operation["path"]:
+            document = operation["value"]
+            continue
+        *parents, last = [
+            token.replace("~1", "/").replace("~0", "~")
+            for token in operation["path"].split("/")[1:]
+        ]
+        container = document
+        for token in parents:
+            container = container[int(token) if isinstance(container, list) else token]
+        if isinstance(container, list):
+            last = int(last)
+        if operation["op"] == "remove":
+            del container[last]
+        else:
+            container[last] = operation["value"]
+    return document
+
+
+class MakePatchTests(SimpleTestCase):
+    def test_identical_documents(self):
+        document = {"components": [{"key": "a", "hidden": False}]}
+
+        self.assertEqual(make_patch(document, deepcopy(document)), [])
+
+    def test_nested_property_changes(self):
+        source = {
+            "components": [
+                {"key": "a", "hidden": False, "label": "A"},
+                {"key": "b/c", "validate": {"required": True}},
+            ]
+        }
+        target = {
+            "components": [
+                {"key": "a", "hidden": True, "label": "A"},
+                {"key": "b/c", "validate": {}, "description": "added"},
+            ]
+        }
+
+        patch = make_patch(source, target)
+
+        self.assertEqual(
+            patch,
+            [
+                {"op": "replace", "path": "/components/0/hidden", "value": True},
+                {"op": "remove", "path": "/components/1/validate/required"},
+                {"op": "add", "path": "/components/1/description", "value": "added"},
+            ],
+        )
+        self.assertEqual(apply_patch(source, patch), target)
+
+    def test_arrays_of_different_length_are_replaced(self):
+        source = {"values": [{"value": "a"}], "key": "radio"}
+        target = {"values": [{"value": "a"}, {"value": "b"}], "key": "radio"}
+
+        patch = make_patch(source, target)
+
+        self.assertEqual(
+            patch, [{"op": "replace", "path": "/values", "value": target["values"]}]
+        )
+        self.assertEqual(apply_patch(source, patch), target)
+
+    def test_keys_are_escaped(self):
+        source = {"a/b": 1, "c~d": 1}
+        target = {"a/b": 2, "c~d": 2}
+
+        patch = make_patch(source, target)
+
+        self.assertEqual(patch[0]["path"], "/a~1b")
+        self.assertEqual(patch[1]["path"], "/c~0d")
+        self.assertEqual(apply_patch(source, patch), target)
+
+    def test_type_changes_are_replaced(self):
+        patch = make_patch({"value": [1]}, {"value": {"0": 1}})
+
+        self.assertEqual(
+            patch, [{"op": "replace", "path": "/value", "value": {"0": 1}}]
+        )